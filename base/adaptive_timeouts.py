@@ -0,0 +1,87 @@
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from config.config import config
+from reports.results_db import ResultsDB, current_environment
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+MIN_SAMPLES = 5  # below this a locator keeps the caller's cap
+MIN_TIMEOUT = 1.0
+
+
+class AdaptiveTimeouts:
+	"""Per page-and-locator wait timeouts learned from how long each element took to appear
+
+	Latencies of successful waits are buffered in memory and written to the results
+	store at the end of the session; the next session derives each timeout from a high
+	percentile of them plus a margin, never above the caller's cap. Samples are kept per
+	environment (see current_environment), so latencies learned against the local stand-in
+	server never cap waits against the real application. Waits that time out are tallied
+	as time spent on absent elements.
+	"""
+
+	def __init__(self, enabled: bool = None, pct: float = None, margin: float = None):
+		self.enabled = config.ADAPTIVE_TIMEOUTS if enabled is None else enabled
+		self.pct = config.ADAPTIVE_TIMEOUT_PERCENTILE if pct is None else pct
+		self.margin = config.ADAPTIVE_TIMEOUT_MARGIN if margin is None else margin
+		self._learned: Optional[Dict[tuple, Dict[str, float]]] = None
+		self._samples: List[tuple] = []
+		self._absent: List[Tuple[str, float]] = []
+		self._lock = threading.Lock()
+
+	def _load(self) -> Dict[tuple, Dict[str, float]]:
+		if self._learned is None:
+			learned = {}
+			if config.RESULTS_DB and os.path.exists(config.RESULTS_DB):
+				db = ResultsDB()
+				try:
+					learned = db.locator_latency_percentiles(self.pct)
+				finally:
+					db.close()
+			self._learned = learned
+		return self._learned
+
+	def timeout_for(self, page: str, locator: tuple, condition: str, cap: float) -> float:
+		"""Learned timeout for this wait, or cap while there are too few samples"""
+		if not self.enabled:
+			return cap
+		learned = self._load().get((current_environment(), page, self._key(locator), condition))
+		if not learned or learned['samples'] < MIN_SAMPLES:
+			return cap
+		return min(cap, max(MIN_TIMEOUT, learned['seconds'] + self.margin))
+
+	def observe(self, page: str, locator: tuple, condition: str, seconds: float):
+		with self._lock:
+			self._samples.append((current_environment(), page, self._key(locator), condition, seconds))
+
+	def observe_absent(self, page: str, locator: tuple, seconds: float):
+		with self._lock:
+			self._absent.append((f"{page}:{self._key(locator)}", seconds))
+
+	def take_absent(self) -> List[Tuple[str, float]]:
+		"""Absent-element waits since the last call, e.g. those of the test that just finished"""
+		with self._lock:
+			absent, self._absent = self._absent, []
+		return absent
+
+	def flush(self):
+		"""Persist buffered latencies for future sessions"""
+		with self._lock:
+			samples, self._samples = self._samples, []
+		if samples and self.enabled and config.RESULTS_DB:
+			db = ResultsDB()
+			try:
+				db.record_locator_latencies(samples)
+			finally:
+				db.close()
+			logger.info(f"Recorded {len(samples)} locator latencies")
+
+	@staticmethod
+	def _key(locator: tuple) -> str:
+		return f"{locator[0]}={locator[1]}"
+
+
+adaptive_timeouts = AdaptiveTimeouts()
@@ -0,0 +1,163 @@
+import time
+
+from selenium.common.exceptions import JavascriptException, WebDriverException
+
+from base.dom_wait import ensure_script_timeout
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Counts in-flight fetch/XHR requests and short one-off timers in window.__appIdle
+# and notes when that count last changed. Injected on every new document over CDP
+# where available, otherwise on first use. Left alone, because they never settle on a
+# page with a spinner or poller: animation frames, timers longer than a second (session
+# timeouts, pollers) and timers a callback schedules for itself again (re-arming loops).
+APP_IDLE_TRACKER_JS = """
+(function () {
+	if (window.__appIdle) {
+		return;
+	}
+	var state = window.__appIdle = {pending: 0, last: Date.now()};
+	function begin() {
+		state.pending++;
+		state.last = Date.now();
+	}
+	function end() {
+		state.pending = Math.max(0, state.pending - 1);
+		state.last = Date.now();
+	}
+
+	var fetch = window.fetch;
+	if (fetch) {
+		window.fetch = function () {
+			begin();
+			return fetch.apply(this, arguments).then(
+				function (response) { end(); return response; },
+				function (error) { end(); throw error; }
+			);
+		};
+	}
+
+	var send = XMLHttpRequest.prototype.send;
+	XMLHttpRequest.prototype.send = function () {
+		var finished = false;
+		function finish() {
+			if (!finished) {
+				finished = true;
+				end();
+			}
+		}
+		begin();
+		this.addEventListener('loadend', finish);
+		try {
+			return send.apply(this, arguments);
+		} catch (error) {
+			finish();
+			throw error;
+		}
+	};
+
+	var schedule = window.setTimeout, cancel = window.clearTimeout, timers = {}, running = null;
+	window.setTimeout = function (callback, delay) {
+		if (typeof callback !== 'function' || (delay || 0) > 1000 || callback === running) {
+			return schedule.apply(window, arguments);
+		}
+		var args = Array.prototype.slice.call(arguments), id;
+		args[0] = function () {
+			if (timers[id]) {
+				delete timers[id];
+				end();
+			}
+			running = callback;
+			try {
+				return callback.apply(this, arguments);
+			} finally {
+				running = null;
+			}
+		};
+		begin();
+		id = schedule.apply(window, args);
+		timers[id] = true;
+		return id;
+	};
+	window.clearTimeout = function (id) {
+		if (timers[id]) {
+			delete timers[id];
+			end();
+		}
+		return cancel.apply(window, arguments);
+	};
+})();
+"""
+
+# Resolves once the document is complete and nothing tracked has been pending for
+# quietMs, or with the last state seen when timeoutMs runs out
+_WAIT_FOR_IDLE_JS = APP_IDLE_TRACKER_JS + """
+var quietMs = arguments[0], timeoutMs = arguments[1];
+var done = arguments[arguments.length - 1];
+var state = window.__appIdle, started = Date.now();
+
+function status(idle) {
+	return {idle: idle, ready: document.readyState === 'complete', pending: state.pending, quiet: Date.now() - state.last};
+}
+var poll = setInterval(function () {
+	var current = status(false);
+	if (current.ready && current.pending === 0 && current.quiet >= quietMs) {
+		clearInterval(poll);
+		done(status(true));
+	} else if (Date.now() - started >= timeoutMs) {
+		clearInterval(poll);
+		done(current);
+	}
+}, 50);
+"""
+
+# Scrolls an element into view and resolves once the scroll position has stopped
+# changing, so smooth scrolling and lazy layout shifts are over
+SCROLL_INTO_VIEW_JS = """
+var el = arguments[0], done = arguments[arguments.length - 1];
+var last = null, stable = 0, started = Date.now();
+el.scrollIntoView(true);
+var poll = setInterval(function () {
+	var position = window.scrollX + ',' + window.scrollY + ',' + el.getBoundingClientRect().top;
+	stable = position === last ? stable + 1 : 0;
+	last = position;
+	if (stable >= 2 || Date.now() - started > 2000) {
+		clearInterval(poll);
+		done();
+	}
+}, 16);
+"""
+
+
+def install_idle_tracker(driver):
+	"""Have Chromium run the tracker before any page script, so it sees requests from the very start"""
+	if not hasattr(driver, "execute_cdp_cmd"):
+		return
+	try:
+		driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": APP_IDLE_TRACKER_JS})
+	except WebDriverException as e:
+		logger.debug(f"Idle tracker not pre-installed, falling back to on-demand injection: {str(e)}")
+
+
+class AppIdleWait:
+	"""In-page wait for the application to stop loading and requesting"""
+
+	def __init__(self, driver, timeout: float):
+		self.driver = driver
+		self.timeout = timeout
+
+	def until_idle(self, quiet_ms: int) -> dict:
+		"""Return the final tracker state; its 'idle' key says whether the page settled in time"""
+		deadline = time.monotonic() + self.timeout
+		ensure_script_timeout(self.driver, self.timeout)
+
+		while True:
+			remaining = deadline - time.monotonic()
+			try:
+				return self.driver.execute_async_script(_WAIT_FOR_IDLE_JS, quiet_ms, int(max(remaining, 0) * 1000))
+			except JavascriptException:
+				# The document was replaced mid-wait (navigation); wait on the new one
+				if remaining <= 0:
+					raise
+				time.sleep(0.05)
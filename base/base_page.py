@@ -5,19 +5,36 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import Select
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import time
-import os
-from datetime import datetime
+from contextlib import contextmanager
+from base.adaptive_timeouts import adaptive_timeouts
+from base.app_idle import AppIdleWait, SCROLL_INTO_VIEW_JS
+from base.dom_actions import FILL_FORM_JS
+from base.dom_snapshot import DOMSnapshot
+from base.dom_wait import ObserverWait, PRESENCE, VISIBLE, CLICKABLE, ensure_script_timeout
 from config.config import config
+from utils.circuit_breaker import circuit_breaker
+from utils.command_profiler import profile_phase, WAIT
+from utils.screenshot_service import screenshot_service
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+_EXPECTED_CONDITIONS = {
+	PRESENCE: EC.presence_of_element_located,
+	VISIBLE: EC.visibility_of_element_located,
+	CLICKABLE: EC.element_to_be_clickable,
+}
+
 
 class BasePage:
 	"""Base page class with common page operations"""
 
+	CHECK_TIMEOUT = 5  # cap for is_element_present / is_element_visible
+
 	def __init__(self, driver):
 		self.driver = driver
+		# HttpDriver: plain HTTP requests and a parsed document instead of a browser
+		self.http_only = getattr(driver, "http_only", False)
 		self.wait = WebDriverWait(driver, config.EXPLICIT_WAIT)
 		self.actions = ActionChains(driver)
 
@@ -27,12 +44,63 @@ class BasePage:
 		logger.info(f"Opening URL: {url}")
 		self.driver.get(url)
 
-	def find_element(self, locator: tuple, timeout: int = None):
+	def _wait_until(self, locator: tuple, condition: str, timeout: float, strategy: str = None):
+		"""Wait for condition using the 'webdriver' (polling) or 'observer' (in-page) strategy"""
+		if self.http_only:
+			return self._check_now(locator, condition)
+		strategy = strategy or config.WAIT_STRATEGY
+		if strategy not in ("observer", "webdriver"):
+			raise ValueError(f"Unsupported wait strategy: {strategy}")
+		page = type(self).__name__
+		started = time.perf_counter()
+		try:
+			with profile_phase(self.driver, WAIT):
+				if strategy == "observer":
+					element = ObserverWait(self.driver, timeout).until(locator, condition)
+				else:
+					element = WebDriverWait(self.driver, timeout).until(_EXPECTED_CONDITIONS[condition](locator))
+		except TimeoutException:
+			adaptive_timeouts.observe_absent(page, locator, time.perf_counter() - started)
+			raise
+		adaptive_timeouts.observe(page, locator, condition, time.perf_counter() - started)
+		return element
+
+	def _check_now(self, locator: tuple, condition: str):
+		"""The HTTP backend's wait: a fetched document never changes on its own, so one check decides"""
+		try:
+			element = _EXPECTED_CONDITIONS[condition](locator)(self.driver)
+		except NoSuchElementException:
+			element = False
+		if not element:
+			raise TimeoutException(f"{locator} not {condition} on {self.driver.current_url}")
+		return element
+
+	def _timeout_for(self, locator: tuple, condition: str, cap: float) -> float:
+		"""Timeout learned for this page's locator, never above cap"""
+		return adaptive_timeouts.timeout_for(type(self).__name__, locator, condition, cap)
+
+	@staticmethod
+	def _target(locator: tuple) -> str:
+		return f"{locator[0]}={locator[1]}"
+
+	@contextmanager
+	def _circuit(self, target: str):
+		"""Fail fast if target keeps timing out on this page, and count this wait towards that"""
+		page = type(self).__name__
+		circuit_breaker.check(page, target)
+		try:
+			yield
+		except TimeoutException:
+			circuit_breaker.record_failure(page, target, f"timed out waiting for {target}")
+			raise
+		circuit_breaker.record_success(page, target)
+
+	def find_element(self, locator: tuple, timeout: int = None, strategy: str = None):
 		"""Find element with explicit wait"""
-		timeout = timeout or config.EXPLICIT_WAIT
+		timeout = timeout or self._timeout_for(locator, PRESENCE, config.EXPLICIT_WAIT)
 		try:
-			wait = WebDriverWait(self.driver, timeout)
-			element = wait.until(EC.presence_of_element_located(locator))
+			with self._circuit(self._target(locator)):
+				element = self._wait_until(locator, PRESENCE, timeout, strategy)
 			logger.debug(f"Found element: {locator}")
 			return element
 		except TimeoutException:
@@ -44,8 +112,14 @@ class BasePage:
 		"""Find multiple elements"""
 		timeout = timeout or config.EXPLICIT_WAIT
 		try:
-			wait = WebDriverWait(self.driver, timeout)
-			elements = wait.until(EC.presence_of_all_elements_located(locator))
+			if self.http_only:
+				elements = self.driver.find_elements(*locator)
+				if not elements:
+					raise TimeoutException()
+			else:
+				with profile_phase(self.driver, WAIT):
+					wait = WebDriverWait(self.driver, timeout)
+					elements = wait.until(EC.presence_of_all_elements_located(locator))
 			logger.debug(f"Found {len(elements)} elements: {locator}")
 			return elements
 		except TimeoutException:
@@ -76,6 +150,52 @@ class BasePage:
 			self.take_screenshot("send_keys_failed")
 			raise
 
+	def fill_form(self, fields: dict, submit: tuple = None, native: tuple = (), timeout: int = None):
+		"""Fill {locator: value} fields and click submit
+
+		With BATCHED_ACTIONS on, values go in through one script call and submit gets a DOM
+		click; locators listed in native still get real clear/send_keys key events. Otherwise
+		every field is typed into and the button clicked like send_keys and click would.
+		"""
+		timeout = timeout or config.EXPLICIT_WAIT
+		if not config.BATCHED_ACTIONS or self.http_only:
+			for locator, value in fields.items():
+				self.send_keys(locator, value, timeout=timeout)
+			if submit:
+				self.click(submit, timeout)
+			return
+
+		locators = list(fields)
+		payload = [
+			{'by': by, 'value': value, 'text': fields[(by, value)], 'native': (by, value) in native}
+			for by, value in locators
+		]
+		submit_payload = {'by': submit[0], 'value': submit[1]} if submit else None
+		page = type(self).__name__
+		targets = [self._target(locator) for locator in locators + ([submit] if submit else [])]
+		for target in targets:
+			circuit_breaker.check(page, target)
+
+		ensure_script_timeout(self.driver, timeout)
+		result = self.driver.execute_async_script(FILL_FORM_JS, payload, submit_payload, int(timeout * 1000))
+		if result['missing']:
+			missing = [submit if index == -1 else locators[index] for index in result['missing']]
+			for locator in missing:
+				circuit_breaker.record_failure(page, self._target(locator), f"form element {locator} not ready")
+			logger.error(f"Form elements not ready: {missing}")
+			self.take_screenshot("element_not_found")
+			raise TimeoutException(f"Form elements not ready after {timeout}s: {missing}")
+		for target in targets:
+			circuit_breaker.record_success(page, target)
+
+		native_locators = [locator for locator in locators if locator in native]
+		for locator, element in zip(native_locators, result['native']):
+			element.clear()
+			element.send_keys(fields[locator])
+		if submit and not result['clicked']:
+			result['button'].click()
+		logger.info(f"Filled {len(locators)} field(s){' and submitted' if submit else ''}: {locators}")
+
 	def get_text(self, locator: tuple, timeout: int = None) -> str:
 		"""Get text from element"""
 		element = self.find_element(locator, timeout)
@@ -90,30 +210,30 @@ class BasePage:
 		logger.debug(f"Got attribute '{attribute}' value '{value}' from element: {locator}")
 		return value
 
-	def is_element_present(self, locator: tuple, timeout: int = 5) -> bool:
+	def is_element_present(self, locator: tuple, timeout: int = None, strategy: str = None) -> bool:
 		"""Check if element is present"""
+		timeout = timeout or self._timeout_for(locator, PRESENCE, self.CHECK_TIMEOUT)
 		try:
-			wait = WebDriverWait(self.driver, timeout)
-			wait.until(EC.presence_of_element_located(locator))
+			self._wait_until(locator, PRESENCE, timeout, strategy)
 			return True
 		except TimeoutException:
 			return False
 
-	def is_element_visible(self, locator: tuple, timeout: int = 5) -> bool:
+	def is_element_visible(self, locator: tuple, timeout: int = None, strategy: str = None) -> bool:
 		"""Check if element is visible"""
+		timeout = timeout or self._timeout_for(locator, VISIBLE, self.CHECK_TIMEOUT)
 		try:
-			wait = WebDriverWait(self.driver, timeout)
-			wait.until(EC.visibility_of_element_located(locator))
+			self._wait_until(locator, VISIBLE, timeout, strategy)
 			return True
 		except TimeoutException:
 			return False
 
-	def wait_for_clickable(self, locator: tuple, timeout: int = None):
+	def wait_for_clickable(self, locator: tuple, timeout: int = None, strategy: str = None):
 		"""Wait for element to be clickable"""
-		timeout = timeout or config.EXPLICIT_WAIT
+		timeout = timeout or self._timeout_for(locator, CLICKABLE, config.EXPLICIT_WAIT)
 		try:
-			wait = WebDriverWait(self.driver, timeout)
-			return wait.until(EC.element_to_be_clickable(locator))
+			with self._circuit(self._target(locator)):
+				return self._wait_until(locator, CLICKABLE, timeout, strategy)
 		except TimeoutException:
 			logger.error(f"Element not clickable: {locator}")
 			self.take_screenshot("element_not_clickable")
@@ -142,36 +262,62 @@ class BasePage:
 	def scroll_to_element(self, locator: tuple, timeout: int = None):
 		"""Scroll to element"""
 		element = self.find_element(locator, timeout)
-		self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-		time.sleep(1)  # Wait for scroll to complete
+		# Returns once the scroll position stops moving instead of sleeping a fixed second
+		ensure_script_timeout(self.driver, 2)
+		self.driver.execute_async_script(SCROLL_INTO_VIEW_JS, element)
 		logger.info(f"Scrolled to element: {locator}")
 
 	def wait_for_page_load(self, timeout: int = None):
-		"""Wait for page to load completely"""
+		"""Wait for page to load completely, and with APP_IDLE_WAIT for its requests and timers to settle"""
 		timeout = timeout or config.PAGE_LOAD_TIMEOUT
-		wait = WebDriverWait(self.driver, timeout)
-		wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
+		if self.http_only:
+			return  # the response was complete when get() returned
+		with self._circuit("page_load"):
+			started = time.monotonic()
+			state = {'ready': False}
+			if config.APP_IDLE_WAIT:
+				# A short budget of its own: a page that never goes quiet must not cost the whole timeout
+				state = self.wait_for_app_idle(timeout=min(timeout, config.APP_IDLE_TIMEOUT))
+			if not state['ready']:
+				remaining = max(timeout - (time.monotonic() - started), 0.1)
+				with profile_phase(self.driver, WAIT):
+					wait = WebDriverWait(self.driver, remaining)
+					wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
 		logger.info("Page loaded completely")
 
+	def wait_for_app_idle(self, quiet_ms: int = None, timeout: int = None) -> dict:
+		"""Wait until no fetch/XHR or short one-off timer has been pending for quiet_ms"""
+		quiet_ms = config.APP_IDLE_QUIET_MS if quiet_ms is None else quiet_ms
+		timeout = timeout or config.PAGE_LOAD_TIMEOUT
+		with profile_phase(self.driver, WAIT):
+			state = AppIdleWait(self.driver, timeout).until_idle(quiet_ms)
+		if state['idle']:
+			logger.debug(f"Application idle for {state['quiet']}ms")
+		else:
+			# Pollers and endless animations never settle; carry on rather than fail the test
+			logger.warning(f"Application still busy after {timeout}s ({state['pending']} pending)")
+		return state
+
 	def take_screenshot(self, name: str = None) -> str:
 		"""Take screenshot and return file path"""
-		if not config.SCREENSHOT_ON_FAILURE and name != "manual":
+		if self.http_only or (not config.SCREENSHOT_ON_FAILURE and name != "manual"):
 			return ""
 
-		os.makedirs(config.SCREENSHOTS_DIR, exist_ok=True)
-		timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 		name = name or "screenshot"
-		filename = f"{name}_{timestamp}.png"
-		filepath = os.path.join(config.SCREENSHOTS_DIR, filename)
 
 		try:
-			self.driver.save_screenshot(filepath)
-			logger.info(f"Screenshot saved: {filepath}")
-			return filepath
+			# Encoding and disk I/O happen on the screenshot service's worker thread
+			return screenshot_service.capture(self.driver, name)
 		except Exception as e:
 			logger.error(f"Failed to take screenshot: {str(e)}")
 			return ""
 
+	def snapshot(self) -> DOMSnapshot:
+		"""Capture a point-in-time, read-only copy of the DOM for many reads in one round trip"""
+		snapshot = self.driver.document if self.http_only else DOMSnapshot.capture(self.driver)
+		logger.debug(f"Captured DOM snapshot of {snapshot.url}")
+		return snapshot
+
 	def get_current_url(self) -> str:
 		"""Get current URL"""
 		return self.driver.current_url
@@ -0,0 +1,95 @@
+from base.js_locators import FIND_ALL_JS
+
+# Waits until every field (and the submit control) is present, then fills the fields in
+# one go. Values go through the prototype's value setter and fire input/change events so
+# framework-controlled inputs (React, Vue) pick them up. Fields listed as native are only
+# resolved and returned, so the caller can type into them with real key events.
+FILL_FORM_JS = FIND_ALL_JS + """
+var fields = arguments[0], submit = arguments[1], timeoutMs = arguments[2];
+var done = arguments[arguments.length - 1];
+
+function resolve() {
+	var elements = [], missing = [];
+	fields.forEach(function (field, i) {
+		var el = findAll(field.by, field.value, document)[0];
+		if (!el) {
+			missing.push(i);
+		}
+		elements.push(el || null);
+	});
+	var button = null;
+	if (submit) {
+		button = findAll(submit.by, submit.value, document)[0] || null;
+		if (!button || !isVisible(button) || !isEnabled(button)) {
+			missing.push(-1);
+		}
+	}
+	return {elements: elements, button: button, missing: missing};
+}
+
+function setValue(el, value) {
+	el.focus();
+	if (el.type === 'checkbox' || el.type === 'radio') {
+		if (el.checked !== Boolean(value)) {
+			el.click();
+		}
+		return;
+	}
+	var descriptor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value');
+	if (descriptor && descriptor.set) {
+		descriptor.set.call(el, value);
+	} else {
+		el.value = value;
+	}
+	el.dispatchEvent(new Event('input', {bubbles: true}));
+	el.dispatchEvent(new Event('change', {bubbles: true}));
+	el.blur();
+}
+
+function perform(found) {
+	var native = [];
+	fields.forEach(function (field, i) {
+		if (field.native) {
+			native.push(found.elements[i]);
+		} else {
+			setValue(found.elements[i], field.text);
+		}
+	});
+	var clicked = false;
+	if (found.button && native.length === 0) {
+		found.button.click();
+		clicked = true;
+	}
+	done({missing: [], native: native, button: found.button, clicked: clicked});
+}
+
+var found = resolve();
+if (found.missing.length === 0) {
+	return perform(found);
+}
+
+var finished = false;
+var observer = new MutationObserver(recheck);
+var poll = setInterval(recheck, 100);
+var timer = setTimeout(function () {
+	finish();
+	done({missing: resolve().missing, native: [], button: null, clicked: false});
+}, timeoutMs);
+function finish() {
+	finished = true;
+	observer.disconnect();
+	clearInterval(poll);
+	clearTimeout(timer);
+}
+function recheck() {
+	if (finished) {
+		return;
+	}
+	var current = resolve();
+	if (current.missing.length === 0) {
+		finish();
+		perform(current);
+	}
+}
+observer.observe(document, {childList: true, subtree: true, attributes: true});
+"""
@@ -0,0 +1,674 @@
+import re
+import time
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Union
+
+from selenium.webdriver.common.by import By
+
+# Serialises the document as nested [tag, attributes, hidden, children] arrays in one
+# round trip. Live form state (value/checked) is folded into the attributes, matching
+# what WebElement.get_attribute reports.
+_SERIALIZE_DOM_JS = """
+function serialize(node) {
+	if (node.nodeType === 3) {
+		return node.nodeValue;
+	}
+	if (node.nodeType !== 1) {
+		return null;
+	}
+	var attrs = {};
+	for (var i = 0; i < node.attributes.length; i++) {
+		attrs[node.attributes[i].name] = node.attributes[i].value;
+	}
+	var tag = node.tagName.toLowerCase();
+	if (tag === 'input' || tag === 'select' || tag === 'textarea') {
+		attrs.value = node.value;
+		if (node.type === 'checkbox' || node.type === 'radio') {
+			attrs.checked = node.checked ? 'true' : null;
+		}
+	}
+	var hidden = node.getClientRects().length === 0 || window.getComputedStyle(node).visibility === 'hidden';
+	var children = [];
+	for (var child = node.firstChild; child; child = child.nextSibling) {
+		var serialized = serialize(child);
+		if (serialized !== null) {
+			children.push(serialized);
+		}
+	}
+	return [tag, attrs, hidden, children];
+}
+return [window.location.href, serialize(document.documentElement)];
+"""
+
+_NON_RENDERED_TAGS = {"script", "style", "template", "noscript", "head", "title", "meta", "link"}
+_VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "track", "wbr"}
+_HIDDEN_STYLE = re.compile(r"display\s*:\s*none|visibility\s*:\s*hidden")
+
+
+class SnapshotNode:
+	"""Element in a DOM snapshot"""
+
+	__slots__ = ("tag", "attrs", "hidden", "children", "parent", "index")
+
+	def __init__(self, tag: str, attrs: Dict[str, str], hidden: bool = False, parent: "SnapshotNode" = None):
+		self.tag = tag
+		self.attrs = attrs
+		self.hidden = hidden
+		self.children: List[Union["SnapshotNode", str]] = []
+		self.parent = parent
+		self.index = 0
+
+	@property
+	def elements(self) -> List["SnapshotNode"]:
+		return [child for child in self.children if isinstance(child, SnapshotNode)]
+
+	@property
+	def text(self) -> str:
+		"""Rendered text, approximating WebElement.text (hidden and non-rendered content excluded)"""
+		parts: List[str] = []
+		self._collect_text(parts, rendered_only=True)
+		return " ".join(" ".join(parts).split())
+
+	@property
+	def text_content(self) -> str:
+		"""All descendant text, like DOM textContent / XPath string value"""
+		parts: List[str] = []
+		self._collect_text(parts, rendered_only=False)
+		return "".join(parts)
+
+	@property
+	def own_texts(self) -> List[str]:
+		return [child for child in self.children if isinstance(child, str)]
+
+	def get_attribute(self, name: str) -> Optional[str]:
+		return self.attrs.get(name)
+
+	def is_displayed(self) -> bool:
+		return not self.hidden
+
+	def iter_descendants(self):
+		for child in self.children:
+			if isinstance(child, SnapshotNode):
+				yield child
+				yield from child.iter_descendants()
+
+	def _collect_text(self, parts: List[str], rendered_only: bool):
+		if rendered_only and self.tag in _NON_RENDERED_TAGS:
+			return
+		for child in self.children:
+			if isinstance(child, SnapshotNode):
+				child._collect_text(parts, rendered_only)
+			elif not (rendered_only and self.hidden):
+				parts.append(child)
+
+	def __repr__(self):
+		return f"<SnapshotNode {self.tag} {self.attrs}>"
+
+
+class DOMSnapshot:
+	"""Point-in-time, read-only copy of the page DOM queryable with (By, value) locators
+
+	Reads never touch the browser, so they cost nothing after the capture round trip,
+	but they also never see changes made to the page after ``taken_at``.
+	"""
+
+	def __init__(self, root: SnapshotNode, url: str = "", taken_at: float = None):
+		self.document = SnapshotNode("#document", {})
+		self.document.children.append(root)
+		root.parent = self.document
+		self.root = root
+		self.url = url
+		self.taken_at = taken_at or time.time()
+		self._nodes = list(self.document.iter_descendants())
+		for position, node in enumerate(self._nodes, 1):
+			node.index = position
+
+	@classmethod
+	def capture(cls, driver) -> "DOMSnapshot":
+		"""Serialise the driver's current DOM in a single WebDriver command"""
+		url, tree = driver.execute_script(_SERIALIZE_DOM_JS)
+		return cls(cls._build(tree), url)
+
+	@classmethod
+	def from_html(cls, html: str, url: str = "") -> "DOMSnapshot":
+		"""Parse a server response without a browser; visibility comes from markup and inline styles only"""
+		builder = _TreeBuilder()
+		builder.feed(html)
+		builder.close()
+		return cls(builder.root, url)
+
+	@classmethod
+	def _build(cls, data, parent: SnapshotNode = None) -> SnapshotNode:
+		tag, attrs, hidden, children = data
+		node = SnapshotNode(tag, {k: v for k, v in attrs.items() if v is not None}, hidden, parent)
+		for child in children:
+			node.children.append(child if isinstance(child, str) else cls._build(child, node))
+		return node
+
+	def find_all(self, locator: tuple) -> List[SnapshotNode]:
+		"""All elements matching locator, in document order"""
+		by, value = locator
+		if by == By.ID:
+			return [node for node in self._nodes if node.attrs.get("id") == value]
+		if by == By.NAME:
+			return [node for node in self._nodes if node.attrs.get("name") == value]
+		if by == By.CLASS_NAME:
+			return [node for node in self._nodes if value in node.attrs.get("class", "").split()]
+		if by == By.TAG_NAME:
+			return [node for node in self._nodes if node.tag == value.lower()]
+		if by == By.LINK_TEXT:
+			return [node for node in self._nodes if node.tag == "a" and node.text == value]
+		if by == By.PARTIAL_LINK_TEXT:
+			return [node for node in self._nodes if node.tag == "a" and value in node.text]
+		if by == By.CSS_SELECTOR:
+			return CssSelector(value).select(self._nodes)
+		if by == By.XPATH:
+			return XPathExpression(value).evaluate(self.document)
+		raise ValueError(f"Unsupported locator strategy: {by}")
+
+	def find(self, locator: tuple) -> Optional[SnapshotNode]:
+		"""First element matching locator, or None"""
+		matches = self.find_all(locator)
+		return matches[0] if matches else None
+
+	def is_present(self, locator: tuple) -> bool:
+		return self.find(locator) is not None
+
+	def is_visible(self, locator: tuple) -> bool:
+		node = self.find(locator)
+		return node is not None and node.is_displayed()
+
+	def get_text(self, locator: tuple, default: str = "") -> str:
+		node = self.find(locator)
+		return node.text if node is not None else default
+
+	def get_texts(self, locator: tuple) -> List[str]:
+		return [node.text for node in self.find_all(locator)]
+
+	def get_attribute(self, locator: tuple, attribute: str) -> Optional[str]:
+		node = self.find(locator)
+		return node.get_attribute(attribute) if node is not None else None
+
+	@property
+	def age(self) -> float:
+		"""Seconds since the snapshot was taken"""
+		return time.time() - self.taken_at
+
+
+class _TreeBuilder(HTMLParser):
+	"""Builds a SnapshotNode tree from markup, folding form state into attributes like _SERIALIZE_DOM_JS"""
+
+	def __init__(self):
+		super().__init__(convert_charrefs=True)
+		self.root = SnapshotNode("html", {})
+		self._open = [self.root]
+
+	def handle_starttag(self, tag, attrs):
+		attributes = {name: "" if value is None else value for name, value in attrs}
+		if tag == "html":
+			self.root.attrs.update(attributes)
+			return
+		parent = self._open[-1]
+		hidden = (
+			parent.hidden or tag in _NON_RENDERED_TAGS or "hidden" in attributes
+			or bool(_HIDDEN_STYLE.search(attributes.get("style", "")))
+			or (tag == "input" and attributes.get("type", "").lower() == "hidden")
+		)
+		if tag in ("input", "select", "textarea"):
+			checkable = attributes.get("type", "").lower() in ("checkbox", "radio")
+			attributes.setdefault("value", "on" if checkable else "")
+		if "checked" in attributes:
+			attributes["checked"] = "true"
+		node = SnapshotNode(tag, attributes, hidden, parent)
+		parent.children.append(node)
+		if tag not in _VOID_TAGS:
+			self._open.append(node)
+
+	def handle_startendtag(self, tag, attrs):
+		self.handle_starttag(tag, attrs)
+		if tag not in _VOID_TAGS and tag != "html":
+			self._close(tag)
+
+	def handle_endtag(self, tag):
+		self._close(tag)
+
+	def handle_data(self, data):
+		self._open[-1].children.append(data)
+
+	def _close(self, tag: str):
+		# Unclosed children (<p>, <li>, ...) end with their parent; stray end tags are ignored
+		for position in range(len(self._open) - 1, 0, -1):
+			if self._open[position].tag == tag:
+				node = self._open[position]
+				del self._open[position:]
+				self._finish(node)
+				return
+
+	@staticmethod
+	def _finish(node: SnapshotNode):
+		if node.tag == "textarea":
+			node.attrs["value"] = node.text_content
+		elif node.tag == "select":
+			options = [option for option in node.iter_descendants() if option.tag == "option"]
+			chosen = next((option for option in options if "selected" in option.attrs), options[0] if options else None)
+			if chosen is not None:
+				node.attrs["value"] = chosen.attrs.get("value", chosen.text)
+
+
+class CssSelector:
+	"""Subset of CSS selectors: type, #id, .class, attribute operators, combinators and a few pseudo-classes"""
+
+	_TOKEN = re.compile(
+		r"\s*(?P<combinator>[>+~])\s*|(?P<space>\s+)|(?P<tag>\*|[a-zA-Z][\w-]*)|#(?P<id>[\w-]+)|\.(?P<cls>[\w-]+)"
+		r"|\[\s*(?P<attr>[\w:-]+)\s*(?:(?P<op>[~|^$*]?=)\s*(?P<val>\"[^\"]*\"|'[^']*'|[^\]\s]+))?\s*\]"
+		r"|:(?P<pseudo>[\w-]+)(?:\((?P<arg>[^)]*)\))?"
+	)
+
+	def __init__(self, selector: str):
+		self.selector = selector
+		self.groups = [self._parse(part.strip()) for part in selector.split(",")]
+
+	def select(self, nodes: List[SnapshotNode]) -> List[SnapshotNode]:
+		return [node for node in nodes if any(self._matches(node, group) for group in self.groups)]
+
+	def _parse(self, selector: str):
+		"""Return [(combinator, compound), ...] from left to right"""
+		parts, compound, combinator, position = [], [], None, 0
+		while position < len(selector):
+			match = self._TOKEN.match(selector, position)
+			if not match or match.end() == position:
+				raise ValueError(f"Unsupported CSS selector: {self.selector}")
+			position = match.end()
+			if match.group("combinator") or match.group("space"):
+				if compound:
+					parts.append((combinator, compound))
+					compound = []
+				combinator = match.group("combinator") or " "
+				continue
+			compound.append(match)
+		if not compound:
+			raise ValueError(f"Unsupported CSS selector: {self.selector}")
+		parts.append((combinator, compound))
+		return parts
+
+	def _matches(self, node: SnapshotNode, parts, end: int = None) -> bool:
+		end = len(parts) - 1 if end is None else end
+		combinator, compound = parts[end]
+		if not self._matches_compound(node, compound):
+			return False
+		if end == 0:
+			return True
+		if combinator == ">":
+			parent = node.parent
+			return parent is not None and parent.tag != "#document" and self._matches(parent, parts, end - 1)
+		if combinator == " ":
+			ancestor = node.parent
+			while ancestor is not None and ancestor.tag != "#document":
+				if self._matches(ancestor, parts, end - 1):
+					return True
+				ancestor = ancestor.parent
+			return False
+		siblings = node.parent.elements if node.parent else []
+		preceding = siblings[:siblings.index(node)]
+		if combinator == "+":
+			return bool(preceding) and self._matches(preceding[-1], parts, end - 1)
+		return any(self._matches(sibling, parts, end - 1) for sibling in preceding)
+
+	def _matches_compound(self, node: SnapshotNode, compound) -> bool:
+		for token in compound:
+			if token.group("tag"):
+				if token.group("tag") != "*" and node.tag != token.group("tag").lower():
+					return False
+			elif token.group("id"):
+				if node.attrs.get("id") != token.group("id"):
+					return False
+			elif token.group("cls"):
+				if token.group("cls") not in node.attrs.get("class", "").split():
+					return False
+			elif token.group("attr"):
+				if not self._matches_attribute(node, token):
+					return False
+			elif not self._matches_pseudo(node, token.group("pseudo"), token.group("arg")):
+				return False
+		return True
+
+	@staticmethod
+	def _matches_attribute(node: SnapshotNode, token) -> bool:
+		actual = node.attrs.get(token.group("attr"))
+		if actual is None:
+			return False
+		op = token.group("op")
+		if not op:
+			return True
+		expected = token.group("val").strip("\"'")
+		return {
+			"=": lambda: actual == expected,
+			"~=": lambda: expected in actual.split(),
+			"|=": lambda: actual == expected or actual.startswith(expected + "-"),
+			"^=": lambda: bool(expected) and actual.startswith(expected),
+			"$=": lambda: bool(expected) and actual.endswith(expected),
+			"*=": lambda: bool(expected) and expected in actual,
+		}[op]()
+
+	def _matches_pseudo(self, node: SnapshotNode, pseudo: str, arg: str) -> bool:
+		siblings = node.parent.elements if node.parent else [node]
+		if pseudo == "first-child":
+			return siblings[0] is node
+		if pseudo == "last-child":
+			return siblings[-1] is node
+		if pseudo == "nth-child" and arg and arg.strip().isdigit():
+			return siblings.index(node) + 1 == int(arg)
+		if pseudo == "checked":
+			return node.attrs.get("checked") is not None or node.attrs.get("selected") is not None
+		if pseudo == "disabled":
+			return "disabled" in node.attrs
+		if pseudo == "enabled":
+			return "disabled" not in node.attrs
+		raise ValueError(f"Unsupported CSS pseudo-class in snapshot: :{pseudo}")
+
+
+class XPathExpression:
+	"""Subset of XPath 1.0: location steps on the axes in _AXES, name tests and common predicates
+
+	Predicates may use @attr, text(), ., normalize-space(), contains(), starts-with(),
+	not(), and/or, = / != comparisons and numeric positions. Anything else, including
+	the following:: and preceding:: axes, raises ValueError rather than matching nothing.
+	"""
+
+	_TOKEN = re.compile(
+		r"\s*(?:(?P<string>\"[^\"]*\"|'[^']*')|(?P<number>\d+(?:\.\d+)?)"
+		r"|(?P<op>//|/|::|\[|\]|\(|\)|,|!=|=|\||@|\.\.|\.|\*)|(?P<name>[a-zA-Z_](?:[\w.-]|:(?!:))*))"
+	)
+
+	_AXES = {
+		"child", "descendant", "descendant-or-self", "self", "parent", "ancestor", "ancestor-or-self",
+		"following-sibling", "preceding-sibling",
+	}
+
+	def __init__(self, expression: str):
+		self.expression = expression
+		self.tokens = self._tokenize(expression)
+		self.position = 0
+		self.paths = self._parse_union()
+		if self.position != len(self.tokens):
+			self._unsupported()
+
+	def evaluate(self, document: SnapshotNode) -> List[SnapshotNode]:
+		found = {}
+		for path in self.paths:
+			for node in self._evaluate_path(path, [document], document):
+				found[id(node)] = node
+		return sorted(found.values(), key=lambda node: node.index)
+
+	# Parsing
+
+	def _tokenize(self, expression: str):
+		tokens, position = [], 0
+		expression = expression.strip()
+		while position < len(expression):
+			match = self._TOKEN.match(expression, position)
+			if not match or match.end() == position:
+				self._unsupported()
+			position = match.end()
+			kind = match.lastgroup
+			tokens.append((kind, match.group(kind)))
+		return tokens
+
+	def _unsupported(self):
+		raise ValueError(f"Unsupported XPath expression for DOM snapshot: {self.expression}")
+
+	def _peek(self, value: str = None):
+		if self.position >= len(self.tokens):
+			return None
+		token = self.tokens[self.position]
+		if value is not None and token[1] != value:
+			return None
+		return token
+
+	def _take(self, value: str = None):
+		token = self._peek(value)
+		if token is None:
+			self._unsupported()
+		self.position += 1
+		return token
+
+	def _parse_union(self):
+		paths = [self._parse_path()]
+		while self._peek("|"):
+			self._take("|")
+			paths.append(self._parse_path())
+		return paths
+
+	def _parse_path(self):
+		"""Return (absolute, [(axis, name, predicates), ...])"""
+		absolute, steps, separator = False, [], "/"
+		if self._peek("/") or self._peek("//"):
+			absolute = True
+			separator = self._take()[1]
+		steps.extend(self._parse_step(separator))
+		while self._peek("/") or self._peek("//"):
+			steps.extend(self._parse_step(self._take()[1]))
+		return absolute, steps
+
+	def _parse_step(self, separator: str):
+		"""One step, or two when // precedes an explicit axis (descendant-or-self::node()/axis::name)"""
+		token, axis = self._take(), None
+		if token[0] == "name" and self._peek("::"):
+			self._take("::")
+			axis = token[1]
+			if axis not in self._AXES:
+				self._unsupported()
+			token = self._take()
+		if token[1] in (".", "..") and axis is None:
+			name = token[1]
+		elif token[1] == "*" or token[0] == "name":
+			name = token[1].lower()
+			if token[0] == "name" and self._peek("("):
+				self._take("(")
+				self._take(")")
+				if name != "node":
+					self._unsupported()
+				name = "node()"
+		else:
+			self._unsupported()
+		predicates = []
+		while self._peek("["):
+			self._take("[")
+			predicates.append(self._parse_or())
+			self._take("]")
+		if axis is None:
+			return [("//" if separator == "//" else "child", name, predicates)]
+		steps = [("descendant-or-self", "node()", [])] if separator == "//" else []
+		return steps + [(axis, name, predicates)]
+
+	def _parse_or(self):
+		expr = self._parse_and()
+		while self._peek("or"):
+			self._take("or")
+			expr = ("or", expr, self._parse_and())
+		return expr
+
+	def _parse_and(self):
+		expr = self._parse_comparison()
+		while self._peek("and"):
+			self._take("and")
+			expr = ("and", expr, self._parse_comparison())
+		return expr
+
+	def _parse_comparison(self):
+		left = self._parse_operand()
+		if self._peek("=") or self._peek("!="):
+			op = self._take()[1]
+			return (op, left, self._parse_operand())
+		return left
+
+	def _parse_operand(self):
+		kind, value = self._take()
+		if kind == "string":
+			return ("literal", value[1:-1])
+		if kind == "number":
+			return ("number", float(value))
+		if value == "@":
+			return ("attr", self._take()[1])
+		if value == ".":
+			return ("string-value",)
+		if value == "(":
+			expr = self._parse_or()
+			self._take(")")
+			return expr
+		if kind == "name" and self._peek("("):
+			self._take("(")
+			args = []
+			while not self._peek(")"):
+				args.append(self._parse_or())
+				if self._peek(","):
+					self._take(",")
+			self._take(")")
+			if value not in ("text", "contains", "starts-with", "normalize-space", "not", "string", "name"):
+				self._unsupported()
+			return ("call", value, args)
+		if kind == "name" or value == "*":
+			# Relative child path used as an existence test, e.g. [span] or [*]
+			self.position -= 1
+			return ("path", self._parse_path())
+		self._unsupported()
+
+	# Evaluation
+
+	def _evaluate_path(self, path, context: List[SnapshotNode], document: SnapshotNode) -> List[SnapshotNode]:
+		absolute, steps = path
+		nodes = [document] if absolute else context
+		for axis, name, predicates in steps:
+			nodes = self._evaluate_step(nodes, axis, name, predicates)
+		return nodes
+
+	def _evaluate_step(self, nodes, axis, name, predicates):
+		result = {}
+		for node in nodes:
+			if name == ".":
+				groups = [[node]]
+			elif name == "..":
+				groups = [[node.parent]] if node.parent else []
+			elif axis == "//":
+				# Abbreviated //name: positions count among each parent's children, as in //li[1]
+				groups = [[child for child in parent.elements if self._name_matches(child, name)]
+				          for parent in [node] + list(node.iter_descendants())]
+			else:
+				groups = [[candidate for candidate in self._axis(node, axis) if self._name_matches(candidate, name)]]
+			for group in groups:
+				for predicate in predicates:
+					group = [candidate for position, candidate in enumerate(group, 1)
+					         if self._test(predicate, candidate, position)]
+				for candidate in group:
+					result[id(candidate)] = candidate
+		return sorted(result.values(), key=lambda node: node.index)
+
+	@staticmethod
+	def _axis(node: SnapshotNode, axis: str) -> List[SnapshotNode]:
+		"""Nodes on axis from node in proximity order, so reverse axes count positions nearest first"""
+		if axis == "child":
+			return node.elements
+		if axis in ("descendant", "descendant-or-self"):
+			descendants = list(node.iter_descendants())
+			return descendants if axis == "descendant" else [node] + descendants
+		if axis == "self":
+			return [node]
+		ancestors, parent = [], node.parent
+		while parent is not None:
+			ancestors.append(parent)
+			parent = parent.parent
+		if axis == "parent":
+			return ancestors[:1]
+		if axis in ("ancestor", "ancestor-or-self"):
+			return ancestors if axis == "ancestor" else [node] + ancestors
+		siblings = node.parent.elements if node.parent else [node]
+		position = siblings.index(node)
+		if axis == "following-sibling":
+			return siblings[position + 1:]
+		return siblings[:position][::-1]
+
+	@staticmethod
+	def _name_matches(node: SnapshotNode, name: str) -> bool:
+		if name == "node()":
+			return True
+		if name == "*":
+			return node.tag != "#document"
+		return node.tag == name
+
+	def _test(self, predicate, node: SnapshotNode, position: int) -> bool:
+		value = self._value(predicate, node)
+		if isinstance(value, float):
+			return value == position
+		return self._boolean(value)
+
+	def _value(self, expr, node: SnapshotNode):
+		kind = expr[0]
+		if kind == "literal":
+			return expr[1]
+		if kind == "number":
+			return expr[1]
+		if kind == "attr":
+			if expr[1] == "*":
+				return list(node.attrs.values())
+			attribute = node.attrs.get(expr[1])
+			return [] if attribute is None else [attribute]
+		if kind == "string-value":
+			return node.text_content
+		if kind == "path":
+			return self._evaluate_path(expr[1], [node], node)
+		if kind in ("and", "or"):
+			left = self._boolean(self._value(expr[1], node))
+			if kind == "and":
+				return left and self._boolean(self._value(expr[2], node))
+			return left or self._boolean(self._value(expr[2], node))
+		if kind in ("=", "!="):
+			return self._compare(kind, self._value(expr[1], node), self._value(expr[2], node))
+		if kind == "call":
+			return self._call(expr[1], expr[2], node)
+		self._unsupported()
+
+	def _call(self, name: str, args, node: SnapshotNode):
+		if name == "text":
+			return node.own_texts
+		if name == "name":
+			return node.tag
+		if name == "not":
+			return not self._boolean(self._value(args[0], node))
+		values = [self._string(self._value(arg, node)) for arg in args] or [node.text_content]
+		if name == "normalize-space":
+			return " ".join(values[0].split())
+		if name == "string":
+			return values[0]
+		if name == "contains":
+			return values[1] in values[0]
+		if name == "starts-with":
+			return values[0].startswith(values[1])
+		self._unsupported()
+
+	@staticmethod
+	def _string(value) -> str:
+		"""XPath string(): first item of a node-set, numbers and booleans converted"""
+		if isinstance(value, list):
+			if not value:
+				return ""
+			first = value[0]
+			return first.text_content if isinstance(first, SnapshotNode) else first
+		if isinstance(value, bool):
+			return "true" if value else "false"
+		if isinstance(value, float):
+			return str(int(value)) if value.is_integer() else str(value)
+		return value
+
+	def _compare(self, op: str, left, right) -> bool:
+		"""XPath equality: node-sets match if any member compares true"""
+		lefts = [self._string([item]) for item in left] if isinstance(left, list) else [self._string(left)]
+		rights = [self._string([item]) for item in right] if isinstance(right, list) else [self._string(right)]
+		if op == "=":
+			return any(a == b for a in lefts for b in rights)
+		return any(a != b for a in lefts for b in rights)
+
+	@staticmethod
+	def _boolean(value) -> bool:
+		if isinstance(value, list):
+			return bool(value)
+		return bool(value)
@@ -0,0 +1,115 @@
+import time
+
+from selenium.common.exceptions import InvalidSelectorException, JavascriptException, TimeoutException
+
+from base.js_locators import FIND_ALL_JS
+
+PRESENCE = "presence"
+VISIBLE = "visible"
+CLICKABLE = "clickable"
+
+# Extra script timeout allowed on top of an in-page wait
+SCRIPT_TIMEOUT_MARGIN = 5
+
+# What Chrome and Firefox report when navigation replaces the document under a running script
+_NAVIGATION_ERRORS = (
+	"document unloaded", "document was unloaded", "execution context was destroyed",
+	"cannot find context with specified id",
+)
+# What querySelectorAll, document.evaluate and findAll's unknown-strategy branch throw
+_SELECTOR_ERRORS = ("is not a valid", "unsupported locator strategy")
+
+# Resolves with the first match once it satisfies the condition, or null on timeout.
+# The interval is a safety net for CSS-only changes (transitions, media queries) that
+# produce no DOM mutation.
+_OBSERVER_WAIT_JS = FIND_ALL_JS + """
+var by = arguments[0], value = arguments[1], condition = arguments[2], timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+
+function check() {
+	var el = findAll(by, value, document)[0];
+	if (!el) {
+		return null;
+	}
+	if (condition === 'presence') {
+		return el;
+	}
+	if (!isVisible(el)) {
+		return null;
+	}
+	return condition === 'visible' || isEnabled(el) ? el : null;
+}
+
+var hit = check();
+if (hit) {
+	return done(hit);
+}
+
+var finished = false, observer, poll, timer;
+function finish(result) {
+	if (finished) {
+		return;
+	}
+	finished = true;
+	observer.disconnect();
+	clearInterval(poll);
+	clearTimeout(timer);
+	done(result);
+}
+function recheck() {
+	var el = check();
+	if (el) {
+		finish(el);
+	}
+}
+
+observer = new MutationObserver(recheck);
+observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+poll = setInterval(recheck, 100);
+timer = setTimeout(function () { finish(null); }, timeoutMs);
+"""
+
+
+def ensure_script_timeout(driver, seconds: float):
+	"""Raise the session script timeout once if it is shorter than an in-page wait needs"""
+	needed = seconds + SCRIPT_TIMEOUT_MARGIN
+	if getattr(driver, "observer_script_timeout", 0) < needed:
+		driver.set_script_timeout(needed)
+		driver.observer_script_timeout = needed
+
+
+class ObserverWait:
+	"""In-page wait resolving the moment a condition holds, in one WebDriver round trip"""
+
+	def __init__(self, driver, timeout: float):
+		self.driver = driver
+		self.timeout = timeout
+
+	def until(self, locator: tuple, condition: str = PRESENCE):
+		"""Return the first element matching locator once condition holds"""
+		by, value = locator
+		deadline = time.monotonic() + self.timeout
+		ensure_script_timeout(self.driver, self.timeout)
+
+		while True:
+			remaining = deadline - time.monotonic()
+			if remaining <= 0:
+				break
+			try:
+				element = self.driver.execute_async_script(
+					_OBSERVER_WAIT_JS, by, value, condition, int(remaining * 1000)
+				)
+			except JavascriptException as e:
+				message = (e.msg or "").lower()
+				if any(error in message for error in _NAVIGATION_ERRORS):
+					# The document was replaced mid-wait; observe the new one
+					time.sleep(0.05)
+					continue
+				if any(error in message for error in _SELECTOR_ERRORS):
+					raise InvalidSelectorException(f"Invalid locator {locator}: {e.msg}") from e
+				raise
+			if element is not None:
+				return element
+			break
+
+		raise TimeoutException(f"Element {locator} not {condition} after {self.timeout}s")
@@ -0,0 +1,311 @@
+from typing import Dict, List, Optional
+from urllib.parse import urldefrag, urlencode, urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+from selenium.common.exceptions import (
+	InvalidElementStateException, NoSuchElementException, StaleElementReferenceException
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+
+from base.dom_snapshot import DOMSnapshot, SnapshotNode
+from config.config import config
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Connection pools shared by every HttpDriver in this process; each driver keeps its own cookies
+_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+
+_SUBMIT_INPUTS = ("submit", "image")
+_SKIPPED_INPUTS = ("submit", "image", "button", "reset", "file")
+
+
+class JavaScriptRequiredError(Exception):
+	"""Raised when an HTTP-only test reaches something only a browser can do"""
+
+
+class HttpDriver:
+	"""WebDriver stand-in that fetches pages with requests and reads them with DOMSnapshot
+
+	Covers what BasePage's locator methods use: navigation, find_element(s), and
+	elements that can be typed into, clicked and submitted as plain HTML forms. Each
+	driver has its own cookies over a connection pool shared by the process. Anything
+	that needs a script engine raises JavaScriptRequiredError instead of silently
+	testing a page the user never sees.
+	"""
+
+	http_only = True
+
+	def __init__(self, timeout: float = None):
+		self.timeout = timeout or config.PAGE_LOAD_TIMEOUT
+		self.session = requests.Session()
+		self.session.mount("http://", _adapter)
+		self.session.mount("https://", _adapter)
+		self.session.headers["Accept"] = "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8"
+		self.document = DOMSnapshot.from_html("")
+		self.page_source = ""
+		self.status_code: Optional[int] = None
+		self.requests = 0
+		self._history: List[str] = []
+		self._position = -1
+
+	@property
+	def current_url(self) -> str:
+		return self.document.url or "data:,"
+
+	@property
+	def title(self) -> str:
+		node = self.document.find((By.TAG_NAME, "title"))
+		return " ".join(node.text_content.split()) if node else ""
+
+	# Navigation
+
+	def get(self, url: str):
+		self._load("GET", url)
+		self._push(self.current_url)
+
+	def back(self):
+		if self._position > 0:
+			self._position -= 1
+			self._load("GET", self._history[self._position])
+
+	def forward(self):
+		if self._position < len(self._history) - 1:
+			self._position += 1
+			self._load("GET", self._history[self._position])
+
+	def refresh(self):
+		# A browser would offer to re-post a form result; re-fetching it is the safe equivalent
+		if self._history:
+			self._load("GET", self._history[self._position])
+
+	def _push(self, url: str):
+		del self._history[self._position + 1:]
+		self._history.append(url)
+		self._position = len(self._history) - 1
+
+	def _load(self, method: str, url: str, **kwargs):
+		response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+		self.requests += 1 + len(response.history)  # redirects are round trips too
+		self.status_code = response.status_code
+		self.page_source = response.text
+		self.document = DOMSnapshot.from_html(response.text, response.url)
+		logger.debug(f"{method} {url} -> {response.status_code} {response.url}")
+
+	# Locators
+
+	def find_element(self, by: str = By.ID, value: str = None) -> "HttpElement":
+		node = self.document.find((by, value))
+		if node is None:
+			self._require_server_rendered((by, value))
+			raise NoSuchElementException(f"No element matching {(by, value)} on {self.current_url}")
+		return HttpElement(self, node)
+
+	def find_elements(self, by: str = By.ID, value: str = None) -> List["HttpElement"]:
+		return [HttpElement(self, node) for node in self.document.find_all((by, value))]
+
+	def requires_javascript(self) -> bool:
+		"""Whether the current page looks rendered client side: a <noscript> notice, or scripts and an empty body"""
+		if any(node.text_content.strip() for node in self.document.find_all((By.TAG_NAME, "noscript"))):
+			return True
+		body = self.document.find((By.TAG_NAME, "body"))
+		return (
+			(body is None or not body.text)
+			and self.document.is_present((By.TAG_NAME, "script"))
+			and not self.document.is_present((By.TAG_NAME, "input"))
+		)
+
+	def _require_server_rendered(self, locator: tuple):
+		if self.requires_javascript():
+			raise JavaScriptRequiredError(
+				f"{self.current_url} renders its content with JavaScript, so {locator} cannot be found "
+				f"without a browser; drop the http_only marker from this test"
+			)
+
+	# Forms
+
+	def _submit(self, form: SnapshotNode, submitter: SnapshotNode = None):
+		if "onsubmit" in form.attrs:
+			raise JavaScriptRequiredError(f"Form on {self.current_url} is submitted by a script (onsubmit)")
+		submitter_attrs = submitter.attrs if submitter is not None else {}
+		action = urljoin(self.current_url, submitter_attrs.get("formaction") or form.attrs.get("action") or self.current_url)
+		method = (submitter_attrs.get("formmethod") or form.attrs.get("method") or "get").lower()
+		fields = self._form_fields(form, submitter)
+		if method == "post":
+			self._load("POST", action, data=fields)
+		else:
+			self._load("GET", f"{urldefrag(action)[0].split('?')[0]}?{urlencode(fields)}")
+		self._push(self.current_url)
+
+	@staticmethod
+	def _form_fields(form: SnapshotNode, submitter: SnapshotNode = None) -> List[tuple]:
+		"""Name/value pairs a browser would send for form, in document order"""
+		fields = []
+		for node in form.iter_descendants():
+			name = node.attrs.get("name")
+			if not name or "disabled" in node.attrs:
+				continue
+			kind = node.attrs.get("type", "text" if node.tag == "input" else "submit").lower()
+			if node.tag == "button" or (node.tag == "input" and kind in _SKIPPED_INPUTS):
+				if node is submitter:
+					fields.append((name, node.attrs.get("value", "")))
+			elif node.tag == "input" and kind in ("checkbox", "radio"):
+				if node.attrs.get("checked") is not None:
+					fields.append((name, node.attrs["value"]))
+			elif node.tag in ("input", "select", "textarea"):
+				fields.append((name, node.attrs.get("value", "")))
+		return fields
+
+	# WebDriver API that needs a browser
+
+	def _browser_only(self, name: str):
+		raise JavaScriptRequiredError(f"{name} needs a browser; drop the http_only marker from this test")
+
+	def execute_script(self, script, *args):
+		self._browser_only("execute_script")
+
+	def execute_async_script(self, script, *args):
+		self._browser_only("execute_async_script")
+
+	def execute(self, command, params=None):
+		self._browser_only(f"WebDriver command {command}")
+
+	def get_screenshot_as_png(self):
+		self._browser_only("Screenshots")
+
+	def set_script_timeout(self, seconds: float):
+		self._browser_only("set_script_timeout")
+
+	# Session
+
+	def implicitly_wait(self, seconds: float):
+		pass
+
+	def set_page_load_timeout(self, seconds: float):
+		self.timeout = seconds
+
+	def get_cookies(self) -> List[Dict]:
+		return [
+			{'name': cookie.name, 'value': cookie.value, 'domain': cookie.domain, 'path': cookie.path}
+			for cookie in self.session.cookies
+		]
+
+	def add_cookie(self, cookie: Dict):
+		self.session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain', ''), path=cookie.get('path', '/'))
+
+	def delete_all_cookies(self):
+		self.session.cookies.clear()
+
+	def quit(self):
+		# Closing the session would close the shared adapter's pools; dropping the cookies is enough
+		self.session.cookies.clear()
+		self.document = DOMSnapshot.from_html("")
+
+
+class HttpElement:
+	"""WebElement stand-in for one element of the HttpDriver's current page"""
+
+	def __init__(self, driver: HttpDriver, node: SnapshotNode):
+		self._driver = driver
+		self._document = driver.document
+		self.node = node
+
+	@property
+	def _current(self) -> SnapshotNode:
+		if self._driver.document is not self._document:
+			raise StaleElementReferenceException(f"{self.node!r} belongs to a page that has been navigated away from")
+		return self.node
+
+	@property
+	def tag_name(self) -> str:
+		return self.node.tag
+
+	@property
+	def text(self) -> str:
+		return self._current.text
+
+	def get_attribute(self, name: str) -> Optional[str]:
+		return self._current.get_attribute(name)
+
+	get_dom_attribute = get_attribute
+	get_property = get_attribute
+
+	def is_displayed(self) -> bool:
+		return self._current.is_displayed()
+
+	def is_enabled(self) -> bool:
+		return "disabled" not in self._current.attrs
+
+	def is_selected(self) -> bool:
+		attrs = self._current.attrs
+		return attrs.get("checked") is not None or "selected" in attrs
+
+	def clear(self):
+		self._editable().attrs["value"] = ""
+
+	def send_keys(self, *value):
+		text = "".join(str(part) for part in value)
+		submit = Keys.ENTER in text or Keys.RETURN in text
+		node = self._editable()
+		node.attrs["value"] = node.attrs.get("value", "") + text.replace(Keys.ENTER, "").replace(Keys.RETURN, "")
+		if submit:
+			self.submit()
+
+	def click(self):
+		node = self._current
+		if "disabled" in node.attrs:
+			return
+		kind = node.attrs.get("type", "").lower()
+		if node.tag == "a" and "href" in node.attrs:
+			self._follow(node.attrs["href"])
+		elif node.tag == "input" and kind == "checkbox":
+			node.attrs["checked"] = None if node.attrs.get("checked") is not None else "true"
+		elif node.tag == "input" and kind == "radio":
+			self._check_radio(node)
+		elif node.tag == "option":
+			select = self._ancestor(node, "select")
+			if select is not None:
+				select.attrs["value"] = node.attrs.get("value", node.text)
+		elif (node.tag == "button" and kind in ("", "submit")) or (node.tag == "input" and kind in _SUBMIT_INPUTS):
+			form = self._ancestor(node, "form")
+			if "onclick" in node.attrs or form is None:
+				self._driver._browser_only(f"Clicking {node!r}")
+			self._driver._submit(form, node)
+		elif "onclick" in node.attrs or node.tag == "button":
+			self._driver._browser_only(f"Clicking {node!r}")
+
+	def submit(self):
+		form = self._ancestor(self._current, "form")
+		if form is None:
+			raise NoSuchElementException(f"{self.node!r} is not in a form")
+		self._driver._submit(form)
+
+	def _editable(self) -> SnapshotNode:
+		node = self._current
+		if node.tag not in ("input", "textarea") or "disabled" in node.attrs or "readonly" in node.attrs:
+			raise InvalidElementStateException(f"{node!r} cannot be typed into")
+		return node
+
+	def _follow(self, href: str):
+		if href.lower().startswith("javascript:"):
+			self._driver._browser_only(f"Link {href}")
+		target = urljoin(self._driver.current_url, href)
+		if urldefrag(target)[0] == urldefrag(self._driver.current_url)[0] and "#" in href:
+			return  # in-page anchor
+		self._driver.get(target)
+
+	def _check_radio(self, node: SnapshotNode):
+		scope = self._ancestor(node, "form") or self._driver.document.document
+		for other in scope.iter_descendants():
+			if other.tag == "input" and other.attrs.get("type", "").lower() == "radio" and other.attrs.get("name") == node.attrs.get("name"):
+				other.attrs["checked"] = None
+		node.attrs["checked"] = "true"
+
+	@staticmethod
+	def _ancestor(node: SnapshotNode, tag: str) -> Optional[SnapshotNode]:
+		parent = node.parent
+		while parent is not None and parent.tag != tag:
+			parent = parent.parent
+		return parent
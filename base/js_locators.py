@@ -0,0 +1,53 @@
+# JavaScript equivalents of Selenium By strategies for in-page lookups.
+# Defines findAll(by, value, root) -> Array<Element>, matching the order Selenium returns
+FIND_ALL_JS = """
+function findAll(by, value, root) {
+	root = root || document;
+	var quoted = '"' + String(value).replace(/["\\\\]/g, '\\\\$&') + '"';
+	switch (by) {
+		case 'id':
+			return Array.prototype.slice.call(root.querySelectorAll('[id=' + quoted + ']'));
+		case 'name':
+			return Array.prototype.slice.call(root.querySelectorAll('[name=' + quoted + ']'));
+		case 'class name':
+			return Array.prototype.slice.call(root.getElementsByClassName(value));
+		case 'tag name':
+			return Array.prototype.slice.call(root.getElementsByTagName(value));
+		case 'css selector':
+			return Array.prototype.slice.call(root.querySelectorAll(value));
+		case 'link text':
+		case 'partial link text':
+			return Array.prototype.filter.call(root.querySelectorAll('a'), function (a) {
+				var text = (a.innerText || a.textContent || '').trim();
+				return by === 'link text' ? text === value : text.indexOf(value) !== -1;
+			});
+		case 'xpath':
+			var result = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+			var nodes = [];
+			for (var i = 0; i < result.snapshotLength; i++) {
+				if (result.snapshotItem(i).nodeType === 1) {
+					nodes.push(result.snapshotItem(i));
+				}
+			}
+			return nodes;
+		default:
+			throw new Error('Unsupported locator strategy: ' + by);
+	}
+}
+
+function isVisible(el) {
+	if (!el || !el.isConnected) {
+		return false;
+	}
+	var style = window.getComputedStyle(el);
+	if (style.display === 'none' || style.visibility === 'hidden' || style.visibility === 'collapse') {
+		return false;
+	}
+	var rect = el.getBoundingClientRect();
+	return el.getClientRects().length > 0 && rect.width > 0 && rect.height > 0;
+}
+
+function isEnabled(el) {
+	return !el.disabled && !(el.closest && el.closest('fieldset[disabled]'));
+}
+"""
@@ -0,0 +1,62 @@
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+from config.config import config
+from pages.pages import HomePage, LoginPage
+from utils.test_data_manager import TestDataManager
+
+
+@dataclass
+class Case:
+	"""One benchmarked operation: prepare once, optionally reset before every run, time op"""
+	name: str
+	op: Callable[["BenchContext"], object]
+	before_each: Optional[Callable[["BenchContext"], None]] = None
+	browser_only: bool = False
+
+
+class BenchContext:
+	"""Driver and page objects shared by the cases, pointed at the local stand-in server"""
+
+	def __init__(self, driver, base_url: str):
+		self.driver = driver
+		self.base_url = base_url
+		self.login_page = LoginPage(driver)
+		self.home_page = HomePage(driver)
+		login_data = TestDataManager.load_json(os.path.join(config.TEST_DATA_DIR, "login_data.json"))
+		self.user = login_data["valid_users"][0]
+
+	def open_login(self):
+		self.driver.delete_all_cookies()
+		self.driver.get(f"{self.base_url}/login")
+		self.login_page.wait_for_page_load()
+
+
+def _login(ctx: BenchContext):
+	ctx.login_page.login(ctx.user['username'], ctx.user['password'])
+	WebDriverWait(ctx.driver, 10, poll_frequency=0.05).until(lambda _: ctx.login_page.is_login_successful())
+	ctx.home_page.wait_for_page_load()
+
+
+CASES: List[Case] = [
+	Case("find_element", lambda ctx: ctx.login_page.find_element(LoginPage.USERNAME_INPUT)),
+	Case("click", lambda ctx: ctx.login_page.click(LoginPage.USERNAME_INPUT)),
+	Case("send_keys", lambda ctx: ctx.login_page.send_keys(LoginPage.USERNAME_INPUT, "bench@example.com")),
+	Case("is_element_visible", lambda ctx: ctx.login_page.is_element_visible(LoginPage.PASSWORD_INPUT)),
+	Case("take_screenshot", lambda ctx: ctx.login_page.take_screenshot("manual"), browser_only=True),
+	Case("wait_for_page_load", lambda ctx: ctx.login_page.wait_for_page_load()),
+	Case("login_flow", _login, before_each=lambda ctx: ctx.open_login()),
+]
+
+
+def select(names: List[str] = None, http_only: bool = False) -> List[Case]:
+	"""Cases to run, in definition order"""
+	by_name: Dict[str, Case] = {case.name: case for case in CASES}
+	unknown = set(names or []) - set(by_name)
+	if unknown:
+		raise ValueError(f"Unknown benchmark(s): {', '.join(sorted(unknown))} (choose from {', '.join(by_name)})")
+	cases = [by_name[name] for name in names] if names else CASES
+	return [case for case in cases if not (http_only and case.browser_only)]
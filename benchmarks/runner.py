@@ -0,0 +1,178 @@
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Dict, List
+
+from base.http_driver import HttpDriver
+from benchmarks.cases import BenchContext, Case, select
+from config.config import config
+from reports.results_db import percentile
+from utils.command_profiler import CommandProfiler
+from utils.driver_factory import DriverFactory
+from utils.local_server import LocalServer, StandInApp
+from utils.screenshot_service import screenshot_service
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+RESULTS_DIR = os.path.join(config.REPORTS_DIR, "benchmarks")
+
+ITERATIONS = 30
+WARMUP = 3
+TOLERANCE = 0.20  # relative p50 slowdown that counts as a regression
+MIN_DELTA_MS = 2.0  # ...but only when it is also this many milliseconds, sub-millisecond noise is not a regression
+SERVER_ASSET_KB = 64  # stand-in page weight, pinned like its latency so LOCAL_SERVER_* exports cannot skew results
+
+
+class RoundTrips:
+	"""WebDriver commands (or HTTP requests, on the HTTP backend) sent since the last mark"""
+
+	def __init__(self, driver):
+		self.driver = driver
+		self.profiler = None if getattr(driver, "http_only", False) else CommandProfiler.install(driver)
+		self._mark = 0
+
+	def _total(self) -> int:
+		return self.driver.requests if self.profiler is None else len(self.profiler.records)
+
+	def mark(self):
+		self._mark = self._total()
+
+	def since_mark(self) -> int:
+		return self._total() - self._mark
+
+
+def run_case(ctx: BenchContext, case: Case, iterations: int, warmup: int) -> Dict:
+	"""Time iterations runs of case after warmup untimed ones"""
+	trips = RoundTrips(ctx.driver)
+	ctx.open_login()
+	samples: List[float] = []
+	round_trips: List[int] = []
+	for iteration in range(warmup + iterations):
+		if case.before_each:
+			case.before_each(ctx)
+		trips.mark()
+		started = time.perf_counter()
+		case.op(ctx)
+		elapsed = time.perf_counter() - started
+		if iteration >= warmup:
+			samples.append(elapsed * 1000)
+			round_trips.append(trips.since_mark())
+	ordered = sorted(samples)
+	return {
+		'iterations': iterations,
+		'p50_ms': percentile(ordered, 50),
+		'p90_ms': percentile(ordered, 90),
+		'p95_ms': percentile(ordered, 95),
+		'p99_ms': percentile(ordered, 99),
+		'mean_ms': statistics.fmean(samples),
+		'round_trips': statistics.fmean(round_trips),
+	}
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float) -> List[str]:
+	"""Regressions against baseline: slower p50 beyond tolerance, or more round trips per operation"""
+	regressions = []
+	for name, result in results.items():
+		base = baseline.get(name)
+		if not base:
+			continue
+		slower = result['p50_ms'] - base['p50_ms']
+		if slower > base['p50_ms'] * tolerance and slower > MIN_DELTA_MS:
+			regressions.append(
+				f"{name}: p50 {result['p50_ms']:.1f}ms vs baseline {base['p50_ms']:.1f}ms (+{slower / base['p50_ms']:.0%})"
+			)
+		if result['round_trips'] > base['round_trips'] + 0.5:
+			regressions.append(
+				f"{name}: {result['round_trips']:.1f} round trips per operation vs baseline {base['round_trips']:.1f}"
+			)
+	return regressions
+
+
+def print_table(results: Dict[str, Dict], baseline: Dict[str, Dict]):
+	print(f"{'operation':<20}{'p50 ms':>9}{'p90 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'trips':>7}{'vs base p50':>13}")
+	for name, result in results.items():
+		base = baseline.get(name)
+		change = f"{(result['p50_ms'] - base['p50_ms']) / base['p50_ms']:+.0%}" if base and base['p50_ms'] else "-"
+		print(
+			f"{name:<20}{result['p50_ms']:>9.1f}{result['p90_ms']:>9.1f}{result['p95_ms']:>9.1f}"
+			f"{result['p99_ms']:>9.1f}{result['round_trips']:>7.1f}{change:>13}"
+		)
+
+
+def _load_json(path: str) -> Dict:
+	try:
+		with open(path, encoding='utf-8') as file:
+			return json.load(file)
+	except FileNotFoundError:
+		return {}
+
+
+def _write_json(path: str, data: Dict):
+	os.makedirs(os.path.dirname(path), exist_ok=True)
+	with open(path, 'w', encoding='utf-8') as file:
+		json.dump(data, file, indent=2, sort_keys=True)
+
+
+def main(argv: List[str] = None) -> int:
+	parser = argparse.ArgumentParser(
+		prog="python -m benchmarks.runner",
+		description="Time BasePage primitives and the login flow against the local stand-in server"
+	)
+	parser.add_argument("cases", nargs="*", help="benchmarks to run (default: all)")
+	parser.add_argument("--backend", choices=("browser", "http"), default="browser",
+	                    help="headless BROWSER, or the HTTP-only backend")
+	parser.add_argument("--iterations", type=int, default=ITERATIONS)
+	parser.add_argument("--warmup", type=int, default=WARMUP)
+	parser.add_argument("--tolerance", type=float, default=TOLERANCE, help="allowed relative p50 slowdown")
+	parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+	args = parser.parse_args(argv)
+
+	label = "http" if args.backend == "http" else config.BROWSER
+	baseline_path = os.path.join(BASELINE_DIR, f"{label}.json")
+	baseline = _load_json(baseline_path)
+	try:
+		cases = select(args.cases, http_only=args.backend == "http")
+	except ValueError as e:
+		parser.error(str(e))
+	if not cases:
+		parser.error(f"nothing to run on the {args.backend} backend")
+
+	# Fixed timing, so results only move when the framework does
+	server = LocalServer(port=0, app=StandInApp(latency_ms=0, jitter_ms=0, asset_kb=SERVER_ASSET_KB)).start()
+	config.SCREENSHOTS_DIR = tempfile.mkdtemp(prefix="benchmark-screenshots-")
+	driver = HttpDriver() if args.backend == "http" else DriverFactory.create_driver(config.BROWSER, headless=True)
+	try:
+		ctx = BenchContext(driver, server.url)
+		results = {case.name: run_case(ctx, case, args.iterations, args.warmup) for case in cases}
+	finally:
+		if args.backend == "http":
+			driver.quit()
+		else:
+			DriverFactory.quit_driver(driver)
+		screenshot_service.flush()
+		server.stop()
+
+	print_table(results, baseline)
+	_write_json(
+		os.path.join(RESULTS_DIR, f"{label}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"),
+		{'backend': label, 'iterations': args.iterations, 'results': results}
+	)
+	if args.save_baseline:
+		_write_json(baseline_path, dict(baseline, **results))
+		print(f"Baseline saved to {baseline_path}")
+		return 0
+
+	regressions = compare(results, baseline, args.tolerance)
+	if not baseline:
+		print(f"No baseline at {baseline_path} yet; run with --save-baseline to create one")
+	for regression in regressions:
+		print(f"REGRESSION {regression}")
+	return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
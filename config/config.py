@@ -9,7 +9,7 @@ class TestConfig:
     STAGING_PROD_BASE_URL: str = "https://business.staging.woven.finance/login"
     BROWSER: str = "chrome"  # chrome, firefox, edge
     HEADLESS: bool = False
-    IMPLICIT_WAIT: int = 10
+    IMPLICIT_WAIT: int = 0  # BasePage waits explicitly; an implicit wait stretches every negative check to at least this long
     EXPLICIT_WAIT: int = 20
     PAGE_LOAD_TIMEOUT: int = 30
     SCREENSHOT_ON_FAILURE: bool = True
@@ -17,6 +17,53 @@ class TestConfig:
     SCREENSHOTS_DIR: str = "screenshots"
     TEST_DATA_DIR: str = "test_data"
     LOG_LEVEL: str = "INFO"
+    DRIVER_REUSE: bool = True
+    DRIVER_MAX_REUSE: int = 50  # tests per browser before it is recycled
+    DRIVER_PREWARM_COUNT: int = 0  # sessions kept launched ahead of demand, 0 disables
+    DRIVER_ASYNC_TEARDOWN: bool = True
+    DRIVER_REAPER_QUEUE_SIZE: int = 4  # sessions allowed to wait for shutdown
+    DRIVER_QUIT_TIMEOUT: int = 10  # seconds before a hanging quit is force-killed
+    SESSION_CACHE_TTL: int = 900  # seconds a cached login is reused before logging in again
+    WAIT_STRATEGY: str = "webdriver"  # webdriver (500 ms polling), observer (in-page MutationObserver)
+    BATCHED_ACTIONS: bool = False  # opt in: fill_form sets fields in one script call instead of per-field send_keys
+    COMMAND_PROFILING: bool = True  # record every WebDriver command for the per-test profile
+    SCREENSHOT_FORMAT: str = "png"  # png, webp (webp needs Pillow)
+    SCREENSHOT_MAX_WIDTH: int = 0  # downscale wider screenshots, 0 keeps full size
+    SCREENSHOT_DEDUPE_DISTANCE: int = 0  # max perceptual-hash bit difference treated as duplicate, 0 = exact only
+    RESULTS_DB: str = "reports/results.db"  # SQLite history of every test result, empty disables
+    RESULTS_ENVIRONMENT: str = ""  # label learned durations and timeouts are kept under, empty: "local" or the app's host
+    DURATION_SCHEDULING: bool = True  # xdist hands out tests longest-first by recorded duration
+    FAST_FEEDBACK: bool = False  # default for --fast-feedback: last failures and flaky tests first, then cheapest first
+    CIRCUIT_BREAKER_THRESHOLD: int = 3  # consecutive timeouts on a page or locator before waits on it fail fast, 0 disables
+    CIRCUIT_BREAKER_PROBE_INTERVAL: int = 30  # seconds an open circuit waits before letting one trial wait through
+    CIRCUIT_BREAKER_HEALTH_URL: str = ""  # optional endpoint that must answer 2xx/3xx before that trial, empty skips the check
+    CIRCUIT_BREAKER_ACTION: str = "skip"  # skip, fail: outcome of tests stopped by an open circuit
+    ADAPTIVE_TIMEOUTS: bool = True  # learn per-locator timeouts from recorded latencies (EXPLICIT_WAIT stays the cap)
+    ADAPTIVE_TIMEOUT_PERCENTILE: int = 99
+    ADAPTIVE_TIMEOUT_MARGIN: float = 2.0  # seconds added to the percentile
+    APP_IDLE_WAIT: bool = False  # wait_for_page_load also waits for fetch/XHR and short one-off timers to settle
+    APP_IDLE_QUIET_MS: int = 300  # how long the page must stay quiet to count as idle
+    APP_IDLE_TIMEOUT: int = 5  # seconds a page load spends waiting for idle before settling for readyState
+    NETWORK_PROFILE: str = "full"  # full, no-media, minimal, slow-3g (Chromium only, see utils/network_profiles.py)
+    NETWORK_PROFILE_STATS: bool = True  # log requests blocked by the profile and cache hits per test
+    PROFILE_TEMPLATE: bool = False  # start Chrome/Edge from a clone of a pre-warmed profile (warm HTTP/code caches)
+    PROFILE_TEMPLATE_DIR: str = ".profile_template"
+    PROFILE_TEMPLATE_URLS: str = "https://business.woven.finance/login"  # comma-separated pages visited to warm it
+    PROFILE_TEMPLATE_MAX_AGE_HOURS: int = 24  # rebuild the template after this long
+    DRIVER_CACHE_DIR: str = "~/.cache/selenium-framework/drivers"  # machine-wide driver binaries, shared by all checkouts
+    DRIVER_VERSION_RECHECK_HOURS: int = 24  # how long a probed browser version is trusted
+    DRIVER_PATH: str = ""  # use this driver executable as-is instead of the cache
+    API_BASE_URL: str = ""  # defaults to the origin of PROD_BASE_URL
+    API_TOKEN: str = ""  # sent as a Bearer token when set
+    API_POOL_SIZE: int = 8  # keep-alive connections, and threads for bulk calls
+    API_RETRIES: int = 3
+    API_RETRY_BACKOFF: float = 0.3  # seconds, doubled on every retry
+    API_TIMEOUT: int = 15
+    BASE_URL_MODE: str = "remote"  # remote, or local: run against the bundled stand-in server (utils/local_server.py)
+    LOCAL_SERVER_PORT: int = 8765  # 0 picks a free port
+    LOCAL_SERVER_LATENCY_MS: int = 0  # added to every stand-in response
+    LOCAL_SERVER_JITTER_MS: int = 0  # +/- uniform, seeded so runs repeat
+    LOCAL_SERVER_ASSET_KB: int = 64  # total size of the stand-in pages' script, stylesheet and logo
 
     @classmethod
     def from_env(cls) -> 'TestConfig':
@@ -33,7 +80,54 @@ class TestConfig:
             REPORTS_DIR=os.getenv("REPORTS_DIR", cls().REPORTS_DIR),
             SCREENSHOTS_DIR=os.getenv("SCREENSHOTS_DIR", cls().SCREENSHOTS_DIR),
             TEST_DATA_DIR=os.getenv("TEST_DATA_DIR", cls().TEST_DATA_DIR),
-            LOG_LEVEL=os.getenv("LOG_LEVEL", cls().LOG_LEVEL)
+            LOG_LEVEL=os.getenv("LOG_LEVEL", cls().LOG_LEVEL),
+            DRIVER_REUSE=os.getenv("DRIVER_REUSE", str(cls().DRIVER_REUSE)).lower() == "true",
+            DRIVER_MAX_REUSE=int(os.getenv("DRIVER_MAX_REUSE", cls().DRIVER_MAX_REUSE)),
+            DRIVER_PREWARM_COUNT=int(os.getenv("DRIVER_PREWARM_COUNT", cls().DRIVER_PREWARM_COUNT)),
+            DRIVER_ASYNC_TEARDOWN=os.getenv("DRIVER_ASYNC_TEARDOWN", str(cls().DRIVER_ASYNC_TEARDOWN)).lower() == "true",
+            DRIVER_REAPER_QUEUE_SIZE=int(os.getenv("DRIVER_REAPER_QUEUE_SIZE", cls().DRIVER_REAPER_QUEUE_SIZE)),
+            DRIVER_QUIT_TIMEOUT=int(os.getenv("DRIVER_QUIT_TIMEOUT", cls().DRIVER_QUIT_TIMEOUT)),
+            SESSION_CACHE_TTL=int(os.getenv("SESSION_CACHE_TTL", cls().SESSION_CACHE_TTL)),
+            WAIT_STRATEGY=os.getenv("WAIT_STRATEGY", cls().WAIT_STRATEGY).lower(),
+            BATCHED_ACTIONS=os.getenv("BATCHED_ACTIONS", str(cls().BATCHED_ACTIONS)).lower() == "true",
+            COMMAND_PROFILING=os.getenv("COMMAND_PROFILING", str(cls().COMMAND_PROFILING)).lower() == "true",
+            SCREENSHOT_FORMAT=os.getenv("SCREENSHOT_FORMAT", cls().SCREENSHOT_FORMAT).lower(),
+            SCREENSHOT_MAX_WIDTH=int(os.getenv("SCREENSHOT_MAX_WIDTH", cls().SCREENSHOT_MAX_WIDTH)),
+            SCREENSHOT_DEDUPE_DISTANCE=int(os.getenv("SCREENSHOT_DEDUPE_DISTANCE", cls().SCREENSHOT_DEDUPE_DISTANCE)),
+            RESULTS_DB=os.getenv("RESULTS_DB", cls().RESULTS_DB),
+            RESULTS_ENVIRONMENT=os.getenv("RESULTS_ENVIRONMENT", cls().RESULTS_ENVIRONMENT),
+            DURATION_SCHEDULING=os.getenv("DURATION_SCHEDULING", str(cls().DURATION_SCHEDULING)).lower() == "true",
+            FAST_FEEDBACK=os.getenv("FAST_FEEDBACK", str(cls().FAST_FEEDBACK)).lower() == "true",
+            CIRCUIT_BREAKER_THRESHOLD=int(os.getenv("CIRCUIT_BREAKER_THRESHOLD", cls().CIRCUIT_BREAKER_THRESHOLD)),
+            CIRCUIT_BREAKER_PROBE_INTERVAL=int(os.getenv("CIRCUIT_BREAKER_PROBE_INTERVAL", cls().CIRCUIT_BREAKER_PROBE_INTERVAL)),
+            CIRCUIT_BREAKER_HEALTH_URL=os.getenv("CIRCUIT_BREAKER_HEALTH_URL", cls().CIRCUIT_BREAKER_HEALTH_URL),
+            CIRCUIT_BREAKER_ACTION=os.getenv("CIRCUIT_BREAKER_ACTION", cls().CIRCUIT_BREAKER_ACTION).lower(),
+            ADAPTIVE_TIMEOUTS=os.getenv("ADAPTIVE_TIMEOUTS", str(cls().ADAPTIVE_TIMEOUTS)).lower() == "true",
+            ADAPTIVE_TIMEOUT_PERCENTILE=int(os.getenv("ADAPTIVE_TIMEOUT_PERCENTILE", cls().ADAPTIVE_TIMEOUT_PERCENTILE)),
+            ADAPTIVE_TIMEOUT_MARGIN=float(os.getenv("ADAPTIVE_TIMEOUT_MARGIN", cls().ADAPTIVE_TIMEOUT_MARGIN)),
+            APP_IDLE_WAIT=os.getenv("APP_IDLE_WAIT", str(cls().APP_IDLE_WAIT)).lower() == "true",
+            APP_IDLE_QUIET_MS=int(os.getenv("APP_IDLE_QUIET_MS", cls().APP_IDLE_QUIET_MS)),
+            APP_IDLE_TIMEOUT=int(os.getenv("APP_IDLE_TIMEOUT", cls().APP_IDLE_TIMEOUT)),
+            NETWORK_PROFILE=os.getenv("NETWORK_PROFILE", cls().NETWORK_PROFILE).lower(),
+            NETWORK_PROFILE_STATS=os.getenv("NETWORK_PROFILE_STATS", str(cls().NETWORK_PROFILE_STATS)).lower() == "true",
+            PROFILE_TEMPLATE=os.getenv("PROFILE_TEMPLATE", str(cls().PROFILE_TEMPLATE)).lower() == "true",
+            PROFILE_TEMPLATE_DIR=os.getenv("PROFILE_TEMPLATE_DIR", cls().PROFILE_TEMPLATE_DIR),
+            PROFILE_TEMPLATE_URLS=os.getenv("PROFILE_TEMPLATE_URLS", cls().PROFILE_TEMPLATE_URLS),
+            PROFILE_TEMPLATE_MAX_AGE_HOURS=int(os.getenv("PROFILE_TEMPLATE_MAX_AGE_HOURS", cls().PROFILE_TEMPLATE_MAX_AGE_HOURS)),
+            DRIVER_CACHE_DIR=os.getenv("DRIVER_CACHE_DIR", cls().DRIVER_CACHE_DIR),
+            DRIVER_VERSION_RECHECK_HOURS=int(os.getenv("DRIVER_VERSION_RECHECK_HOURS", cls().DRIVER_VERSION_RECHECK_HOURS)),
+            DRIVER_PATH=os.getenv("DRIVER_PATH", cls().DRIVER_PATH),
+            API_BASE_URL=os.getenv("API_BASE_URL", cls().API_BASE_URL),
+            API_TOKEN=os.getenv("API_TOKEN", cls().API_TOKEN),
+            API_POOL_SIZE=int(os.getenv("API_POOL_SIZE", cls().API_POOL_SIZE)),
+            API_RETRIES=int(os.getenv("API_RETRIES", cls().API_RETRIES)),
+            API_RETRY_BACKOFF=float(os.getenv("API_RETRY_BACKOFF", cls().API_RETRY_BACKOFF)),
+            API_TIMEOUT=int(os.getenv("API_TIMEOUT", cls().API_TIMEOUT)),
+            BASE_URL_MODE=os.getenv("BASE_URL_MODE", cls().BASE_URL_MODE).lower(),
+            LOCAL_SERVER_PORT=int(os.getenv("LOCAL_SERVER_PORT", cls().LOCAL_SERVER_PORT)),
+            LOCAL_SERVER_LATENCY_MS=int(os.getenv("LOCAL_SERVER_LATENCY_MS", cls().LOCAL_SERVER_LATENCY_MS)),
+            LOCAL_SERVER_JITTER_MS=int(os.getenv("LOCAL_SERVER_JITTER_MS", cls().LOCAL_SERVER_JITTER_MS)),
+            LOCAL_SERVER_ASSET_KB=int(os.getenv("LOCAL_SERVER_ASSET_KB", cls().LOCAL_SERVER_ASSET_KB))
         )
 
 # Instantiate config after class definition
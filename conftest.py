@@ -1,50 +1,311 @@
 import pytest
 import os
+import shutil
+import time
 from datetime import datetime
-from selenium import webdriver
 from utils.driver_factory import DriverFactory
+from utils.driver_pool import DriverPool
+from utils.driver_reaper import DriverReaper
 from config.config import config
+from base.adaptive_timeouts import adaptive_timeouts
+from base.http_driver import HttpDriver
+from utils.api_client import ApiClient
+from utils.circuit_breaker import CircuitOpenError, circuit_breaker
+from utils.data_seeder import DataSeeder
+from utils.local_server import LocalServer, StandInApp
 from utils.logger import setup_logger
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from utils.network_profiles import apply_network_profile, drain_network_log
+from utils.screenshot_service import screenshot_service
+from utils.session_cache import SessionCache
+from utils.test_data_manager import TestDataManager
 from reports.html_report_generator import HTMLReportGenerator
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
+from reports.result_shards import ResultShardWriter, iter_shard_results
+from reports.results_db import ResultsDB
+from reports.duration_model import DurationModel, fast_feedback_order, lpt_partition
 
 logger = setup_logger(__name__)
 
-# Test results collector
-test_results = []
+# Results are appended to a per-process shard so xdist workers can be merged
+result_shard = None
 
+# Every result is also kept in the SQLite history behind trends and flakiness scores
+results_db = None
 
-@pytest.fixture(scope="function")
-def driver():
-    """WebDriver fixture"""
-    driver = None
+# Set on the xdist controller when tests are distributed by recorded duration
+duration_scheduler = None
+
+# Seconds from session start to the first failing test, for the report
+session_started_at = None
+first_failure = None
+
+# Stand-in for the application with BASE_URL_MODE=local, served by the controller for every worker
+local_server = None
+
+# Quits finished browsers in the background when async teardown is enabled
+driver_reaper = DriverReaper() if config.DRIVER_ASYNC_TEARDOWN else None
+
+
+_MARKERS = [
+    "smoke: Smoke tests",
+    "regression: Regression tests",
+    "api: API tests",
+    "ui: UI tests",
+    "slow: Slow running tests",
+    "network_profile(name): CDP request blocking/throttling profile for this test (full, no-media, minimal, slow-3g)",
+    "http_only: run on plain HTTP requests and parsed HTML instead of a browser (no JavaScript)",
+]
+
+
+def _runs_tests(pytest_config) -> bool:
+    """True unless this process is an xdist controller or only collecting"""
+    if pytest_config.option.collectonly:
+        return False
+    return hasattr(pytest_config, "workerinput") or getattr(pytest_config.option, "dist", "no") == "no"
+
+
+def _shard_dir(pytest_config) -> str:
+    return os.path.join(config.REPORTS_DIR, ".shards", pytest_config.report_run_id)
+
+
+def _circuit_state_path(pytest_config) -> str:
+    return os.path.join(config.REPORTS_DIR, ".circuit", f"{pytest_config.report_run_id}.json")
+
+
+def _worker_id() -> str:
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("shard", "split the suite across CI nodes by recorded duration")
+    group.addoption("--shard", default=None, metavar="I/N",
+                    help="run only shard I of N (1-based), e.g. --shard=2/5")
+    group.addoption("--shard-durations", default=None, metavar="PATH",
+                    help="durations exported by 'python -m reports.duration_model', so every node splits alike")
+    group.addoption("--shard-dry-run", action="store_true", default=False,
+                    help="print every shard's size and predicted time, then run nothing")
+    parser.addoption("--fast-feedback", action="store_true", default=config.FAST_FEEDBACK,
+                     help="run last run's failures and flaky tests first, then the rest cheapest first")
+
+
+def _parse_shard(value: str):
     try:
-        if config.BROWSER.lower() == "chrome":
-            chrome_options = webdriver.ChromeOptions()
-            if config.HEADLESS:
-                chrome_options.add_argument("--headless=new")
-                chrome_options.add_argument("--disable-gpu")
-                chrome_options.add_argument("--window-size=1920,1080")
-            # service = ChromeService(ChromeDriverManager().install())
-            service = ChromeService("/Users/abatansamuel/Desktop/My_AUTO_WORK/PythonProject2/drivers/chromedriver")
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            logger.info("WebDriver (Chrome) created successfully")
-        else:
-            raise ValueError(f"Unsupported browser: {config.BROWSER}")
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise pytest.UsageError(f"--shard expects I/N, got {value!r}")
+    if not 1 <= index <= count:
+        raise pytest.UsageError(f"--shard {value}: I must be between 1 and N")
+    return index, count
+
+
+def pytest_collection_modifyitems(config, items):
+    """Keep only this node's share of the suite with --shard, put likely failures first with --fast-feedback"""
+    if items and config.getoption("shard"):
+        _select_shard(config, items)
+    if items and config.getoption("fast_feedback"):
+        # Deterministic, so every xdist worker collects the same order
+        position = {nodeid: index for index, nodeid in enumerate(fast_feedback_order(item.nodeid for item in items))}
+        items.sort(key=lambda item: position[item.nodeid])
+
+
+def _select_shard(config, items):
+    """Deselect everything outside shard I of N, or everything at all for a dry run"""
+    shard = config.getoption("shard")
+    index, count = _parse_shard(shard)
+    durations = config.getoption("shard_durations")
+    # Each node's own results.db differs, so without a shared file every test weighs the same
+    model = DurationModel.from_file(durations) if durations else DurationModel(history={})
+
+    estimates = {item.nodeid: model.predict(item.nodeid) for item in items}
+    partition = lpt_partition(estimates, count)
+    if config.getoption("shard_dry_run"):
+        reporter = config.pluginmanager.get_plugin("terminalreporter")
+        reporter.write_sep("-", f"shards ({len(items)} tests, {sum(estimates.values()):.1f}s predicted)")
+        for number, nodeids in enumerate(partition, start=1):
+            marker = " <- this node" if number == index else ""
+            reporter.write_line(
+                f"shard {number}/{count}: {len(nodeids)} tests, {sum(estimates[n] for n in nodeids):.1f}s predicted{marker}"
+            )
+        selected = set()
+    else:
+        selected = set(partition[index - 1])
+
+    # Filter rather than reorder, so the shard keeps pytest's fixture-friendly collection order
+    deselected = [item for item in items if item.nodeid not in selected]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if item.nodeid in selected]
+
+
+def _use_base_url(base_url: str):
+    """Point pages and profile warming at base_url"""
+    config.PROD_BASE_URL = f"{base_url}/login"
+    config.PROFILE_TEMPLATE_URLS = config.PROD_BASE_URL
+
+
+def _start_local_server(pytest_config):
+    """With BASE_URL_MODE=local, serve the bundled stand-in and run against it"""
+    global local_server
+    if config.BASE_URL_MODE not in ("remote", "local"):
+        raise pytest.UsageError(f"BASE_URL_MODE must be remote or local, got {config.BASE_URL_MODE!r}")
+    if config.BASE_URL_MODE != "local" or pytest_config.option.collectonly:
+        return
+    local_server = LocalServer().start()
+    _use_base_url(local_server.url)
+
+
+def pytest_configure(config):
+    """Register the markers and give the run an id shared by the controller and all xdist workers"""
+    # pytest.ini's [tool:pytest] section is only read from setup.cfg, so its markers never register
+    for marker in _MARKERS:
+        config.addinivalue_line("markers", marker)
+    if hasattr(config, "workerinput"):
+        config.report_run_id = config.workerinput["report_run_id"]
+        if config.workerinput.get("local_base_url"):
+            _use_base_url(config.workerinput["local_base_url"])
+    else:
+        config.report_run_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+        _start_local_server(config)
+
+
+def pytest_unconfigure(config):
+    """Drop the run's circuit breaker state once the terminal summary has reported it"""
+    if hasattr(config, "workerinput") or not hasattr(config, "report_run_id"):
+        return
+    if local_server:
+        local_server.stop()
+    state_path = _circuit_state_path(config)
+    for path in (state_path, f"{state_path}.lock"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Hand the controller's run id and local server to each xdist worker"""
+    node.workerinput["report_run_id"] = node.config.report_run_id
+    node.workerinput["local_base_url"] = local_server.url if local_server else None
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Replace xdist's chunked load distribution with longest-recorded-duration-first"""
+    global duration_scheduler
+    # The hook's `config` argument is pytest's and shadows the framework config here
+    from config.config import config as framework_config
+    if config.getvalue("dist") != "load" or not framework_config.DURATION_SCHEDULING:
+        return None
+    from utils.xdist_scheduler import DurationScheduling
+    # With --fast-feedback the collection order is the point, so dispatch it unchanged
+    duration_scheduler = DurationScheduling(config, log, keep_order=config.getoption("fast_feedback"))
+    return duration_scheduler
 
+
+def pytest_sessionstart(session):
+    """Open this process's result shard and start launching browsers during collection"""
+    global result_shard, results_db, session_started_at
+    session_started_at = time.monotonic()
+    # One breaker state per run, shared by the controller and every worker
+    circuit_breaker.bind(_circuit_state_path(session.config))
+    if not _runs_tests(session.config):
+        return
+    result_shard = ResultShardWriter(_shard_dir(session.config), _worker_id())
+    if config.RESULTS_DB:
+        results_db = ResultsDB()
+    if config.DRIVER_PREWARM_COUNT:
+        DriverFactory.start_prewarming(config.BROWSER, config.HEADLESS, config.DRIVER_PREWARM_COUNT)
+
+
+@pytest.fixture(scope="session")
+def driver_pool():
+    """Pool of browsers reused across the tests of this worker"""
+    pool = DriverPool(config.BROWSER, config.HEADLESS, reaper=driver_reaper)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="function")
+def driver(driver_pool, request):
+    """WebDriver fixture"""
+    if request.node.get_closest_marker("http_only"):
+        # Server-rendered flows run on plain HTTP requests; see base/http_driver.py
+        driver = HttpDriver()
         yield driver
+        driver.quit()
+        return
 
+    try:
+        driver = driver_pool.acquire()
     except Exception as e:
         logger.error(f"Failed to create WebDriver: {str(e)}")
         raise
 
-    finally:
-        if driver:
-            driver.quit()
-            logger.info("WebDriver closed successfully")
+    marker = request.node.get_closest_marker("network_profile")
+    profile = marker.args[0] if marker else config.NETWORK_PROFILE
+    apply_network_profile(driver, profile)
+    drain_network_log(driver)  # discard events from earlier tests
+
+    profiler = getattr(driver, "command_profiler", None)
+    if profiler:
+        profiler.reset()
+    adaptive_timeouts.take_absent()  # absent-element waits are reported per test
+
+    yield driver
+
+    driver_pool.release(driver)
+
+
+@pytest.fixture(scope="session")
+def session_cache():
+    """One real login per worker, replayed into drivers that need a logged-in user"""
+    login_data = TestDataManager.load_json(os.path.join(config.TEST_DATA_DIR, "login_data.json"))
+    user = login_data["valid_users"][0]
+    cache = SessionCache(user["username"], user["password"])
+    yield cache
+    logger.info(f"Session cache: {cache.logins} UI login(s), {cache.injections} replayed session(s)")
+
+
+@pytest.fixture(scope="function")
+def logged_in_driver(driver, session_cache):
+    """WebDriver already authenticated as the first valid user in login_data.json"""
+    session_cache.apply(driver)
+    return driver
+
+
+@pytest.fixture(scope="session")
+def stand_in_server():
+    """The run's local stand-in server, or a private zero-latency one when running against the real app"""
+    if local_server:
+        yield local_server
+        return
+    server = LocalServer(port=0, app=StandInApp(latency_ms=0, jitter_ms=0)).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="function")
+def stand_in_url(stand_in_server, monkeypatch):
+    """Point pages at the stand-in server for one test, for tests of the framework itself"""
+    monkeypatch.setattr(config, "PROD_BASE_URL", f"{stand_in_server.url}/login")
+    return stand_in_server.url
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """Pooled API client shared by the tests of this worker"""
+    client = ApiClient()
+    yield client
+    stats = client.stats()
+    if stats['calls']:
+        logger.info(f"API client: {stats['calls']} call(s) in {stats['seconds']:.2f}s")
+    client.close()
+
+
+@pytest.fixture(scope="function")
+def data_seeder(api_client):
+    """Seeds records through the API (test_data/seed_data.json) and deletes them after the test"""
+    seeder = DataSeeder(api_client)
+    yield seeder
+    seeder.cleanup()
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -53,36 +314,123 @@ def pytest_runtest_makereport(item, call):
 	outcome = yield
 	report = outcome.get_result()
 
+	if call.excinfo is not None and call.excinfo.errisinstance(CircuitOpenError) and config.CIRCUIT_BREAKER_ACTION == "skip":
+		# Same shape pytest.skip() produces, so terminal and reports show the reason
+		report.outcome = "skipped"
+		report.longrepr = (str(item.path), item.location[1], f"Skipped: {call.excinfo.value}")
+
 	if report.when == "call":
 		test_result = {
 			'test_name': item.name,
+			'nodeid': item.nodeid,
 			'test_class': item.cls.__name__ if item.cls else 'N/A',
 			'status': 'PASSED' if report.passed else 'FAILED' if report.failed else 'SKIPPED',
 			'duration': getattr(report, 'duration', 0),
 			'error_message': str(report.longrepr) if report.failed else '',
-			'screenshot': ''
+			'screenshot': '',
+			'worker': _worker_id(),
+			'browser': config.BROWSER
 		}
 
+		driver = item.funcargs.get('driver') if hasattr(item, 'funcargs') else None
+		if getattr(driver, 'http_only', False):
+			test_result['browser'] = 'http'
+		profiler = getattr(driver, 'command_profiler', None)
+		if profiler:
+			test_result['commands'] = profiler.summary()
+		if driver is not None:
+			network = drain_network_log(driver)
+			if network['responses'] or network['blocked']:
+				test_result['network'] = network
+			if network['blocked']:
+				logger.info(
+					f"{item.name}: network profile '{getattr(driver, 'network_profile', 'full')}' blocked "
+					f"{network['blocked']} request(s), ~{network['blocked_bytes'] / 1024:.0f} KB saved"
+				)
+		absent_waits = adaptive_timeouts.take_absent()
+		if absent_waits:
+			test_result['absent_waits'] = absent_waits
+
 		# Take screenshot on failure
-		if report.failed and hasattr(item, 'funcargs') and 'driver' in item.funcargs:
+		if report.failed and driver is not None and not getattr(driver, 'http_only', False):
 			try:
-				driver = item.funcargs['driver']
-				screenshot_path = driver.save_screenshot(
-					f"screenshots/failed_{item.name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-				)
-				test_result['screenshot'] = screenshot_path
+				# Reuses the in-test element_not_found capture when the page has not changed
+				test_result['screenshot'] = screenshot_service.capture(driver, f"failed_{item.name}")
 			except Exception as e:
 				logger.error(f"Failed to take screenshot: {str(e)}")
 
-		test_results.append(test_result)
+		if result_shard:
+			result_shard.append(test_result)
+		if results_db:
+			results_db.record(item.config.report_run_id, test_result)
+
+
+def pytest_runtest_logreport(report):
+	"""Note when the first failure came in; under xdist the controller sees every worker's reports"""
+	global first_failure
+	if report.failed and first_failure is None and session_started_at is not None:
+		first_failure = {'seconds': time.monotonic() - session_started_at, 'nodeid': report.nodeid}
+
 
+def pytest_terminal_summary(terminalreporter):
+	"""Show time to first failure and how close the duration scheduler's prediction came to the real run"""
+	if first_failure:
+		terminalreporter.write_line(f"first failure after {first_failure['seconds']:.1f}s: {first_failure['nodeid']}")
+	for key, circuit in circuit_breaker.open_circuits().items():
+		terminalreporter.write_line(
+			f"circuit open: {key} after {circuit['failures']} consecutive failures (last: {circuit['reason']})", red=True
+		)
+	makespan = duration_scheduler.makespan_summary() if duration_scheduler else None
+	if not makespan:
+		return
+	line = (
+		f"{makespan['tests']} tests on {makespan['workers']} workers: predicted makespan {makespan['predicted']:.1f}s "
+		f"(collection order {makespan['collection_order']:.1f}s), actual {makespan['actual']:.1f}s"
+	)
+	logger.info(f"Duration scheduling: {line}")
+	terminalreporter.write_sep("-", "duration scheduling")
+	terminalreporter.write_line(line)
 
+
+@pytest.hookimpl(trylast=True)
 def pytest_sessionfinish(session, exitstatus):
 	"""Generate custom HTML report after test session"""
+	# trylast: session fixtures (the driver pool) are torn down before this runs
+	DriverFactory.stop_prewarming()
+	if driver_reaper:
+		driver_reaper.drain()
+	screenshot_service.flush()
+	adaptive_timeouts.flush()
+	startup = DriverFactory.startup_summary()
+	if startup['sessions']:
+		logger.info(
+			f"Browser startup: {startup['sessions']} session(s), avg {startup['avg_startup_seconds']:.2f}s, "
+			f"{startup['cold_seconds']:.2f}s on the critical path, {startup['saved_seconds']:.2f}s saved by pre-warming"
+		)
+
+	if result_shard:
+		result_shard.close()
+	if results_db:
+		results_db.close()
+	if hasattr(session.config, "workerinput"):
+		return  # the controller merges every worker's shard into one report
+
+	shard_dir = _shard_dir(session.config)
 	try:
+		history = None
+		if config.RESULTS_DB and os.path.exists(config.RESULTS_DB):
+			history_db = ResultsDB()
+			try:
+				history = history_db.report_history()
+			finally:
+				history_db.close()
 		report_generator = HTMLReportGenerator()
-		report_path = report_generator.generate_report(test_results)
+		report_path = report_generator.generate_report(
+			iter_shard_results(shard_dir), history=history, first_failure=first_failure
+		)
 		logger.info(f"Custom HTML report generated: {report_path}")
 		print(f"\n📊 Custom HTML Report: {os.path.abspath(report_path)}")
+		shutil.rmtree(shard_dir, ignore_errors=True)
 	except Exception as e:
 		logger.error(f"Failed to generate custom HTML report: {str(e)}")
+		logger.error(f"Result shards kept in {shard_dir}, rebuild with: python -m reports.result_shards {shard_dir}")
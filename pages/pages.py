@@ -9,7 +9,7 @@ class LoginPage(BasePage):
 	USERNAME_INPUT = (By.XPATH, "//Input[@placeholder='Email Address']")
 	PASSWORD_INPUT = (By.XPATH, "//Input[@placeholder='Password']")
 	LOGIN_BUTTON = (By.XPATH, "//button[@type='submit']")
-	ERROR_MESSAGE = (By.XPATH, "error-message")
+	ERROR_MESSAGE = (By.CLASS_NAME, "error-message")
 	FORGOT_PASSWORD_LINK = (By.XPATH, "//a[@href='/password-reset']")
 	
 
@@ -43,9 +43,10 @@ class LoginPage(BasePage):
 
 	def login(self, username: str, password: str):
 		"""Complete login process"""
-		self.enter_username(username)
-		self.enter_password(password)
-		self.click_login_button()
+		self.fill_form(
+			{self.USERNAME_INPUT: username, self.PASSWORD_INPUT: password},
+			submit=self.LOGIN_BUTTON
+		)
 
 	def get_error_message(self) -> str:
 		"""Get error message text"""
@@ -71,8 +72,7 @@ class HomePage(BasePage):
 
 	def search(self, query: str):
 		"""Perform search"""
-		self.send_keys(self.SEARCH_BOX, query)
-		self.click(self.SEARCH_BUTTON)
+		self.fill_form({self.SEARCH_BOX: query}, submit=self.SEARCH_BUTTON)
 
 	def logout(self):
 		"""Logout user"""
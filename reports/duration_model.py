@@ -0,0 +1,132 @@
+import heapq
+import json
+import os
+import sys
+from statistics import median
+from typing import Dict, Hashable, Iterable, List
+
+from config.config import config
+from reports.results_db import ResultsDB, current_environment
+
+
+class DurationModel:
+	"""Predict how long a test will take from its recorded history in one environment"""
+
+	DEFAULT_SECONDS = 5.0  # used when nothing at all has been recorded yet
+
+	def __init__(self, history: Dict[str, float] = None, window: int = 20, environment: str = None):
+		self.environment = environment or current_environment()
+		self.history = self._load(window, self.environment) if history is None else history
+
+		# Unknown tests are estimated from their closest recorded relatives:
+		# other parametrizations of the same function, then the same file, then the whole suite
+		by_function: Dict[str, List[float]] = {}
+		by_file: Dict[str, List[float]] = {}
+		for nodeid, seconds in self.history.items():
+			by_function.setdefault(self._function(nodeid), []).append(seconds)
+			by_file.setdefault(self._file(nodeid), []).append(seconds)
+		self._by_function = {key: median(values) for key, values in by_function.items()}
+		self._by_file = {key: median(values) for key, values in by_file.items()}
+		self._overall = median(self.history.values()) if self.history else self.DEFAULT_SECONDS
+
+	@classmethod
+	def from_file(cls, path: str) -> "DurationModel":
+		"""Model from an exported {nodeid: seconds} file, so every CI node predicts the same"""
+		with open(path, encoding='utf-8') as file:
+			return cls(history=json.load(file))
+
+	@staticmethod
+	def _load(window: int, environment: str) -> Dict[str, float]:
+		if not config.RESULTS_DB or not os.path.exists(config.RESULTS_DB):
+			return {}
+		db = ResultsDB()
+		try:
+			durations = db.duration_percentiles(window, environment=environment)
+			return {nodeid: stats['p50'] for nodeid, stats in durations.items()}
+		finally:
+			db.close()
+
+	@staticmethod
+	def _function(nodeid: str) -> str:
+		return nodeid.split('[', 1)[0]
+
+	@staticmethod
+	def _file(nodeid: str) -> str:
+		return nodeid.split('::', 1)[0]
+
+	def is_known(self, nodeid: str) -> bool:
+		return nodeid in self.history
+
+	def predict(self, nodeid: str) -> float:
+		"""Median recorded duration, or the best available estimate for an unseen test"""
+		if nodeid in self.history:
+			return self.history[nodeid]
+		function = self._by_function.get(self._function(nodeid))
+		if function is not None:
+			return function
+		return self._by_file.get(self._file(nodeid), self._overall)
+
+	def export(self, path: str):
+		with open(path, 'w', encoding='utf-8') as file:
+			json.dump(self.history, file, indent=1, sort_keys=True)
+
+
+def fast_feedback_order(nodeids: Iterable[str], model: DurationModel = None, window: int = 20) -> List[str]:
+	"""Tests that failed last time first, then flaky ones, then everything else; cheapest first within each
+
+	Failures and flakiness count only in the model's environment, like its durations.
+	"""
+	nodeids = list(nodeids)
+	model = model or DurationModel(window=window)
+	scores = {}
+	if config.RESULTS_DB and os.path.exists(config.RESULTS_DB):
+		db = ResultsDB()
+		try:
+			scores = db.flakiness(window, nodeids, environment=model.environment)
+		finally:
+			db.close()
+
+	def key(nodeid: str):
+		score = scores.get(nodeid)
+		if score and score['last_status'] == 'FAILED':
+			group = 0
+		elif score and score['flips']:
+			group = 1
+		else:
+			group = 2
+		return group, model.predict(nodeid)
+
+	# sorted() is stable, so equal estimates keep their collection order
+	return sorted(nodeids, key=key)
+
+
+def lpt_partition(estimates: Dict[Hashable, float], bins: int) -> List[List[Hashable]]:
+	"""Longest-processing-time-first split into bins of near-equal predicted time
+
+	Ties are broken by key, so the same estimates always give the same split.
+	"""
+	loads = [(0.0, index) for index in range(bins)]
+	partition: List[List[Hashable]] = [[] for _ in range(bins)]
+	for key in sorted(estimates, key=lambda key: (-estimates[key], str(key))):
+		load, index = heapq.heappop(loads)
+		partition[index].append(key)
+		heapq.heappush(loads, (load + estimates[key], index))
+	return partition
+
+
+def list_makespan(durations: Iterable[float], workers: int) -> float:
+	"""Finish time when each duration, in the given order, goes to the first free worker"""
+	loads = [0.0] * max(workers, 1)
+	for seconds in durations:
+		heapq.heapreplace(loads, loads[0] + seconds)
+	return max(loads)
+
+
+if __name__ == '__main__':
+	# Freeze the recorded durations of one environment for CI nodes that have no results store of their own:
+	#   python -m reports.duration_model test_data/durations.json [environment]
+	if len(sys.argv) not in (2, 3):
+		sys.exit("usage: python -m reports.duration_model <output.json> [environment]")
+	model = DurationModel(environment=sys.argv[2] if len(sys.argv) == 3 else None)
+	model.export(sys.argv[1])
+	print(f"Exported {model.environment} durations of {len(model.history)} tests to {sys.argv[1]}")
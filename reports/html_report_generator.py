@@ -1,7 +1,99 @@
 import os
+import heapq
 import json
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, Iterable, List, Any
+
+# Column order of the compact rows embedded in the report
+ROW_FIELDS = ['test_name', 'test_class', 'status', 'duration', 'error_message', 'screenshot', 'commands']
+
+
+class ReportSummary:
+	"""Running totals gathered while result rows are streamed to disk"""
+
+	def __init__(self, slowest: int = 10):
+		self.total = 0
+		self.passed = 0
+		self.failed = 0
+		self.skipped = 0
+		self.duration = 0.0
+		self.profiled_tests = 0
+		self.command_count = 0
+		self.wait_seconds = 0.0
+		self.action_seconds = 0.0
+		self._slowest_size = slowest
+		self._slowest: List[tuple] = []
+		self.absent_seconds = 0.0
+		self.network = {'blocked': 0, 'blocked_bytes': 0.0, 'responses': 0, 'cached': 0}
+		self._absent: Dict[str, List[float]] = {}
+
+	def add(self, result: Dict[str, Any]):
+		self.total += 1
+		status = result.get('status')
+		if status == 'PASSED':
+			self.passed += 1
+		elif status == 'FAILED':
+			self.failed += 1
+		elif status == 'SKIPPED':
+			self.skipped += 1
+		self.duration += result.get('duration', 0) or 0
+
+		for key, value in (result.get('network') or {}).items():
+			if key in self.network:
+				self.network[key] += value
+
+		for locator, seconds in result.get('absent_waits') or []:
+			self.absent_seconds += seconds
+			totals = self._absent.setdefault(locator, [0.0, 0])
+			totals[0] += seconds
+			totals[1] += 1
+
+		commands = result.get('commands')
+		if commands:
+			self.profiled_tests += 1
+			self.command_count += commands['count']
+			self.wait_seconds += commands['wait_seconds']
+			self.action_seconds += commands['action_seconds']
+			for command in commands.get('slowest', []):
+				entry = (command['seconds'], self.total, dict(command, test_name=result.get('test_name', 'Unknown')))
+				if len(self._slowest) < self._slowest_size:
+					heapq.heappush(self._slowest, entry)
+				else:
+					heapq.heappushpop(self._slowest, entry)
+
+	@property
+	def pass_rate(self) -> float:
+		return (self.passed / self.total * 100) if self.total > 0 else 0
+
+	def to_dict(self) -> Dict[str, Any]:
+		return {
+			'total': self.total,
+			'passed': self.passed,
+			'failed': self.failed,
+			'skipped': self.skipped,
+			'duration': self.duration,
+			'pass_rate': self.pass_rate,
+			'profile': {
+				'tests': self.profiled_tests,
+				'count': self.command_count,
+				'wait_seconds': self.wait_seconds,
+				'action_seconds': self.action_seconds,
+				'slowest': [entry[2] for entry in sorted(self._slowest, key=lambda entry: entry[0], reverse=True)],
+			},
+			'network': dict(
+				self.network,
+				cache_hit_rate=self.network['cached'] / self.network['responses'] * 100 if self.network['responses'] else 0
+			),
+			'absent': {
+				'seconds': self.absent_seconds,
+				'locators': [
+					{'locator': locator, 'seconds': totals[0], 'count': totals[1]}
+					for locator, totals in heapq.nlargest(
+						self._slowest_size, self._absent.items(), key=lambda item: item[1][0]
+					)
+				],
+			},
+		}
 
 
 class HTMLReportGenerator:
@@ -11,344 +103,464 @@ class HTMLReportGenerator:
 		self.report_dir = report_dir
 		os.makedirs(report_dir, exist_ok=True)
 
-	def generate_report(self, test_results: List[Dict[str, Any]], report_name: str = None) -> str:
-		"""Generate HTML report from test results"""
+	def generate_report(self, test_results: Iterable[Dict[str, Any]], report_name: str = None,
+	                    history: Dict[str, Any] = None, first_failure: Dict[str, Any] = None) -> str:
+		"""Generate HTML report from test results, plus trends and flakiness when history is given"""
+		# Rows are streamed as compact JSON and rendered client-side, so any iterable works
+		# and memory use stays flat however many results there are
 		report_name = report_name or f"test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
 		report_path = os.path.join(self.report_dir, report_name)
+		summary = ReportSummary()
 
-		# Calculate summary statistics
-		total_tests = len(test_results)
-		passed_tests = sum(1 for result in test_results if result.get('status') == 'PASSED')
-		failed_tests = sum(1 for result in test_results if result.get('status') == 'FAILED')
-		skipped_tests = sum(1 for result in test_results if result.get('status') == 'SKIPPED')
-
-		pass_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
-
-		# Generate HTML content
-		html_content = self._generate_html_template(
-			test_results, total_tests, passed_tests, failed_tests, skipped_tests, pass_rate
-		)
-
-		# Write to file
 		with open(report_path, 'w', encoding='utf-8') as file:
-			file.write(html_content)
+			file.write(_HTML_HEAD.replace('%GENERATED_AT%', datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+			file.write('<script id="report-data" type="application/json">[\n')
+			for result in test_results:
+				if summary.total:
+					file.write(',\n')
+				summary.add(result)
+				file.write(self._encode_row(result))
+			file.write('\n]</script>\n<script id="report-summary" type="application/json">')
+			file.write(self._encode(dict(summary.to_dict(), history=history, first_failure=first_failure)))
+			file.write('</script>\n')
+			file.write(_HTML_TAIL)
 
 		return report_path
 
-	def _generate_html_template(self, test_results: List[Dict], total: int, passed: int,
-	                            failed: int, skipped: int, pass_rate: float) -> str:
-		"""Generate HTML template with test results"""
-
-		# Generate test rows
-		test_rows = ""
-		for i, result in enumerate(test_results, 1):
-			status_class = result.get('status', 'UNKNOWN').lower()
-			duration = result.get('duration', 0)
-			screenshot_link = ""
-
-			if result.get('screenshot'):
-				screenshot_link = f'<a href="{result["screenshot"]}" target="_blank">📷 View</a>'
-
-			test_rows += f"""
-                <tr class="{status_class}">
-                    <td>{i}</td>
-                    <td>{result.get('test_name', 'Unknown')}</td>
-                    <td>{result.get('test_class', 'Unknown')}</td>
-                    <td><span class="status {status_class}">{result.get('status', 'UNKNOWN')}</span></td>
-                    <td>{duration:.2f}s</td>
-                    <td>{result.get('error_message', '')}</td>
-                    <td>{screenshot_link}</td>
-                </tr>
-            """
-
-		return f"""
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Test Execution Report</title>
-            <style>
-                * {{
-                    margin: 0;
-                    padding: 0;
-                    box-sizing: border-box;
-                }}
-
-                body {{
-                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                    background: #f5f5f5;
-                    color: #333;
-                    line-height: 1.6;
-                }}
-
-                .container {{
-                    max-width: 1200px;
-                    margin: 0 auto;
-                    padding: 20px;
-                }}
-
-                .header {{
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 30px;
-                    border-radius: 10px;
-                    margin-bottom: 30px;
-                    text-align: center;
-                }}
-
-                .header h1 {{
-                    font-size: 2.5em;
-                    margin-bottom: 10px;
-                }}
-
-                .header .timestamp {{
-                    opacity: 0.9;
-                    font-size: 1.1em;
-                }}
-
-                .summary {{
-                    display: grid;
-                    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-                    gap: 20px;
-                    margin-bottom: 30px;
-                }}
-
-                .summary-card {{
-                    background: white;
-                    padding: 25px;
-                    border-radius: 10px;
-                    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-                    text-align: center;
-                    transition: transform 0.3s ease;
-                }}
-
-                .summary-card:hover {{
-                    transform: translateY(-5px);
-                }}
-
-                .summary-card h3 {{
-                    font-size: 2.5em;
-                    margin-bottom: 10px;
-                    font-weight: bold;
-                }}
-
-                .summary-card p {{
-                    color: #666;
-                    font-size: 1.1em;
-                }}
-
-                .total {{ color: #3498db; }}
-                .passed {{ color: #27ae60; }}
-                .failed {{ color: #e74c3c; }}
-                .skipped {{ color: #f39c12; }}
-
-                .pass-rate {{
-                    background: white;
-                    padding: 25px;
-                    border-radius: 10px;
-                    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-                    margin-bottom: 30px;
-                    text-align: center;
-                }}
-
-                .progress-bar {{
-                    width: 100%;
-                    height: 30px;
-                    background: #ecf0f1;
-                    border-radius: 15px;
-                    overflow: hidden;
-                    margin: 15px 0;
-                }}
-
-                .progress-fill {{
-                    height: 100%;
-                    background: linear-gradient(90deg, #27ae60, #2ecc71);
-                    width: {pass_rate}%;
-                    transition: width 1s ease;
-                }}
-
-                .tests-table {{
-                    background: white;
-                    border-radius: 10px;
-                    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-                    overflow: hidden;
-                }}
-
-                .table-header {{
-                    background: #34495e;
-                    color: white;
-                    padding: 20px;
-                }}
-
-                table {{
-                    width: 100%;
-                    border-collapse: collapse;
-                }}
-
-                th, td {{
-                    padding: 15px;
-                    text-align: left;
-                    border-bottom: 1px solid #ecf0f1;
-                }}
-
-                th {{
-                    background: #34495e;
-                    color: white;
-                    font-weight: 600;
-                }}
-
-                tr:hover {{
-                    background: #f8f9fa;
-                }}
-
-                .status {{
-                    padding: 5px 12px;
-                    border-radius: 20px;
-                    font-weight: bold;
-                    text-transform: uppercase;
-                    font-size: 0.8em;
-                }}
-
-                .status.passed {{
-                    background: #d4edda;
-                    color: #155724;
-                }}
-
-                .status.failed {{
-                    background: #f8d7da;
-                    color: #721c24;
-                }}
-
-                .status.skipped {{
-                    background: #fff3cd;
-                    color: #856404;
-                }}
-
-                .error-message {{
-                    max-width: 300px;
-                    word-wrap: break-word;
-                    font-size: 0.9em;
-                    color: #e74c3c;
-                }}
-
-                .footer {{
-                    text-align: center;
-                    margin-top: 30px;
-                    padding: 20px;
-                    color: #666;
-                }}
-
-                @media (max-width: 768px) {{
-                    .container {{
-                        padding: 10px;
-                    }}
-
-                    .summary {{
-                        grid-template-columns: 1fr;
-                    }}
-
-                    table {{
-                        font-size: 0.9em;
-                    }}
-
-                    th, td {{
-                        padding: 10px 5px;
-                    }}
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>🚀 Test Execution Report</h1>
-                    <div class="timestamp">Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</div>
-                </div>
-
-                <div class="summary">
-                    <div class="summary-card">
-                        <h3 class="total">{total}</h3>
-                        <p>Total Tests</p>
-                    </div>
-                    <div class="summary-card">
-                        <h3 class="passed">{passed}</h3>
-                        <p>Passed</p>
-                    </div>
-                    <div class="summary-card">
-                        <h3 class="failed">{failed}</h3>
-                        <p>Failed</p>
-                    </div>
-                    <div class="summary-card">
-                        <h3 class="skipped">{skipped}</h3>
-                        <p>Skipped</p>
-                    </div>
-                </div>
-
-                <div class="pass-rate">
-                    <h2>Pass Rate: {pass_rate:.1f}%</h2>
-                    <div class="progress-bar">
-                        <div class="progress-fill"></div>
-                    </div>
-                </div>
-
-                <div class="tests-table">
-                    <div class="table-header">
-                        <h2>📋 Test Results Details</h2>
-                    </div>
-                    <table>
-                        <thead>
-                            <tr>
-                                <th>#</th>
-                                <th>Test Name</th>
-                                <th>Test Class</th>
-                                <th>Status</th>
-                                <th>Duration</th>
-                                <th>Error Message</th>
-                                <th>Screenshot</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-                            {test_rows}
-                        </tbody>
-                    </table>
-                </div>
-
-                <div class="footer">
-                    <p>🔧 Generated by Selenium Test Framework | © 2024</p>
-                </div>
+	@staticmethod
+	def _encode(value) -> str:
+		"""Compact JSON that is safe to embed inside a <script> element"""
+		# '<' only occurs inside JSON strings, so escaping it cannot change the data
+		return json.dumps(value, separators=(',', ':'), default=str).replace('<', '\\u003c')
+
+	@classmethod
+	def _encode_row(cls, result: Dict[str, Any]) -> str:
+		row = [result.get(field) for field in ROW_FIELDS]
+		commands = result.get('commands')
+		if commands:
+			slowest = [
+				[command['seconds'], command['command'], command['locator'][1] if command['locator'] else '']
+				for command in commands.get('slowest', [])
+			]
+			row[-1] = [commands['count'], commands['wait_seconds'], commands['action_seconds'], slowest]
+		return cls._encode(row)
+
+
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Test Execution Report</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            background: #f5f5f5;
+            color: #333;
+            line-height: 1.6;
+        }
+
+        .container { max-width: 1200px; margin: 0 auto; padding: 20px; }
+
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 30px;
+            border-radius: 10px;
+            margin-bottom: 30px;
+            text-align: center;
+        }
+
+        .header h1 { font-size: 2.5em; margin-bottom: 10px; }
+        .header .timestamp { opacity: 0.9; font-size: 1.1em; }
+
+        .summary {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 20px;
+            margin-bottom: 30px;
+        }
+
+        .summary-card {
+            background: white;
+            padding: 25px;
+            border-radius: 10px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+            text-align: center;
+            transition: transform 0.3s ease;
+        }
+
+        .summary-card:hover { transform: translateY(-5px); }
+        .summary-card h3 { font-size: 2.5em; margin-bottom: 10px; font-weight: bold; }
+        .summary-card p { color: #666; font-size: 1.1em; }
+
+        .total { color: #3498db; }
+        .passed { color: #27ae60; }
+        .failed { color: #e74c3c; }
+        .skipped { color: #f39c12; }
+
+        .pass-rate, .tests-table {
+            background: white;
+            border-radius: 10px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+            margin-bottom: 30px;
+        }
+
+        .pass-rate { padding: 25px; text-align: center; }
+
+        .progress-bar {
+            width: 100%;
+            height: 30px;
+            background: #ecf0f1;
+            border-radius: 15px;
+            overflow: hidden;
+            margin: 15px 0;
+        }
+
+        .progress-fill {
+            height: 100%;
+            background: linear-gradient(90deg, #27ae60, #2ecc71);
+            width: 0;
+            transition: width 1s ease;
+        }
+
+        .tests-table { overflow: hidden; }
+        .table-header { background: #34495e; color: white; padding: 20px; }
+
+        .filters { display: flex; flex-wrap: wrap; gap: 10px; padding: 15px 20px; border-bottom: 1px solid #ecf0f1; }
+        .filters select, .filters input { padding: 6px 10px; border: 1px solid #ccc; border-radius: 5px; }
+        .filters .count { margin-left: auto; color: #666; align-self: center; }
+
+        .grid-row {
+            display: grid;
+            grid-template-columns: 70px 2fr 1.2fr 100px 90px 2fr 70px 150px;
+            align-items: center;
+            height: 44px;
+            padding: 0 15px;
+            border-bottom: 1px solid #ecf0f1;
+            white-space: nowrap;
+            overflow: hidden;
+        }
+
+        .grid-row > div { overflow: hidden; text-overflow: ellipsis; padding-right: 10px; }
+        .grid-row.head { background: #34495e; color: white; font-weight: 600; }
+        .grid-row.head .sortable { cursor: pointer; user-select: none; }
+        .grid-row:not(.head):hover { background: #f8f9fa; cursor: pointer; }
+
+        .viewport { height: 600px; overflow-y: auto; position: relative; }
+        .spacer { position: relative; }
+        .rows { position: absolute; left: 0; right: 0; }
+
+        .status {
+            padding: 5px 12px;
+            border-radius: 20px;
+            font-weight: bold;
+            text-transform: uppercase;
+            font-size: 0.8em;
+        }
+
+        .status.passed { background: #d4edda; color: #155724; }
+        .status.failed { background: #f8d7da; color: #721c24; }
+        .status.skipped { background: #fff3cd; color: #856404; }
+
+        .error-message { color: #e74c3c; font-size: 0.9em; }
+
+        .details {
+            padding: 20px;
+            border-top: 1px solid #ecf0f1;
+            white-space: pre-wrap;
+            word-wrap: break-word;
+            font-family: monospace;
+            font-size: 0.85em;
+            max-height: 300px;
+            overflow: auto;
+            display: none;
+        }
+
+        .profile table { width: 100%; border-collapse: collapse; }
+        .profile th, .profile td { padding: 10px 15px; text-align: left; border-bottom: 1px solid #ecf0f1; }
+        .profile th { background: #34495e; color: white; }
+
+        .footer { text-align: center; margin-top: 30px; padding: 20px; color: #666; }
+
+        @media (max-width: 768px) {
+            .container { padding: 10px; }
+            .summary { grid-template-columns: 1fr; }
+            .grid-row { grid-template-columns: 50px 2fr 90px 70px; font-size: 0.9em; }
+            .grid-row > .optional { display: none; }
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🚀 Test Execution Report</h1>
+            <div class="timestamp">Generated on: %GENERATED_AT%</div>
+        </div>
+
+        <div class="summary">
+            <div class="summary-card"><h3 class="total" id="total">0</h3><p>Total Tests</p></div>
+            <div class="summary-card"><h3 class="passed" id="passed">0</h3><p>Passed</p></div>
+            <div class="summary-card"><h3 class="failed" id="failed">0</h3><p>Failed</p></div>
+            <div class="summary-card"><h3 class="skipped" id="skipped">0</h3><p>Skipped</p></div>
+        </div>
+
+        <div class="pass-rate">
+            <h2 id="pass-rate">Pass Rate: 0.0%</h2>
+            <p id="first-failure"></p>
+            <p id="network-stats"></p>
+            <div class="progress-bar"><div class="progress-fill"></div></div>
+        </div>
+
+        <div class="tests-table">
+            <div class="table-header"><h2>📋 Test Results Details</h2></div>
+            <div class="filters">
+                <select id="status-filter">
+                    <option value="">All statuses</option>
+                    <option>PASSED</option>
+                    <option>FAILED</option>
+                    <option>SKIPPED</option>
+                </select>
+                <select id="class-filter"><option value="">All classes</option></select>
+                <input id="text-filter" type="search" placeholder="Filter by name or error">
+                <span class="count" id="visible-count"></span>
+            </div>
+            <div class="grid-row head">
+                <div>#</div>
+                <div>Test Name</div>
+                <div class="optional">Test Class</div>
+                <div>Status</div>
+                <div class="sortable" id="sort-duration" title="Sort by duration">Duration ⇅</div>
+                <div class="optional">Error Message</div>
+                <div class="optional">Screenshot</div>
+                <div class="optional">Commands</div>
             </div>
+            <div class="viewport" id="viewport">
+                <div class="spacer" id="spacer"><div class="rows" id="rows"></div></div>
+            </div>
+            <div class="details" id="details"></div>
+        </div>
 
-            <script>
-                // Add some interactivity
-                document.addEventListener('DOMContentLoaded', function() {{
-                    // Animate progress bar
-                    setTimeout(() => {{
-                        const progressBar = document.querySelector('.progress-fill');
-                        progressBar.style.width = '{pass_rate}%';
-                    }}, 500);
-
-                    // Add click to expand error messages
-                    document.querySelectorAll('.error-message').forEach(cell => {{
-                        if (cell.textContent.length > 50) {{
-                            const fullText = cell.textContent;
-                            const shortText = fullText.substring(0, 50) + '...';
-                            cell.textContent = shortText;
-                            cell.style.cursor = 'pointer';
-                            cell.title = 'Click to expand';
-
-                            cell.addEventListener('click', function() {{
-                                if (this.textContent === shortText) {{
-                                    this.textContent = fullText;
-                                    this.title = 'Click to collapse';
-                                }} else {{
-                                    this.textContent = shortText;
-                                    this.title = 'Click to expand';
-                                }}
-                            }});
-                        }}
-                    }});
-                }});
-            </script>
-        </body>
-        </html>
-	"""
\ No newline at end of file
+        <div class="tests-table profile" id="profile" style="display: none">
+            <div class="table-header">
+                <h2>⏱ WebDriver Command Profile</h2>
+                <p id="profile-totals"></p>
+            </div>
+            <table>
+                <thead><tr><th>Latency</th><th>Command</th><th>Locator</th><th>Phase</th><th>Test</th></tr></thead>
+                <tbody id="profile-rows"></tbody>
+            </table>
+        </div>
+
+        <div class="tests-table profile" id="absent" style="display: none">
+            <div class="table-header">
+                <h2>⌛ Waiting on Absent Elements</h2>
+                <p id="absent-totals"></p>
+            </div>
+            <table>
+                <thead><tr><th>Locator</th><th>Time Waited</th><th>Waits</th></tr></thead>
+                <tbody id="absent-rows"></tbody>
+            </table>
+        </div>
+
+        <div class="tests-table profile" id="history" style="display: none">
+            <div class="table-header">
+                <h2>📈 History</h2>
+                <p id="history-totals"></p>
+            </div>
+            <table>
+                <thead><tr><th>Slowest Test</th><th>p50</th><th>p95</th><th>Latest</th><th>Trend</th></tr></thead>
+                <tbody id="history-slowest"></tbody>
+            </table>
+            <table>
+                <thead><tr><th>Flaky Test</th><th>Flakiness</th><th>Failures</th><th>Last Status</th></tr></thead>
+                <tbody id="history-flaky"></tbody>
+            </table>
+        </div>
+
+        <div class="footer">
+            <p>🔧 Generated by Selenium Test Framework | © 2024</p>
+        </div>
+    </div>
+"""
+
+_HTML_TAIL = """<script>
+(function () {
+    var ROW_HEIGHT = 44, OVERSCAN = 10;
+    var NAME = 0, CLASS = 1, STATUS = 2, DURATION = 3, ERROR = 4, SCREENSHOT = 5, COMMANDS = 6;
+
+    var data = JSON.parse(document.getElementById('report-data').textContent);
+    var summary = JSON.parse(document.getElementById('report-summary').textContent);
+    data.forEach(function (row, i) { row.push(i + 1); });
+    var INDEX = 7;
+
+    function escapeHtml(value) {
+        return String(value == null ? '' : value).replace(/[&<>"']/g, function (c) {
+            return {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c];
+        });
+    }
+
+    // Summary
+    ['total', 'passed', 'failed', 'skipped'].forEach(function (key) {
+        document.getElementById(key).textContent = summary[key];
+    });
+    document.getElementById('pass-rate').textContent = 'Pass Rate: ' + summary.pass_rate.toFixed(1) + '%';
+    if (summary.first_failure) {
+        document.getElementById('first-failure').textContent = 'First failure after ' +
+            summary.first_failure.seconds.toFixed(1) + 's: ' + summary.first_failure.nodeid;
+    }
+    setTimeout(function () {
+        document.querySelector('.progress-fill').style.width = summary.pass_rate + '%';
+    }, 500);
+
+    var profile = summary.profile;
+    if (profile.tests) {
+        document.getElementById('profile').style.display = '';
+        document.getElementById('profile-totals').textContent =
+            profile.count + ' commands across ' + profile.tests + ' tests (' +
+            (profile.count / profile.tests).toFixed(1) + ' per test) | waiting ' +
+            profile.wait_seconds.toFixed(2) + 's | acting ' + profile.action_seconds.toFixed(2) + 's';
+        document.getElementById('profile-rows').innerHTML = profile.slowest.map(function (c) {
+            return '<tr><td>' + c.seconds.toFixed(3) + 's</td><td>' + escapeHtml(c.command) + '</td><td>' +
+                escapeHtml(c.locator ? c.locator[1] : '') + '</td><td>' + escapeHtml(c.phase) + '</td><td>' +
+                escapeHtml(c.test_name) + '</td></tr>';
+        }).join('');
+    }
+
+    var network = summary.network;
+    if (network.responses || network.blocked) {
+        document.getElementById('network-stats').textContent =
+            'Browser cache hits: ' + network.cached + ' / ' + network.responses + ' responses (' +
+            network.cache_hit_rate.toFixed(1) + '%) | blocked ' + network.blocked + ' requests (~' +
+            (network.blocked_bytes / 1024).toFixed(0) + ' KB)';
+    }
+
+    var absent = summary.absent;
+    if (absent.locators.length) {
+        document.getElementById('absent').style.display = '';
+        document.getElementById('absent-totals').textContent =
+            absent.seconds.toFixed(2) + 's spent waiting for elements that never appeared';
+        document.getElementById('absent-rows').innerHTML = absent.locators.map(function (a) {
+            return '<tr><td>' + escapeHtml(a.locator) + '</td><td>' + a.seconds.toFixed(2) + 's</td><td>' +
+                a.count + '</td></tr>';
+        }).join('');
+    }
+
+    var history = summary.history;
+    if (history) {
+        document.getElementById('history').style.display = '';
+        document.getElementById('history-totals').textContent =
+            history.runs + ' recorded runs | last ' + history.window + ' runs per test';
+        document.getElementById('history-slowest').innerHTML = history.slowest.map(function (t) {
+            var trend = t.change == null ? '' : (t.change >= 0 ? '+' : '') + (t.change * 100).toFixed(0) + '%';
+            return '<tr><td>' + escapeHtml(t.nodeid) + '</td><td>' + t.p50.toFixed(2) + 's</td><td>' +
+                t.p95.toFixed(2) + 's</td><td>' + t.latest.toFixed(2) + 's</td><td>' + trend + '</td></tr>';
+        }).join('');
+        document.getElementById('history-flaky').innerHTML = history.flaky.length ? history.flaky.map(function (t) {
+            return '<tr><td>' + escapeHtml(t.nodeid) + '</td><td>' + (t.score * 100).toFixed(0) + '%</td><td>' +
+                t.failures + ' / ' + t.runs + '</td><td>' + escapeHtml(t.last_status) + '</td></tr>';
+        }).join('') : '<tr><td colspan="4">No flaky tests</td></tr>';
+    }
+
+    // Filters and sorting
+    var classes = {};
+    data.forEach(function (row) { classes[row[CLASS] || 'N/A'] = true; });
+    var classFilter = document.getElementById('class-filter');
+    Object.keys(classes).sort().forEach(function (name) {
+        var option = document.createElement('option');
+        option.textContent = name;
+        classFilter.appendChild(option);
+    });
+
+    var view = data, sortDirection = 0;
+    var viewport = document.getElementById('viewport');
+    var spacer = document.getElementById('spacer');
+    var rows = document.getElementById('rows');
+    var details = document.getElementById('details');
+
+    function applyFilters() {
+        var status = document.getElementById('status-filter').value;
+        var cls = classFilter.value;
+        var text = document.getElementById('text-filter').value.toLowerCase();
+        view = data.filter(function (row) {
+            return (!status || row[STATUS] === status) &&
+                (!cls || (row[CLASS] || 'N/A') === cls) &&
+                (!text || String(row[NAME]).toLowerCase().indexOf(text) !== -1 ||
+                    String(row[ERROR] || '').toLowerCase().indexOf(text) !== -1);
+        });
+        if (sortDirection) {
+            view.sort(function (a, b) { return sortDirection * ((a[DURATION] || 0) - (b[DURATION] || 0)); });
+        }
+        document.getElementById('visible-count').textContent = view.length + ' of ' + data.length + ' tests';
+        spacer.style.height = (view.length * ROW_HEIGHT) + 'px';
+        viewport.scrollTop = 0;
+        render();
+    }
+
+    function renderRow(row) {
+        var status = String(row[STATUS] || 'UNKNOWN');
+        var commands = row[COMMANDS];
+        var commandsCell = commands ? commands[0] + ' cmds (wait ' + commands[1].toFixed(2) + 's)' : '';
+        var screenshot = row[SCREENSHOT] ?
+            '<a href="' + escapeHtml(row[SCREENSHOT]) + '" target="_blank">📷 View</a>' : '';
+        return '<div class="grid-row ' + status.toLowerCase() + '" data-index="' + row[INDEX] + '">' +
+            '<div>' + row[INDEX] + '</div>' +
+            '<div title="' + escapeHtml(row[NAME]) + '">' + escapeHtml(row[NAME]) + '</div>' +
+            '<div class="optional">' + escapeHtml(row[CLASS]) + '</div>' +
+            '<div><span class="status ' + status.toLowerCase() + '">' + escapeHtml(status) + '</span></div>' +
+            '<div>' + (row[DURATION] || 0).toFixed(2) + 's</div>' +
+            '<div class="optional error-message">' + escapeHtml(String(row[ERROR] || '').slice(0, 200)) + '</div>' +
+            '<div class="optional">' + screenshot + '</div>' +
+            '<div class="optional">' + commandsCell + '</div>' +
+            '</div>';
+    }
+
+    function render() {
+        var first = Math.max(0, Math.floor(viewport.scrollTop / ROW_HEIGHT) - OVERSCAN);
+        var count = Math.ceil(viewport.clientHeight / ROW_HEIGHT) + 2 * OVERSCAN;
+        rows.style.top = (first * ROW_HEIGHT) + 'px';
+        rows.innerHTML = view.slice(first, first + count).map(renderRow).join('');
+    }
+
+    function showDetails(index) {
+        var row = data[index - 1];
+        var text = row[NAME] + '\\n\\n' + (row[ERROR] || 'No error');
+        var commands = row[COMMANDS];
+        if (commands) {
+            text += '\\n\\nWebDriver commands: ' + commands[0] + ' | wait ' + commands[1].toFixed(2) +
+                's | action ' + commands[2].toFixed(2) + 's\\nSlowest:\\n' +
+                commands[3].map(function (c) { return '  ' + c[0].toFixed(3) + 's ' + c[1] + ' ' + c[2]; }).join('\\n');
+        }
+        details.textContent = text;
+        details.style.display = 'block';
+    }
+
+    var scheduled = false;
+    viewport.addEventListener('scroll', function () {
+        if (!scheduled) {
+            scheduled = true;
+            requestAnimationFrame(function () { scheduled = false; render(); });
+        }
+    });
+    rows.addEventListener('click', function (event) {
+        var row = event.target.closest('.grid-row');
+        if (row && event.target.tagName !== 'A') {
+            showDetails(Number(row.getAttribute('data-index')));
+        }
+    });
+    document.getElementById('status-filter').addEventListener('change', applyFilters);
+    classFilter.addEventListener('change', applyFilters);
+    document.getElementById('text-filter').addEventListener('input', applyFilters);
+    document.getElementById('sort-duration').addEventListener('click', function () {
+        sortDirection = sortDirection === -1 ? 1 : -1;
+        applyFilters();
+    });
+
+    applyFilters();
+})();
+</script>
+</body>
+</html>
+"""
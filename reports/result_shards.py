@@ -0,0 +1,47 @@
+import glob
+import json
+import os
+import sys
+from typing import Any, Dict, Iterator
+
+
+class ResultShardWriter:
+	"""Append-only JSON-lines file holding the results of one pytest process"""
+
+	def __init__(self, shard_dir: str, worker_id: str):
+		os.makedirs(shard_dir, exist_ok=True)
+		self.path = os.path.join(shard_dir, f"{worker_id}.jsonl")
+		# Line buffered: every finished test is on disk even if the worker crashes later
+		self._file = open(self.path, 'a', encoding='utf-8', buffering=1)
+
+	def append(self, result: Dict[str, Any]):
+		self._file.write(json.dumps(result, separators=(',', ':'), default=str) + '\n')
+
+	def close(self):
+		if not self._file.closed:
+			self._file.close()
+
+
+def iter_shard_results(shard_dir: str) -> Iterator[Dict[str, Any]]:
+	"""Yield results from every shard in shard_dir, skipping lines cut short by a crash"""
+	for path in sorted(glob.glob(os.path.join(shard_dir, '*.jsonl'))):
+		with open(path, encoding='utf-8') as file:
+			for line in file:
+				line = line.strip()
+				if not line:
+					continue
+				try:
+					yield json.loads(line)
+				except json.JSONDecodeError:
+					continue
+
+
+if __name__ == '__main__':
+	# Rebuild a (partial) report from the shards a crashed run left behind:
+	#   python -m reports.result_shards reports/.shards/<run_id>
+	from reports.html_report_generator import HTMLReportGenerator
+
+	if len(sys.argv) != 2:
+		sys.exit("usage: python -m reports.result_shards <shard_dir>")
+	report_path = HTMLReportGenerator().generate_report(iter_shard_results(sys.argv[1]))
+	print(f"📊 Custom HTML Report: {os.path.abspath(report_path)}")
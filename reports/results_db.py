@@ -0,0 +1,269 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+from config.config import config
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+	id INTEGER PRIMARY KEY,
+	run_id TEXT NOT NULL,
+	nodeid TEXT NOT NULL,
+	status TEXT NOT NULL,
+	duration REAL NOT NULL,
+	error_signature TEXT,
+	worker TEXT,
+	browser TEXT,
+	recorded_at REAL NOT NULL,
+	environment TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_results_nodeid ON results (nodeid, recorded_at);
+CREATE INDEX IF NOT EXISTS idx_results_run ON results (run_id);
+CREATE TABLE IF NOT EXISTS locator_latencies (
+	id INTEGER PRIMARY KEY,
+	page TEXT NOT NULL,
+	locator TEXT NOT NULL,
+	condition TEXT NOT NULL,
+	seconds REAL NOT NULL,
+	recorded_at REAL NOT NULL,
+	environment TEXT NOT NULL DEFAULT ''
+);
+"""
+
+# Created after _migrate, since databases from before the environment column lack it until then
+_ENVIRONMENT_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_latencies_environment_key
+	ON locator_latencies (environment, page, locator, condition, recorded_at);
+CREATE INDEX IF NOT EXISTS idx_results_environment ON results (environment, nodeid, recorded_at);
+"""
+
+# The last `window` executed (not skipped) runs of every test, oldest first per test;
+# limited to one environment unless that parameter is NULL
+_RECENT_SQL = """
+SELECT nodeid, status, duration FROM (
+	SELECT nodeid, status, duration, recorded_at, id,
+		ROW_NUMBER() OVER (PARTITION BY nodeid ORDER BY recorded_at DESC, id DESC) AS age
+	FROM results WHERE status != 'SKIPPED' AND (? IS NULL OR environment = ?)
+) WHERE age <= ? ORDER BY nodeid, recorded_at, id
+"""
+
+_LOOPBACK_HOSTS = ("localhost", "127.0.0.1", "::1")
+
+_VOLATILE = re.compile(r"0x[0-9a-fA-F]+|\d+(\.\d+)?")
+
+
+def error_signature(message: str) -> str:
+	"""Stable one-line summary of a failure, so the same error groups across runs"""
+	if not message:
+		return ''
+	lines = [line.strip() for line in str(message).splitlines() if line.strip()]
+	# pytest marks the exception lines of a longrepr with a leading "E"
+	errors = [line[1:].strip() for line in lines if line.startswith('E ')]
+	line = errors[0] if errors else lines[-1]
+	return _VOLATILE.sub('N', line)[:200]
+
+
+def current_environment() -> str:
+	"""Label for where this run's timings come from: RESULTS_ENVIRONMENT, "local" for the stand-in server, else the app's host
+
+	Durations and locator latencies are only compared within one environment, so a
+	localhost run never sets the expectations for the real application.
+	"""
+	if config.RESULTS_ENVIRONMENT:
+		return config.RESULTS_ENVIRONMENT
+	parts = urlsplit(config.PROD_BASE_URL)
+	if config.BASE_URL_MODE == "local" or parts.hostname in _LOOPBACK_HOSTS:
+		return "local"
+	return parts.netloc or config.PROD_BASE_URL
+
+
+def percentile(values: List[float], pct: float) -> float:
+	"""Linear-interpolated percentile of an already sorted list"""
+	if not values:
+		return 0.0
+	position = (len(values) - 1) * pct / 100
+	lower = int(position)
+	upper = min(lower + 1, len(values) - 1)
+	return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+class ResultsDB:
+	"""Per-test results of every run in one SQLite file, shared by all xdist workers"""
+
+	def __init__(self, path: str = None):
+		self.path = path or config.RESULTS_DB
+		directory = os.path.dirname(self.path)
+		if directory:
+			os.makedirs(directory, exist_ok=True)
+		# Workers write concurrently: WAL lets readers and one writer proceed, timeout waits out the rest
+		self._connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+		self._connection.execute("PRAGMA journal_mode=WAL")
+		self._connection.execute("PRAGMA synchronous=NORMAL")
+		self._connection.executescript(_SCHEMA)
+		self._migrate()
+		self._connection.executescript(_ENVIRONMENT_INDEXES)
+		self._lock = threading.Lock()
+
+	def _migrate(self):
+		"""Add the environment column to databases created before it; their rows stay unattributed ('')"""
+		for table in ("results", "locator_latencies"):
+			columns = [row[1] for row in self._connection.execute(f"PRAGMA table_info({table})")]
+			if "environment" in columns:
+				continue
+			try:
+				self._connection.execute(f"ALTER TABLE {table} ADD COLUMN environment TEXT NOT NULL DEFAULT ''")
+			except sqlite3.OperationalError as e:
+				# Another worker migrated it between the check and the ALTER
+				if "duplicate column" not in str(e):
+					raise
+
+	def record(self, run_id: str, result: Dict[str, Any]):
+		"""Store one test result, logging instead of failing the test if the database is unavailable"""
+		row = (
+			run_id,
+			result.get('nodeid') or result.get('test_name', 'Unknown'),
+			result.get('status', 'UNKNOWN'),
+			result.get('duration', 0) or 0,
+			error_signature(result.get('error_message', '')),
+			result.get('worker'),
+			result.get('browser'),
+			time.time(),
+			current_environment(),
+		)
+		try:
+			with self._lock, self._connection:
+				self._connection.execute(
+					"INSERT INTO results (run_id, nodeid, status, duration, error_signature, worker, browser, recorded_at,"
+					" environment) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", row
+				)
+		except sqlite3.Error as e:
+			logger.warning(f"Could not record result for {row[1]}: {str(e)}")
+
+	def history(self, nodeid: str, limit: int = 20) -> List[Dict[str, Any]]:
+		"""Most recent results of one test, newest first"""
+		with self._lock:
+			rows = self._connection.execute(
+				"SELECT run_id, status, duration, error_signature, worker, browser, recorded_at FROM results"
+				" WHERE nodeid = ? ORDER BY recorded_at DESC, id DESC LIMIT ?", (nodeid, limit)
+			).fetchall()
+		fields = ('run_id', 'status', 'duration', 'error_signature', 'worker', 'browser', 'recorded_at')
+		return [dict(zip(fields, row)) for row in rows]
+
+	def run_count(self) -> int:
+		with self._lock:
+			return self._connection.execute("SELECT COUNT(DISTINCT run_id) FROM results").fetchone()[0]
+
+	def _recent(self, window: int, nodeids: Iterable[str] = None, environment: str = None) -> Dict[str, List[tuple]]:
+		wanted = set(nodeids) if nodeids is not None else None
+		recent: Dict[str, List[tuple]] = {}
+		with self._lock:
+			rows = self._connection.execute(_RECENT_SQL, (environment, environment, window)).fetchall()
+		for nodeid, status, duration in rows:
+			if wanted is None or nodeid in wanted:
+				recent.setdefault(nodeid, []).append((status, duration))
+		return recent
+
+	def duration_percentiles(self, window: int = 20, nodeids: Iterable[str] = None,
+	                         environment: str = None) -> Dict[str, Dict[str, float]]:
+		"""p50/p90/p95 duration of each test over its last `window` runs, in one environment if given"""
+		stats = {}
+		for nodeid, runs in self._recent(window, nodeids, environment).items():
+			durations = sorted(duration for _, duration in runs)
+			stats[nodeid] = {
+				'runs': len(durations),
+				'p50': percentile(durations, 50),
+				'p90': percentile(durations, 90),
+				'p95': percentile(durations, 95),
+				'latest': runs[-1][1],
+			}
+		return stats
+
+	def flakiness(self, window: int = 20, nodeids: Iterable[str] = None,
+	              environment: str = None) -> Dict[str, Dict[str, Any]]:
+		"""Pass/fail flip rate of each test over its last `window` runs (0 = stable, 1 = flips every run)"""
+		scores = {}
+		for nodeid, runs in self._recent(window, nodeids, environment).items():
+			statuses = [status for status, _ in runs]
+			flips = sum(1 for previous, current in zip(statuses, statuses[1:]) if previous != current)
+			scores[nodeid] = {
+				'runs': len(statuses),
+				'failures': statuses.count('FAILED'),
+				'flips': flips,
+				'score': flips / (len(statuses) - 1) if len(statuses) > 1 else 0.0,
+				'last_status': statuses[-1],
+			}
+		return scores
+
+	def slowest_trends(self, limit: int = 10, window: int = 20) -> List[Dict[str, Any]]:
+		"""Slowest tests by median duration, with the latest run compared to the median before it"""
+		trends = []
+		for nodeid, runs in self._recent(window).items():
+			durations = [duration for _, duration in runs]
+			ordered = sorted(durations)
+			earlier = sorted(durations[:-1])
+			previous = percentile(earlier, 50) if earlier else None
+			trends.append({
+				'nodeid': nodeid,
+				'runs': len(durations),
+				'p50': percentile(ordered, 50),
+				'p95': percentile(ordered, 95),
+				'latest': durations[-1],
+				'change': (durations[-1] - previous) / previous if previous else None,
+			})
+		trends.sort(key=lambda trend: trend['p50'], reverse=True)
+		return trends[:limit]
+
+	def report_history(self, limit: int = 10, window: int = 20) -> Optional[Dict[str, Any]]:
+		"""Trend and flakiness section for the HTML report, None while there is no history yet"""
+		runs = self.run_count()
+		if not runs:
+			return None
+		flaky = [dict(score, nodeid=nodeid) for nodeid, score in self.flakiness(window).items() if score['flips']]
+		flaky.sort(key=lambda score: (score['score'], score['failures']), reverse=True)
+		return {
+			'runs': runs,
+			'window': window,
+			'slowest': self.slowest_trends(limit, window),
+			'flaky': flaky[:limit],
+		}
+
+	def record_locator_latencies(self, samples: Iterable[tuple]):
+		"""Store (environment, page, locator, condition, seconds) samples of waits that found their element"""
+		now = time.time()
+		try:
+			with self._lock, self._connection:
+				self._connection.executemany(
+					"INSERT INTO locator_latencies (environment, page, locator, condition, seconds, recorded_at)"
+					" VALUES (?, ?, ?, ?, ?, ?)",
+					[tuple(sample) + (now,) for sample in samples]
+				)
+		except sqlite3.Error as e:
+			logger.warning(f"Could not record locator latencies: {str(e)}")
+
+	def locator_latency_percentiles(self, pct: float = 95, window: int = 50) -> Dict[tuple, Dict[str, float]]:
+		"""pct-th percentile of each (environment, page, locator, condition) over its last `window` samples"""
+		with self._lock:
+			rows = self._connection.execute(
+				"SELECT environment, page, locator, condition, seconds FROM ("
+				" SELECT environment, page, locator, condition, seconds, ROW_NUMBER() OVER ("
+				"  PARTITION BY environment, page, locator, condition ORDER BY recorded_at DESC, id DESC) AS age"
+				" FROM locator_latencies) WHERE age <= ?", (window,)
+			).fetchall()
+		samples: Dict[tuple, List[float]] = {}
+		for environment, page, locator, condition, seconds in rows:
+			samples.setdefault((environment, page, locator, condition), []).append(seconds)
+		return {
+			key: {'samples': len(values), 'seconds': percentile(sorted(values), pct)}
+			for key, values in samples.items()
+		}
+
+	def close(self):
+		with self._lock:
+			self._connection.close()
@@ -0,0 +1,47 @@
+import allure
+import pytest
+from selenium.webdriver.common.by import By
+
+from base.adaptive_timeouts import MIN_SAMPLES, AdaptiveTimeouts
+from config.config import config
+
+BUTTON = (By.XPATH, "//button[@type='submit']")
+
+
+@pytest.fixture
+def timeouts(tmp_path, monkeypatch):
+	monkeypatch.setattr(config, "RESULTS_DB", str(tmp_path / "results.db"))
+	return AdaptiveTimeouts(enabled=True, pct=99, margin=2.0)
+
+
+def _learn(timeouts: AdaptiveTimeouts, monkeypatch, environment: str, seconds: float):
+	monkeypatch.setattr(config, "RESULTS_ENVIRONMENT", environment)
+	for _ in range(MIN_SAMPLES):
+		timeouts.observe("LoginPage", BUTTON, "visible", seconds)
+	timeouts.flush()
+
+
+@allure.feature("Adaptive Timeouts")
+class TestAdaptiveTimeouts:
+	"""Learned wait timeouts, kept apart per environment"""
+
+	def test_learned_timeout_is_percentile_plus_margin_under_cap(self, timeouts, monkeypatch):
+		_learn(timeouts, monkeypatch, "staging", 3.0)
+
+		assert AdaptiveTimeouts(enabled=True, pct=99, margin=2.0).timeout_for("LoginPage", BUTTON, "visible", 20) == 5.0
+		assert AdaptiveTimeouts(enabled=True, pct=99, margin=2.0).timeout_for("LoginPage", BUTTON, "visible", 4) == 4
+
+	def test_local_latencies_do_not_cap_another_environment(self, timeouts, monkeypatch):
+		_learn(timeouts, monkeypatch, "local", 0.01)
+
+		monkeypatch.setattr(config, "RESULTS_ENVIRONMENT", "staging")
+		assert AdaptiveTimeouts(enabled=True).timeout_for("LoginPage", BUTTON, "visible", 20) == 20
+		monkeypatch.setattr(config, "RESULTS_ENVIRONMENT", "local")
+		assert AdaptiveTimeouts(enabled=True, margin=0).timeout_for("LoginPage", BUTTON, "visible", 20) == 1.0
+
+	def test_too_few_samples_keep_the_cap(self, timeouts, monkeypatch):
+		monkeypatch.setattr(config, "RESULTS_ENVIRONMENT", "staging")
+		timeouts.observe("LoginPage", BUTTON, "visible", 0.5)
+		timeouts.flush()
+
+		assert AdaptiveTimeouts(enabled=True).timeout_for("LoginPage", BUTTON, "visible", 20) == 20
@@ -0,0 +1,165 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import allure
+import pytest
+
+from utils.api_client import ApiClient, ApiError
+from utils.data_seeder import DataSeeder
+
+
+class StubApi:
+	"""In-memory /api/accounts collection served over keep-alive HTTP"""
+
+	def __init__(self):
+		self.accounts = {}
+		self.requests = []
+		self.connections = 0
+		self.fail_next = []  # statuses returned (once each) before handling normally
+		self.lock = threading.Lock()
+
+
+def _handler(stub: StubApi):
+	class Handler(BaseHTTPRequestHandler):
+		protocol_version = "HTTP/1.1"
+
+		def setup(self):
+			super().setup()
+			with stub.lock:
+				stub.connections += 1
+
+		def log_message(self, *args):
+			pass
+
+		def _reply(self, status: int, body=None):
+			payload = json.dumps(body).encode() if body is not None else b""
+			self.send_response(status)
+			self.send_header("Content-Type", "application/json")
+			self.send_header("Content-Length", str(len(payload)))
+			self.end_headers()
+			self.wfile.write(payload)
+
+		def _handle(self):
+			length = int(self.headers.get("Content-Length", 0))
+			body = json.loads(self.rfile.read(length)) if length else None
+			with stub.lock:
+				stub.requests.append((self.command, self.path))
+				if stub.fail_next:
+					return self._reply(stub.fail_next.pop(0), {'error': 'unavailable'})
+				if self.command == "POST" and self.path == "/api/accounts":
+					if any(account['username'] == body['username'] for account in stub.accounts.values()):
+						return self._reply(409, {'error': 'username taken'})
+					account = dict(body, id=len(stub.requests))
+					stub.accounts[account['id']] = account
+					return self._reply(201, account)
+				if self.command == "GET" and self.path == "/api/accounts":
+					return self._reply(200, list(stub.accounts.values()))
+				if self.command == "DELETE" and self.path.startswith("/api/accounts/"):
+					found = stub.accounts.pop(int(self.path.rsplit("/", 1)[1]), None)
+					return self._reply(204 if found else 404)
+			self._reply(404, {'error': 'not found'})
+
+		do_GET = do_POST = do_DELETE = _handle
+
+	return Handler
+
+
+@pytest.fixture(scope="module")
+def stub_api():
+	stub = StubApi()
+	server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(stub))
+	thread = threading.Thread(target=server.serve_forever, daemon=True)
+	thread.start()
+	stub.url = f"http://127.0.0.1:{server.server_port}"
+	yield stub
+	server.shutdown()
+	server.server_close()
+
+
+@pytest.fixture
+def api_client(stub_api):
+	"""Overrides the conftest client so data_seeder talks to the stub"""
+	client = ApiClient(base_url=stub_api.url, pool_size=4, backoff=0)
+	yield client
+	client.close()
+
+
+@pytest.mark.api
+class TestApiSeeding:
+	"""API client and seeder against a local stub server"""
+
+	@allure.feature("Test Data")
+	@allure.story("Seed and clean up")
+	def test_seed_and_cleanup(self, stub_api, api_client, data_seeder):
+		"""Accounts from seed_accounts.json are created in bulk and removed again"""
+		with allure.step("Seed accounts from the seed spec"):
+			created = data_seeder.seed("accounts")
+
+		with allure.step("Verify every valid user was created"):
+			expected = data_seeder.records("accounts")
+			assert [account['password'] for account in created] == [user['password'] for user in expected]
+			assert len(api_client.get("/api/accounts")) == len(expected)
+
+		with allure.step("Clean up"):
+			data_seeder.cleanup()
+			assert api_client.get("/api/accounts") == []
+
+	@allure.feature("Test Data")
+	@allure.story("Seed and clean up")
+	def test_duplicate_keys_are_seeded_once(self, stub_api, api_client):
+		"""login_data.json lists test@123 twice; creating both would get the second a 409"""
+		seeder = DataSeeder(api_client, spec={'accounts': {
+			'endpoint': "/api/accounts", 'source': "login_data.json", 'key': "valid_users", 'unique_by': "username",
+		}})
+
+		created = seeder.seed("accounts")
+		seeder.cleanup()
+
+		assert [account['username'] for account in created] == ["test@123"]
+
+	@allure.feature("Test Data")
+	@allure.story("Seed and clean up")
+	def test_failed_deletes_stay_for_the_next_cleanup(self, stub_api, api_client, data_seeder):
+		"""A delete the API refuses keeps its id, and the next cleanup removes it"""
+		data_seeder.seed("accounts")
+		stub_api.fail_next = [403]
+
+		with pytest.raises(ApiError):
+			data_seeder.cleanup()
+		assert len(data_seeder.created) == 1
+		assert len(api_client.get("/api/accounts")) == 1
+
+		data_seeder.cleanup()
+		assert data_seeder.created == []
+		assert api_client.get("/api/accounts") == []
+
+	@allure.feature("Test Data")
+	@allure.story("Bulk calls")
+	def test_bulk_calls_reuse_pooled_connections(self, stub_api, api_client):
+		"""Concurrent calls share keep-alive connections instead of opening one each"""
+		connections_before = stub_api.connections
+		results = api_client.bulk(lambda _: api_client.get("/api/accounts"), list(range(40)))
+
+		assert len(results) == 40
+		assert stub_api.connections - connections_before <= api_client.pool_size
+
+	@allure.feature("Test Data")
+	@allure.story("Retries")
+	def test_idempotent_calls_retry_unavailable(self, stub_api, api_client):
+		"""GET is retried through transient 503s"""
+		stub_api.fail_next = [503, 503]
+		assert api_client.get("/api/accounts") == []
+
+	@allure.feature("Test Data")
+	@allure.story("Retries")
+	def test_post_is_not_resent(self, stub_api, api_client):
+		"""A POST the server answered is never sent twice, even with a retry-able status"""
+		stub_api.fail_next = [503]
+		posts_before = stub_api.requests.count(("POST", "/api/accounts"))
+
+		with pytest.raises(ApiError) as error:
+			api_client.post("/api/accounts", json={'username': 'once@example.com'})
+
+		assert error.value.status == 503
+		assert stub_api.requests.count(("POST", "/api/accounts")) == posts_before + 1
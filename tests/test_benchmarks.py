@@ -0,0 +1,42 @@
+import allure
+
+from benchmarks.runner import MIN_DELTA_MS, compare
+
+BASELINE = {
+	'fill_form': {'p50_ms': 40.0, 'round_trips': 1.0},
+	'find_element': {'p50_ms': 4.0, 'round_trips': 1.0},
+}
+
+
+def _result(p50_ms: float, round_trips: float = 1.0) -> dict:
+	return {'p50_ms': p50_ms, 'round_trips': round_trips}
+
+
+@allure.feature("Benchmarks")
+class TestCompare:
+	"""Regression rules applied against the stored baseline"""
+
+	def test_within_tolerance_passes(self):
+		assert compare({'fill_form': _result(47.9)}, BASELINE, tolerance=0.20) == []
+
+	def test_slower_beyond_tolerance_regresses(self):
+		regressions = compare({'fill_form': _result(48.5)}, BASELINE, tolerance=0.20)
+
+		assert len(regressions) == 1
+		assert regressions[0].startswith("fill_form: p50 48.5ms vs baseline 40.0ms")
+
+	def test_small_absolute_slowdown_is_noise(self):
+		"""+50% on a 4 ms operation is still under MIN_DELTA_MS"""
+		assert compare({'find_element': _result(4.0 + MIN_DELTA_MS)}, BASELINE, tolerance=0.20) == []
+		assert compare({'find_element': _result(4.0 + MIN_DELTA_MS + 0.1)}, BASELINE, tolerance=0.20)
+
+	def test_an_extra_round_trip_regresses_even_when_faster(self):
+		regressions = compare({'fill_form': _result(30.0, round_trips=2.0)}, BASELINE, tolerance=0.20)
+
+		assert regressions == ["fill_form: 2.0 round trips per operation vs baseline 1.0"]
+
+	def test_fractional_round_trip_noise_passes(self):
+		assert compare({'fill_form': _result(40.0, round_trips=1.5)}, BASELINE, tolerance=0.20) == []
+
+	def test_operations_without_baseline_are_skipped(self):
+		assert compare({'new_case': _result(500.0, round_trips=9)}, BASELINE, tolerance=0.20) == []
@@ -0,0 +1,136 @@
+from types import SimpleNamespace
+
+import allure
+import pytest
+
+import utils.circuit_breaker as circuit_breaker_module
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+PAGE, TARGET = "LoginPage", "xpath=//button[@type='submit']"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+	"""Controllable time.time() for the breaker module only"""
+	now = SimpleNamespace(value=1000.0)
+	monkeypatch.setattr(circuit_breaker_module, "time", SimpleNamespace(time=lambda: now.value))
+	return now
+
+
+@pytest.fixture
+def state_path(tmp_path):
+	return str(tmp_path / "circuit.json")
+
+
+def _breaker(state_path: str, **kwargs) -> CircuitBreaker:
+	kwargs = dict({'threshold': 2, 'probe_interval': 30, 'health_url': ""}, **kwargs)
+	breaker = CircuitBreaker(**kwargs)
+	breaker.bind(state_path)
+	return breaker
+
+
+def _trip(breaker: CircuitBreaker):
+	for _ in range(breaker.threshold):
+		breaker.record_failure(PAGE, TARGET, "timed out")
+
+
+@allure.feature("Circuit Breaker")
+class TestCircuitBreaker:
+	"""closed -> open -> half-open -> closed/open, with state in a temporary file"""
+
+	def test_opens_after_threshold_consecutive_failures(self, state_path, clock):
+		breaker = _breaker(state_path)
+		breaker.record_failure(PAGE, TARGET, "timed out")
+		breaker.check(PAGE, TARGET)  # one failure is below the threshold
+
+		breaker.record_failure(PAGE, TARGET, "timed out")
+
+		with pytest.raises(CircuitOpenError, match="open"):
+			breaker.check(PAGE, TARGET)
+		assert set(breaker.open_circuits()) == {PAGE, f"{PAGE}:{TARGET}"}
+
+	def test_success_resets_the_streak(self, state_path, clock):
+		breaker = _breaker(state_path)
+		breaker.record_failure(PAGE, TARGET, "timed out")
+		breaker.record_success(PAGE, TARGET)
+		breaker.record_failure(PAGE, TARGET, "timed out")
+
+		breaker.check(PAGE, TARGET)
+		assert breaker.open_circuits() == {}
+
+	def test_half_open_lets_exactly_one_trial_through(self, state_path, clock):
+		breaker, other_worker = _breaker(state_path), _breaker(state_path)
+		_trip(breaker)
+
+		clock.value += 29
+		with pytest.raises(CircuitOpenError):
+			breaker.check(PAGE, TARGET)
+
+		clock.value += 1
+		breaker.check(PAGE, TARGET)  # the trial
+		with pytest.raises(CircuitOpenError, match="half-open"):
+			other_worker.check(PAGE, TARGET)
+
+	def test_successful_trial_closes_the_circuit(self, state_path, clock):
+		breaker, other_worker = _breaker(state_path), _breaker(state_path)
+		_trip(breaker)
+		clock.value += 30
+		breaker.check(PAGE, TARGET)
+
+		breaker.record_success(PAGE, TARGET)
+
+		other_worker.check(PAGE, TARGET)
+		assert other_worker.open_circuits() == {}
+
+	def test_failed_trial_reopens_for_another_interval(self, state_path, clock):
+		breaker = _breaker(state_path)
+		_trip(breaker)
+		clock.value += 30
+		breaker.check(PAGE, TARGET)
+
+		breaker.record_failure(PAGE, TARGET, "still timing out")
+
+		clock.value += 29
+		with pytest.raises(CircuitOpenError, match="still timing out"):
+			breaker.check(PAGE, TARGET)
+		clock.value += 1
+		breaker.check(PAGE, TARGET)
+
+	def test_lost_trial_is_retried_after_an_interval(self, state_path, clock):
+		"""A trial whose process died without reporting does not leave the circuit half-open forever"""
+		breaker, other_worker = _breaker(state_path), _breaker(state_path)
+		_trip(breaker)
+		clock.value += 30
+		breaker.check(PAGE, TARGET)  # never reports back
+
+		clock.value += 30
+		other_worker.check(PAGE, TARGET)
+
+	def test_other_locators_on_the_page_are_held_by_the_page_circuit(self, state_path, clock):
+		breaker = _breaker(state_path)
+		_trip(breaker)
+
+		with pytest.raises(CircuitOpenError):
+			breaker.check(PAGE, "id=username")
+		breaker.check("HomePage", TARGET)
+
+	def test_unhealthy_health_url_keeps_the_circuit_open(self, state_path, clock, stand_in_server):
+		breaker = _breaker(state_path, health_url=f"{stand_in_server.url}/no-such-endpoint")
+		_trip(breaker)
+		clock.value += 30
+
+		with pytest.raises(CircuitOpenError, match="open"):
+			breaker.check(PAGE, TARGET)
+
+		breaker.health_url = f"{stand_in_server.url}/login"
+		with pytest.raises(CircuitOpenError):
+			breaker.check(PAGE, TARGET)  # the failed check used up this interval
+		clock.value += 30
+		breaker.check(PAGE, TARGET)
+
+	def test_disabled_without_state_file(self, clock):
+		breaker = CircuitBreaker(threshold=1, probe_interval=30, health_url="")
+		_trip(breaker)
+
+		breaker.check(PAGE, TARGET)
+		assert breaker.open_circuits() == {}
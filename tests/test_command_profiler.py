@@ -0,0 +1,92 @@
+import json
+from types import SimpleNamespace
+
+import allure
+import pytest
+
+from utils.command_profiler import ACTION, WAIT, CommandProfiler, profile_phase
+
+
+class StubExecutor:
+	"""RemoteConnection stand-in: execute() serializes params and goes through _request()"""
+
+	def __init__(self, responses: dict):
+		self.responses = responses
+
+	def execute(self, command, params):
+		return self._request("POST", f"http://driver/{command}", body=json.dumps(params))
+
+	def _request(self, method, url, body=None):
+		return {'value': self.responses.get(url.rsplit("/", 1)[1])}
+
+
+@pytest.fixture
+def driver():
+	executor = StubExecutor({
+		'findElement': {"element-6066-11e4-a52e-4f735466cecf": "e1"},
+		'executeScript': [{'name': "a", 'value': "x" * 100}, {'name': "b", 'value': "y" * 100}],
+		'getTitle': "Dashboard",
+	})
+	return SimpleNamespace(command_executor=executor)
+
+
+@allure.feature("Command Profiler")
+class TestCommandProfiler:
+	"""Per-command timing, payload size and wait/action split against a stub executor"""
+
+	def test_install_is_idempotent(self, driver):
+		profiler = CommandProfiler.install(driver)
+
+		assert CommandProfiler.install(driver) is profiler
+		driver.command_executor.execute("getTitle", {})
+		assert len(profiler.records) == 1  # wrapped once, recorded once
+
+	def test_records_command_locator_sizes_and_phase(self, driver):
+		profiler = CommandProfiler.install(driver)
+		params = {'using': "css selector", 'value': "#login"}
+
+		driver.command_executor.execute("findElement", params)
+
+		(command, locator, seconds, request_bytes, response_bytes, phase), = profiler.records
+		assert (command, locator, phase) == ("findElement", ("css selector", "#login"), ACTION)
+		assert seconds >= 0
+		assert request_bytes == len(json.dumps(params))
+		assert response_bytes == len('{"value":{"element-6066-11e4-a52e-4f735466cecf":"e1"}}')
+
+	def test_structured_responses_are_sized(self, driver):
+		profiler = CommandProfiler.install(driver)
+
+		driver.command_executor.execute("executeScript", {'script': "return rows()", 'args': []})
+
+		assert profiler.records[0][4] > 200
+
+	def test_commands_inside_profile_phase_count_as_waits(self, driver):
+		profiler = CommandProfiler.install(driver)
+		with profile_phase(driver, WAIT):
+			driver.command_executor.execute("findElement", {'using': "id", 'value': "email"})
+		driver.command_executor.execute("getTitle", {})
+
+		assert [record[5] for record in profiler.records] == [WAIT, ACTION]
+		assert profiler.phase == ACTION
+
+	def test_summary_aggregates_the_current_test(self, driver):
+		profiler = CommandProfiler.install(driver)
+		driver.command_executor.execute("getTitle", {})
+		profiler.reset()
+		with profile_phase(driver, WAIT):
+			driver.command_executor.execute("findElement", {'using': "id", 'value': "email"})
+		driver.command_executor.execute("executeScript", {'script': "return rows()", 'args': []})
+
+		summary = profiler.summary(slowest=1)
+
+		assert (summary['count'], summary['wait_count']) == (2, 1)
+		assert summary['request_bytes'] == sum(record[3] for record in profiler.records)
+		assert summary['response_bytes'] == sum(record[4] for record in profiler.records)
+		assert summary['wait_seconds'] + summary['action_seconds'] == pytest.approx(
+			sum(record[2] for record in profiler.records)
+		)
+		assert len(summary['slowest']) == 1
+
+	def test_profile_phase_without_profiler_is_a_no_op(self):
+		with profile_phase(SimpleNamespace(), WAIT):
+			pass
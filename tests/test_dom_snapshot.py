@@ -0,0 +1,130 @@
+import allure
+import pytest
+from selenium.webdriver.common.by import By
+
+from base.dom_snapshot import DOMSnapshot
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head><title>Fixture</title></head>
+<body>
+<nav class="nav-menu main"><a href="/dashboard" id="home">Dashboard</a> <a href="/search" lang="en-GB">Transactions</a></nav>
+<form id="login" action="/login" method="post">
+<label for="email">Email</label>
+<input type="email" id="email" name="email" placeholder="Email Address" value="a@example.com">
+<input type="password" name="password" placeholder="Password">
+<input type="checkbox" name="remember" checked>
+<input type="text" name="code" disabled>
+<p class="error-message hint" style="display: none">Invalid credentials</p>
+<button type="submit">  Log   In </button>
+</form>
+<ul class="results">
+<li data-id="1">Alpha</li>
+<li data-id="2">Beta <span>new</span></li>
+<li data-id="3">Gamma</li>
+</ul>
+</body>
+</html>
+"""
+
+
+@pytest.fixture(scope="module")
+def page():
+	return DOMSnapshot.from_html(PAGE, "http://localhost/login")
+
+
+def _texts(page, locator):
+	return [node.text for node in page.find_all(locator)]
+
+
+@allure.feature("DOM Snapshot")
+class TestCssSelector:
+	"""CSS subset evaluated against parsed HTML"""
+
+	@pytest.mark.parametrize("selector,expected", [
+		("li", ["Alpha", "Beta new", "Gamma"]),
+		("#home", ["Dashboard"]),
+		(".nav-menu.main > a", ["Dashboard", "Transactions"]),
+		("ul.results li span", ["new"]),
+		("label + input", [""]),
+		("label ~ input[type=checkbox]", [""]),
+		("li[data-id='2']", ["Beta new"]),
+		("a[href^='/dash']", ["Dashboard"]),
+		("a[href$=search]", ["Transactions"]),
+		("a[href*=ash]", ["Dashboard"]),
+		("a[lang|=en]", ["Transactions"]),
+		(".error-message", [""]),
+		("li:first-child, li:last-child", ["Alpha", "Gamma"]),
+		("li:nth-child(2)", ["Beta new"]),
+	])
+	def test_selectors(self, page, selector, expected):
+		assert _texts(page, (By.CSS_SELECTOR, selector)) == expected
+
+	def test_form_state_and_pseudo_classes(self, page):
+		assert page.get_attribute((By.CSS_SELECTOR, "#email"), "value") == "a@example.com"
+		assert page.get_attribute((By.CSS_SELECTOR, "input:checked"), "name") == "remember"
+		assert page.get_attribute((By.CSS_SELECTOR, "input:disabled"), "name") == "code"
+		assert len(page.find_all((By.CSS_SELECTOR, "input:enabled"))) == 3
+
+	def test_hidden_element_is_present_but_not_visible(self, page):
+		assert page.is_present((By.CLASS_NAME, "error-message"))
+		assert not page.is_visible((By.CLASS_NAME, "error-message"))
+
+	@pytest.mark.parametrize("selector", ["li:hover", "li::before", "ul >", ""])
+	def test_unsupported_selectors_raise(self, page, selector):
+		with pytest.raises(ValueError):
+			page.find_all((By.CSS_SELECTOR, selector))
+
+
+@allure.feature("DOM Snapshot")
+class TestXPathExpression:
+	"""XPath subset evaluated against parsed HTML"""
+
+	@pytest.mark.parametrize("expression,expected", [
+		("//li", ["Alpha", "Beta new", "Gamma"]),
+		("//Input[@placeholder='Password']", [""]),
+		("/html/body/ul/li[2]", ["Beta new"]),
+		("//li[@data-id='3']", ["Gamma"]),
+		("//li[span]", ["Beta new"]),
+		("//li[contains(text(), 'Bet')]", ["Beta new"]),
+		("//li[starts-with(., 'Gam')]", ["Gamma"]),
+		("//button[normalize-space()='Log In']", ["Log In"]),
+		("//a[not(@lang)]", ["Dashboard"]),
+		("//a[@id='home' or @lang='en-GB']", ["Dashboard", "Transactions"]),
+		("//li[@data-id!='1' and @data-id!='3']", ["Beta new"]),
+		("//span/..", ["Beta new"]),
+		("//li[1] | //li[3]", ["Alpha", "Gamma"]),
+		("//*[@id='home']", ["Dashboard"]),
+	])
+	def test_expressions(self, page, expression, expected):
+		assert _texts(page, (By.XPATH, expression)) == expected
+
+	@pytest.mark.parametrize("expression,expected", [
+		("//label/following-sibling::input[1]", ["email"]),
+		("//p/preceding-sibling::input[1]", ["code"]),
+		("//input[@name='code']/ancestor::form", ["login"]),
+		("//input[@name='code']/ancestor-or-self::*[1]", ["code"]),
+		("//span/parent::li", ["Beta new"]),
+		("//form/child::input[@type='password']", ["password"]),
+		("/descendant::input[2]", ["password"]),
+		("//form[descendant::button]", ["login"]),
+		("//li/self::li[@data-id='1']", ["Alpha"]),
+		("//ul//descendant-or-self::span", ["new"]),
+	])
+	def test_axes(self, page, expression, expected):
+		nodes = page.find_all((By.XPATH, expression))
+		assert [node.attrs.get("name") or node.attrs.get("id") or node.text for node in nodes] == expected
+
+	@pytest.mark.parametrize("expression", [
+		"//label/following::input",
+		"//li/preceding::a",
+		"//a/attribute::href",
+		"//li/namespace::x",
+		"//li/text()",
+		"//input/@name",
+		"//li[position()=1]",
+		"//li[",
+	])
+	def test_unsupported_expressions_raise(self, page, expression):
+		with pytest.raises(ValueError):
+			page.find_all((By.XPATH, expression))
@@ -0,0 +1,58 @@
+import allure
+import pytest
+from selenium.common.exceptions import InvalidSelectorException, JavascriptException, TimeoutException
+
+from base.dom_wait import ObserverWait
+
+LOCATOR = ("css selector", "#login")
+
+
+class ScriptedDriver:
+	"""Answers execute_async_script from a list of results, raising the exceptions in it"""
+
+	def __init__(self, *results):
+		self.results = list(results)
+		self.calls = 0
+
+	def set_script_timeout(self, seconds):
+		pass
+
+	def execute_async_script(self, script, *args):
+		self.calls += 1
+		result = self.results.pop(0)
+		if isinstance(result, Exception):
+			raise result
+		return result
+
+
+@allure.feature("Observer Wait")
+class TestObserverWait:
+	"""In-page waits: navigation is retried, selector errors surface at once"""
+
+	def test_navigation_mid_wait_observes_the_new_document(self):
+		driver = ScriptedDriver(JavascriptException("javascript error: document unloaded while waiting for result"), "el")
+
+		assert ObserverWait(driver, 5).until(LOCATOR) == "el"
+		assert driver.calls == 2
+
+	@pytest.mark.parametrize("message", [
+		"javascript error: Failed to execute 'querySelectorAll' on 'Document': '#' is not a valid selector.",
+		"javascript error: Failed to execute 'evaluate' on 'Document': The string '//li[' is not a valid XPath expression.",
+		"javascript error: Unsupported locator strategy: shadow",
+	])
+	def test_invalid_locator_raises_without_waiting(self, message):
+		driver = ScriptedDriver(JavascriptException(message))
+
+		with pytest.raises(InvalidSelectorException, match="Invalid locator"):
+			ObserverWait(driver, 5).until(LOCATOR)
+		assert driver.calls == 1
+
+	def test_other_script_errors_propagate(self):
+		driver = ScriptedDriver(JavascriptException("javascript error: Cannot read properties of null"))
+
+		with pytest.raises(JavascriptException, match="null"):
+			ObserverWait(driver, 5).until(LOCATOR)
+
+	def test_no_match_times_out(self):
+		with pytest.raises(TimeoutException, match="not presence"):
+			ObserverWait(ScriptedDriver(None), 5).until(LOCATOR)
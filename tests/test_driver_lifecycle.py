@@ -0,0 +1,218 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import allure
+import pytest
+from urllib3.exceptions import MaxRetryError
+
+from utils.driver_factory import DriverFactory, DriverPrewarmer
+from utils.driver_pool import DriverPool
+from utils.driver_reaper import DriverReaper
+
+
+class FakeDriver:
+	"""Just enough of a WebDriver for pool resets and quits"""
+
+	def __init__(self, fail_with: Exception = None):
+		self.fail_with = fail_with
+		self.window_handles = ["main"]
+		self.switch_to = SimpleNamespace(window=lambda handle: None)
+		self.visited = []
+		self.quits = 0
+		self.startup_seconds = 1.0
+
+	def execute_script(self, script, *args):
+		if self.fail_with:
+			raise self.fail_with
+
+	def delete_all_cookies(self):
+		pass
+
+	def get(self, url):
+		self.visited.append(url)
+
+	def quit(self):
+		self.quits += 1
+
+
+@pytest.fixture
+def launched(monkeypatch):
+	"""Every FakeDriver the factory hands out"""
+	drivers = []
+
+	def get_driver(browser, headless):
+		drivers.append(FakeDriver())
+		return drivers[-1]
+
+	monkeypatch.setattr(DriverFactory, "get_driver", staticmethod(get_driver))
+	return drivers
+
+
+def _pool(**kwargs) -> DriverPool:
+	return DriverPool(browser="chrome", headless=True, **dict({'reuse': True, 'max_uses': 0}, **kwargs))
+
+
+@allure.feature("Driver Pool")
+class TestDriverPool:
+	"""Reuse, recycling and teardown of pooled drivers"""
+
+	def test_released_driver_is_reset_and_reused(self, launched):
+		pool = _pool()
+		driver = pool.acquire()
+		pool.release(driver)
+
+		assert pool.acquire() is driver
+		assert driver.visited == ["about:blank"] and len(launched) == 1
+
+	@pytest.mark.parametrize("error", [
+		MaxRetryError(None, "/session", "connection refused"),
+		IndexError("list index out of range"),
+	])
+	def test_reset_failure_discards_the_driver(self, launched, error):
+		pool = _pool()
+		driver = pool.acquire()
+		driver.fail_with = error
+
+		pool.release(driver)
+
+		assert driver.quits == 1
+		assert pool.acquire() is not driver
+
+	def test_closed_windows_are_discarded(self, launched):
+		pool = _pool()
+		driver = pool.acquire()
+		driver.window_handles = []
+
+		pool.release(driver)
+
+		assert driver.quits == 1
+
+	def test_max_uses_recycles_the_driver(self, launched):
+		pool = _pool(max_uses=2)
+		driver = pool.acquire()
+		pool.release(driver)
+		assert pool.acquire() is driver
+
+		pool.release(driver)
+
+		assert driver.quits == 1
+		assert pool.acquire() is not driver
+
+	def test_close_quits_checked_out_drivers_too(self, launched):
+		pool = _pool()
+		idle, checked_out = pool.acquire(), pool.acquire()
+		pool.release(idle)
+
+		pool.close()
+		pool.release(checked_out)  # the test finishing after close() must not quit it twice
+
+		assert [driver.quits for driver in launched] == [1, 1]
+
+
+@pytest.fixture
+def launches(monkeypatch):
+	"""Drivers the prewarmer creates; each launch waits until `go` is set"""
+	launches = SimpleNamespace(drivers=[], go=threading.Event())
+	launches.go.set()
+
+	def create_driver(browser, headless):
+		launches.go.wait()
+		launches.drivers.append(FakeDriver())
+		return launches.drivers[-1]
+
+	monkeypatch.setattr(DriverFactory, "create_driver", staticmethod(create_driver))
+	return launches
+
+
+def _wait_for(condition, timeout: float = 5):
+	deadline = time.monotonic() + timeout
+	while not condition():
+		assert time.monotonic() < deadline, "condition not met in time"
+		time.sleep(0.01)
+
+
+@allure.feature("Driver Prewarmer")
+class TestDriverPrewarmer:
+	"""Background launches kept ahead of demand"""
+
+	def test_take_hands_out_a_ready_driver_and_refills(self, launches):
+		prewarmer = DriverPrewarmer("chrome", True, 1)
+		prewarmer.start()
+		_wait_for(lambda: len(launches.drivers) == 1)
+
+		assert prewarmer.take() is launches.drivers[0]
+		_wait_for(lambda: len(launches.drivers) == 2)
+		prewarmer.stop()
+
+		assert launches.drivers[1].quits == 1
+
+	def test_take_without_a_ready_driver_returns_none(self, launches):
+		launches.go.clear()
+		prewarmer = DriverPrewarmer("chrome", True, 1)
+		prewarmer.start()
+
+		assert prewarmer.take() is None
+		prewarmer.stop(timeout=0)
+		launches.go.set()
+
+	def test_launch_finishing_after_stop_is_quit(self, launches):
+		launches.go.clear()
+		prewarmer = DriverPrewarmer("chrome", True, 1)
+		prewarmer.start()
+
+		prewarmer.stop(timeout=0.05)  # gives up on the join while the launch is still running
+		launches.go.set()
+		prewarmer._thread.join(5)
+
+		assert [driver.quits for driver in launches.drivers] == [1]
+
+
+class SlowQuitDriver(FakeDriver):
+	"""quit() hangs like a wedged chromedriver; kill() on its service process ends it"""
+
+	def __init__(self):
+		super().__init__()
+		self.killed = threading.Event()
+		self.service = SimpleNamespace(process=SimpleNamespace(kill=self.killed.set, wait=lambda timeout: 0))
+
+	def quit(self):
+		self.killed.wait(5)
+		self.quits += 1
+
+
+@allure.feature("Driver Reaper")
+class TestDriverReaper:
+	"""Sessions quit off the test thread, force-killed when quit overruns"""
+
+	def test_drain_quits_submitted_drivers(self):
+		reaper = DriverReaper(max_pending=4, quit_timeout=1)
+		drivers = [FakeDriver() for _ in range(3)]
+		for driver in drivers:
+			reaper.submit(driver)
+
+		reaper.drain()
+
+		assert [driver.quits for driver in drivers] == [1, 1, 1]
+
+	def test_quit_overrunning_the_timeout_is_killed(self):
+		reaper = DriverReaper(max_pending=4, quit_timeout=0.1)
+		driver = SlowQuitDriver()
+
+		reaper.submit(driver)
+		reaper.drain()
+
+		assert driver.killed.is_set()
+
+	def test_full_queue_quits_inline(self):
+		reaper = DriverReaper(max_pending=1, quit_timeout=0.1)
+		blocker, queued, inline = SlowQuitDriver(), FakeDriver(), FakeDriver()
+		reaper.submit(blocker)
+		_wait_for(lambda: reaper._queue.empty())  # the reaper thread is busy quitting blocker
+		reaper.submit(queued)
+
+		reaper.submit(inline)
+
+		assert inline.quits == 1 and queued.quits == 0
+		reaper.drain()
+		assert queued.quits == 1
@@ -0,0 +1,122 @@
+from types import SimpleNamespace
+
+import allure
+import pytest
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+
+import base.base_page as base_page_module
+from base.base_page import BasePage
+from config.config import config
+
+EMAIL, PASSWORD, SUBMIT = (By.ID, "email"), (By.NAME, "password"), (By.ID, "login")
+
+
+class FakeElement:
+	"""Records the key events and clicks it receives"""
+
+	def __init__(self, name: str, events: list):
+		self.name = name
+		self.events = events
+
+	def clear(self):
+		self.events.append((self.name, "clear"))
+
+	def send_keys(self, text):
+		self.events.append((self.name, "keys", text))
+
+	def click(self):
+		self.events.append((self.name, "click"))
+
+	def is_displayed(self):
+		return True
+
+	def is_enabled(self):
+		return True
+
+
+class FakeDriver:
+	"""Answers the batched fill script with `result` and element lookups with FakeElements"""
+
+	def __init__(self, result: dict = None):
+		self.result = result
+		self.events = []
+		self.scripts = []
+
+	def set_script_timeout(self, seconds):
+		pass
+
+	def execute_async_script(self, script, *args):
+		self.scripts.append(args)
+		return self.result
+
+	def find_element(self, by, value):
+		return FakeElement(value, self.events)
+
+
+@pytest.fixture
+def circuit(monkeypatch):
+	"""Breaker stand-in recording what fill_form reports"""
+	calls = SimpleNamespace(failures=[], successes=[])
+	monkeypatch.setattr(base_page_module, "circuit_breaker", SimpleNamespace(
+		check=lambda page, target: None,
+		record_failure=lambda page, target, reason: calls.failures.append(target),
+		record_success=lambda page, target: calls.successes.append(target),
+	))
+	return calls
+
+
+@pytest.fixture
+def batched(monkeypatch, circuit):
+	monkeypatch.setattr(config, "BATCHED_ACTIONS", True)
+	monkeypatch.setattr(config, "SCREENSHOT_ON_FAILURE", False)
+
+
+@allure.feature("Batched Actions")
+class TestFillForm:
+	"""fill_form with and without BATCHED_ACTIONS, against a fake driver"""
+
+	def test_batched_fill_is_one_script_call(self, batched, circuit):
+		driver = FakeDriver({'missing': [], 'native': [], 'button': None, 'clicked': True})
+
+		BasePage(driver).fill_form({EMAIL: "a@example.com", PASSWORD: "secret"}, submit=SUBMIT)
+
+		(fields, submit, _), = driver.scripts
+		assert [field['text'] for field in fields] == ["a@example.com", "secret"]
+		assert submit == {'by': By.ID, 'value': "login"}
+		assert driver.events == []
+		assert circuit.successes == ["id=email", "name=password", "id=login"]
+
+	def test_native_fields_get_real_key_events_and_a_real_click(self, batched):
+		events = []
+		password, button = FakeElement("password", events), FakeElement("login", events)
+		driver = FakeDriver({'missing': [], 'native': [password], 'button': button, 'clicked': False})
+
+		BasePage(driver).fill_form({EMAIL: "a@example.com", PASSWORD: "secret"}, submit=SUBMIT, native=(PASSWORD,))
+
+		(fields, _, _), = driver.scripts
+		assert [field['native'] for field in fields] == [False, True]
+		assert events == [("password", "clear"), ("password", "keys", "secret"), ("login", "click")]
+
+	def test_missing_elements_record_circuit_failures(self, batched, circuit):
+		driver = FakeDriver({'missing': [1, -1], 'native': [], 'button': None, 'clicked': False})
+
+		with pytest.raises(TimeoutException, match="not ready"):
+			BasePage(driver).fill_form({EMAIL: "a@example.com", PASSWORD: "secret"}, submit=SUBMIT, timeout=1)
+
+		assert circuit.failures == ["name=password", "id=login"]
+		assert circuit.successes == []
+
+	def test_unbatched_types_and_clicks_each_field(self, circuit, monkeypatch):
+		monkeypatch.setattr(config, "BATCHED_ACTIONS", False)
+		monkeypatch.setattr(config, "WAIT_STRATEGY", "webdriver")
+		driver = FakeDriver()
+
+		BasePage(driver).fill_form({EMAIL: "a@example.com", PASSWORD: "secret"}, submit=SUBMIT)
+
+		assert driver.scripts == []
+		assert driver.events == [
+			("email", "clear"), ("email", "keys", "a@example.com"),
+			("password", "clear"), ("password", "keys", "secret"),
+			("login", "click"),
+		]
@@ -0,0 +1,57 @@
+import os
+
+import allure
+import pytest
+
+from base.http_driver import HttpDriver
+from config.config import config
+from pages.pages import HomePage, LoginPage
+from utils.test_data_manager import TestDataManager
+
+pytestmark = pytest.mark.http_only
+
+
+@pytest.fixture
+def login_data():
+	return TestDataManager.load_json(os.path.join(config.TEST_DATA_DIR, "login_data.json"))
+
+
+@pytest.fixture
+def login_page(driver, stand_in_url):
+	page = LoginPage(driver)
+	page.open_login_page()
+	return page
+
+
+@allure.feature("HTTP Driver")
+class TestHttpDriverLogin:
+	"""The login form driven over plain HTTP against the local stand-in server"""
+
+	def test_marker_gives_an_http_driver(self, driver):
+		assert isinstance(driver, HttpDriver)
+
+	@allure.story("Valid login")
+	def test_valid_login_follows_redirect_and_keeps_session_cookie(self, login_page, driver, login_data):
+		"""The form POST is redirected to the dashboard and the session cookie is kept"""
+		user = login_data["valid_users"][0]
+
+		with allure.step("Submit the login form"):
+			login_page.login(user["username"], user["password"])
+
+		with allure.step("Land on the dashboard, logged in"):
+			assert login_page.is_login_successful()
+			assert driver.current_url.endswith("/dashboard")
+			assert HomePage(driver).is_user_logged_in()
+			assert "stand_in_session" in [cookie['name'] for cookie in driver.get_cookies()]
+
+	@allure.story("Invalid login")
+	@pytest.mark.parametrize("index", [0, 1])
+	def test_invalid_login_shows_error_message(self, login_page, driver, login_data, index):
+		"""Bad credentials re-render the form with the .error-message and no session"""
+		user = login_data["invalid_users"][index]
+
+		login_page.login(user["username"], user["password"])
+
+		assert login_page.get_error_message() == user["expected_error"]
+		assert not login_page.is_login_successful()
+		assert driver.get_cookies() == []
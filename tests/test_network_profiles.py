@@ -0,0 +1,39 @@
+import re
+
+import allure
+import pytest
+
+from utils.network_profiles import PROFILES
+from utils.session_cache import LANDING_PATH
+
+ORIGIN = "https://app.example.com"
+
+
+def _blocked(url: str, profile: str) -> bool:
+	"""Network.setBlockedURLs semantics: * matches any run of characters, the rest literally"""
+	return any(
+		re.fullmatch(".*".join(map(re.escape, pattern.split("*"))), url)
+		for pattern in PROFILES[profile]["blocked"]
+	)
+
+
+@allure.feature("Network Profiles")
+class TestNetworkProfiles:
+	"""Which URLs each request-blocking profile stops"""
+
+	@pytest.mark.parametrize("url", [
+		f"{ORIGIN}/static/logo.png",
+		f"{ORIGIN}/static/logo.png?v=3",
+		f"{ORIGIN}/fonts/inter.woff2?display=swap",
+	])
+	def test_media_is_blocked_with_or_without_a_query_string(self, url):
+		assert _blocked(url, "no-media")
+		assert not _blocked(url, "full")
+
+	@pytest.mark.parametrize("url", [f"{ORIGIN}/login", f"{ORIGIN}/static/app.js?v=3", f"{ORIGIN}/api/session"])
+	def test_pages_and_scripts_load_under_no_media(self, url):
+		assert not _blocked(url, "no-media")
+
+	@pytest.mark.parametrize("profile", sorted(PROFILES))
+	def test_session_cache_landing_page_is_never_blocked(self, profile):
+		assert not _blocked(f"{ORIGIN}{LANDING_PATH}", profile)
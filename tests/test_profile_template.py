@@ -0,0 +1,62 @@
+import os
+import threading
+
+import allure
+import pytest
+
+from utils.file_lock import FileLock, FileLockTimeout
+from utils.profile_template import ProfileTemplate
+
+NESTED_INDEX = os.path.join("Default", "Cache", "Cache_Data", "index-dir", "the-real-index")
+CACHE_ENTRY = os.path.join("Default", "Cache", "Cache_Data", "f_000001")
+
+
+def _warm(profile_dir: str, urls: list):
+	for relative_path in (NESTED_INDEX, CACHE_ENTRY, "SingletonLock"):
+		path = os.path.join(profile_dir, relative_path)
+		os.makedirs(os.path.dirname(path), exist_ok=True)
+		with open(path, 'w', encoding='utf-8') as file:
+			file.write("template")
+
+
+@pytest.fixture
+def template(tmp_path):
+	template = ProfileTemplate("chrome", root=str(tmp_path), urls=["http://localhost/login"], max_age_hours=1)
+	template.ensure(_warm)
+	return template
+
+
+@allure.feature("Profile Template")
+class TestProfileTemplate:
+	"""Warmed profile template and its per-session clones"""
+
+	def test_clone_cache_entries_are_private_and_writable(self, template):
+		clone = template.clone()
+		try:
+			for relative_path in (NESTED_INDEX, CACHE_ENTRY):
+				with open(os.path.join(clone, relative_path), 'w', encoding='utf-8') as file:
+					file.write("session")
+				with open(os.path.join(template.profile_dir, relative_path), encoding='utf-8') as file:
+					assert file.read() == "template"
+			assert not os.path.lexists(os.path.join(clone, "SingletonLock"))
+		finally:
+			ProfileTemplate.remove_clone(clone)
+
+	def test_rebuild_waits_for_clones_in_progress(self, template):
+		with FileLock(template.directory, shared=True):
+			with FileLock(template.directory, shared=True, timeout=0.2):
+				pass  # clones share the lock with each other
+			with pytest.raises(FileLockTimeout):
+				FileLock(template.directory, timeout=0.2).acquire()
+
+	def test_clone_waits_for_a_rebuild(self, template, monkeypatch):
+		monkeypatch.setattr(template, "_clone_method", "copy")
+		clones = []
+		with FileLock(template.directory):
+			cloning = threading.Thread(target=lambda: clones.append(template.clone()))
+			cloning.start()
+			cloning.join(0.3)
+			assert cloning.is_alive() and not clones
+		cloning.join(5)
+		assert clones
+		ProfileTemplate.remove_clone(clones[0])
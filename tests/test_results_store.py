@@ -0,0 +1,295 @@
+import json
+import sqlite3
+import threading
+
+import allure
+import pytest
+
+from config.config import config
+from reports.duration_model import DurationModel, fast_feedback_order, list_makespan, lpt_partition
+from reports.result_shards import ResultShardWriter, iter_shard_results
+from reports.results_db import ResultsDB, current_environment, error_signature, percentile
+
+
+def _result(nodeid: str, status: str = 'PASSED', duration: float = 1.0, error: str = '') -> dict:
+	return {'nodeid': nodeid, 'status': status, 'duration': duration, 'error_message': error,
+	        'worker': 'gw0', 'browser': 'chrome'}
+
+
+@pytest.fixture
+def results_db(tmp_path):
+	db = ResultsDB(str(tmp_path / "results.db"))
+	yield db
+	db.close()
+
+
+def _record_runs(db: ResultsDB, nodeid: str, runs):
+	"""One run per (status, duration), oldest first"""
+	for number, (status, duration) in enumerate(runs):
+		db.record(f"run{number}", _result(nodeid, status, duration))
+
+
+@allure.feature("Results Store")
+class TestResultsDB:
+	"""SQLite result history shared by the xdist workers"""
+
+	def test_uses_write_ahead_log(self, results_db):
+		connection = sqlite3.connect(results_db.path)
+		try:
+			assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+		finally:
+			connection.close()
+
+	def test_history_is_newest_first_with_error_signature(self, results_db):
+		results_db.record("run1", _result("t.py::a", duration=2.0))
+		results_db.record("run2", _result("t.py::a", 'FAILED', 3.0, "E   TimeoutException: waited 20.5s for 0x7f3a"))
+
+		history = results_db.history("t.py::a")
+
+		assert [row['run_id'] for row in history] == ["run2", "run1"]
+		assert history[0]['error_signature'] == "TimeoutException: waited Ns for N"
+		assert results_db.run_count() == 2
+
+	def test_concurrent_writers_share_one_file(self, results_db):
+		"""Each worker has its own connection; WAL and the busy timeout serialise their writes"""
+		def worker(number: int):
+			db = ResultsDB(results_db.path)
+			try:
+				for index in range(25):
+					db.record(f"run{number}", _result(f"t.py::w{number}_{index}"))
+			finally:
+				db.close()
+
+		threads = [threading.Thread(target=worker, args=(number,)) for number in range(4)]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+
+		assert results_db.run_count() == 4
+		assert len(results_db.duration_percentiles()) == 100
+
+	def test_duration_percentiles_use_last_window_and_skip_skipped(self, results_db):
+		_record_runs(results_db, "t.py::slow", [('PASSED', 100.0)] + [('PASSED', float(n)) for n in range(1, 6)])
+		results_db.record("run9", _result("t.py::slow", 'SKIPPED', 0.0))
+
+		stats = results_db.duration_percentiles(window=5)["t.py::slow"]
+
+		assert stats['runs'] == 5
+		assert stats['p50'] == 3.0
+		assert stats['latest'] == 5.0
+
+	def test_flakiness_counts_flips(self, results_db):
+		_record_runs(results_db, "t.py::flaky", [('PASSED', 1), ('FAILED', 1), ('PASSED', 1), ('FAILED', 1)])
+		_record_runs(results_db, "t.py::stable", [('PASSED', 1)] * 4)
+
+		scores = results_db.flakiness()
+
+		assert scores["t.py::flaky"]['flips'] == 3
+		assert scores["t.py::flaky"]['score'] == 1.0
+		assert scores["t.py::flaky"]['last_status'] == 'FAILED'
+		assert scores["t.py::stable"]['score'] == 0.0
+
+	def test_flakiness_per_environment(self, results_db, monkeypatch):
+		monkeypatch.setattr(config, "RESULTS_ENVIRONMENT", "staging")
+		_record_runs(results_db, "t.py::a", [('PASSED', 1), ('FAILED', 1)])
+		monkeypatch.setattr(config, "RESULTS_ENVIRONMENT", "local")
+		_record_runs(results_db, "t.py::a", [('PASSED', 1)] * 2)
+
+		assert results_db.flakiness(environment="local")["t.py::a"]['flips'] == 0
+		assert results_db.flakiness(environment="staging")["t.py::a"]['last_status'] == 'FAILED'
+
+	def test_report_history(self, results_db):
+		assert results_db.report_history() is None
+
+		_record_runs(results_db, "t.py::slow", [('PASSED', 10.0), ('PASSED', 10.0), ('PASSED', 20.0)])
+		_record_runs(results_db, "t.py::fast", [('PASSED', 1.0), ('FAILED', 1.0), ('PASSED', 1.0)])
+		history = results_db.report_history()
+
+		assert [trend['nodeid'] for trend in history['slowest']] == ["t.py::slow", "t.py::fast"]
+		assert history['slowest'][0]['change'] == 1.0
+		assert [score['nodeid'] for score in history['flaky']] == ["t.py::fast"]
+
+	def test_locator_latency_percentiles_per_environment(self, results_db):
+		results_db.record_locator_latencies(
+			[("staging", "LoginPage", "xpath=//button", "visible", seconds) for seconds in (0.1, 0.2, 0.3, 0.4, 0.5)]
+		)
+		results_db.record_locator_latencies([("local", "LoginPage", "xpath=//button", "visible", 0.01)])
+
+		stats = results_db.locator_latency_percentiles(pct=50, window=3)
+
+		assert stats[("staging", "LoginPage", "xpath=//button", "visible")] == {'samples': 3, 'seconds': 0.4}
+		assert stats[("local", "LoginPage", "xpath=//button", "visible")] == {'samples': 1, 'seconds': 0.01}
+
+	def test_duration_percentiles_per_environment(self, results_db, monkeypatch):
+		monkeypatch.setattr(config, "RESULTS_ENVIRONMENT", "local")
+		_record_runs(results_db, "t.py::a", [('PASSED', 0.2)] * 3)
+		monkeypatch.setattr(config, "RESULTS_ENVIRONMENT", "staging")
+		_record_runs(results_db, "t.py::a", [('PASSED', 6.0)] * 3)
+
+		assert results_db.duration_percentiles(environment="local")["t.py::a"]['p50'] == 0.2
+		assert results_db.duration_percentiles(environment="staging")["t.py::a"]['p50'] == 6.0
+		assert results_db.duration_percentiles()["t.py::a"]['runs'] == 6
+
+	def test_migrates_database_without_environment_column(self, tmp_path):
+		path = str(tmp_path / "results.db")
+		connection = sqlite3.connect(path)
+		connection.executescript(
+			"CREATE TABLE results (id INTEGER PRIMARY KEY, run_id TEXT NOT NULL, nodeid TEXT NOT NULL,"
+			" status TEXT NOT NULL, duration REAL NOT NULL, error_signature TEXT, worker TEXT, browser TEXT,"
+			" recorded_at REAL NOT NULL);"
+			"INSERT INTO results (run_id, nodeid, status, duration, recorded_at) VALUES ('old', 't.py::a', 'PASSED', 9, 0);"
+		)
+		connection.commit()
+		connection.close()
+
+		db = ResultsDB(path)
+		try:
+			db.record("new", _result("t.py::a", duration=1.0))
+			assert db.duration_percentiles(environment="")["t.py::a"]['p50'] == 9
+			assert db.duration_percentiles(environment=current_environment())["t.py::a"]['p50'] == 1.0
+		finally:
+			db.close()
+
+	def test_record_failure_is_logged_not_raised(self, tmp_path):
+		db = ResultsDB(str(tmp_path / "results.db"))
+		db._connection.execute("DROP TABLE results")
+		db.record("run1", _result("t.py::a"))  # must not fail the test being reported
+		db.close()
+
+
+@allure.feature("Results Store")
+class TestHelpers:
+
+	@pytest.mark.parametrize("mode,base_url,label,expected", [
+		("remote", "https://business.woven.finance/login", "", "business.woven.finance"),
+		("remote", "https://business.staging.woven.finance/login", "", "business.staging.woven.finance"),
+		("local", "http://127.0.0.1:8765/login", "", "local"),
+		("remote", "http://localhost:40123/login", "", "local"),
+		("remote", "https://business.woven.finance/login", "prod-eu", "prod-eu"),
+	])
+	def test_current_environment(self, monkeypatch, mode, base_url, label, expected):
+		monkeypatch.setattr(config, "BASE_URL_MODE", mode)
+		monkeypatch.setattr(config, "PROD_BASE_URL", base_url)
+		monkeypatch.setattr(config, "RESULTS_ENVIRONMENT", label)
+		assert current_environment() == expected
+
+	@pytest.mark.parametrize("values,pct,expected", [
+		([], 50, 0.0),
+		([4.0], 95, 4.0),
+		([1.0, 2.0, 3.0, 4.0], 50, 2.5),
+		([1.0, 2.0, 3.0, 4.0, 5.0], 90, 4.6),
+	])
+	def test_percentile(self, values, pct, expected):
+		assert percentile(values, pct) == pytest.approx(expected)
+
+	def test_error_signature_prefers_exception_line(self):
+		message = "tests/test_login.py:42: in test_valid_login\n    login_page.login()\nE   AssertionError: got 3 items"
+		assert error_signature(message) == "AssertionError: got N items"
+		assert error_signature("") == ''
+
+
+@allure.feature("Results Store")
+class TestResultShards:
+	"""Per-process JSON-lines shards merged by the controller"""
+
+	def test_merges_every_worker_shard(self, tmp_path):
+		for worker in ("gw1", "gw0"):
+			writer = ResultShardWriter(str(tmp_path), worker)
+			writer.append(_result(f"t.py::{worker}_a"))
+			writer.append(_result(f"t.py::{worker}_b"))
+			writer.close()
+
+		nodeids = [result['nodeid'] for result in iter_shard_results(str(tmp_path))]
+
+		assert nodeids == ["t.py::gw0_a", "t.py::gw0_b", "t.py::gw1_a", "t.py::gw1_b"]
+
+	def test_results_are_on_disk_before_close(self, tmp_path):
+		writer = ResultShardWriter(str(tmp_path), "gw0")
+		writer.append(_result("t.py::a"))
+		try:
+			assert [result['nodeid'] for result in iter_shard_results(str(tmp_path))] == ["t.py::a"]
+		finally:
+			writer.close()
+
+	def test_skips_line_cut_short_by_a_crash(self, tmp_path):
+		writer = ResultShardWriter(str(tmp_path), "gw0")
+		writer.append(_result("t.py::a"))
+		writer.close()
+		with open(writer.path, 'a', encoding='utf-8') as file:
+			file.write('{"nodeid": "t.py::b", "sta')
+
+		assert [result['nodeid'] for result in iter_shard_results(str(tmp_path))] == ["t.py::a"]
+
+	def test_missing_directory_yields_nothing(self, tmp_path):
+		assert list(iter_shard_results(str(tmp_path / "absent"))) == []
+
+
+@allure.feature("Results Store")
+class TestDurationModel:
+	"""Duration predictions and the partitioning built on them"""
+
+	def test_unknown_tests_fall_back_to_relatives(self):
+		model = DurationModel(history={
+			"a.py::test_x[1]": 4.0,
+			"a.py::test_x[2]": 6.0,
+			"a.py::test_y": 10.0,
+			"b.py::test_z": 1.0,
+		})
+
+		assert model.predict("a.py::test_y") == 10.0
+		assert model.predict("a.py::test_x[3]") == 5.0
+		assert model.predict("a.py::test_new") == 6.0
+		assert model.predict("c.py::test_new") == 5.0
+		assert DurationModel(history={}).predict("a.py::test_x") == DurationModel.DEFAULT_SECONDS
+
+	def test_export_round_trip(self, tmp_path):
+		path = str(tmp_path / "durations.json")
+		DurationModel(history={"a.py::test_x": 2.5}).export(path)
+
+		with open(path, encoding='utf-8') as file:
+			assert json.load(file) == {"a.py::test_x": 2.5}
+		assert DurationModel.from_file(path).predict("a.py::test_x") == 2.5
+
+	def test_loads_p50_of_its_environment_from_results_db(self, tmp_path, monkeypatch):
+		monkeypatch.setattr(config, "RESULTS_DB", str(tmp_path / "results.db"))
+		db = ResultsDB()
+		monkeypatch.setattr(config, "RESULTS_ENVIRONMENT", "local")
+		_record_runs(db, "a.py::test_x", [('PASSED', 0.1)] * 3)
+		monkeypatch.setattr(config, "RESULTS_ENVIRONMENT", "staging")
+		_record_runs(db, "a.py::test_x", [('PASSED', 1.0), ('PASSED', 3.0), ('PASSED', 8.0)])
+		db.close()
+
+		assert DurationModel().predict("a.py::test_x") == 3.0
+		assert DurationModel(environment="local").predict("a.py::test_x") == 0.1
+
+	def test_lpt_partition_balances_and_is_deterministic(self):
+		estimates = {"a": 10.0, "b": 9.0, "c": 1.0, "d": 1.0, "e": 5.0, "f": 4.0}
+
+		partition = lpt_partition(estimates, 2)
+
+		assert partition == [["a", "f", "c"], ["b", "e", "d"]]
+		assert [sum(estimates[key] for key in part) for part in partition] == [15.0, 15.0]
+		assert lpt_partition(dict(reversed(list(estimates.items()))), 2) == partition
+
+	def test_lpt_partition_with_more_bins_than_tests(self):
+		assert lpt_partition({"a": 1.0}, 3) == [["a"], [], []]
+
+	def test_list_makespan(self):
+		assert list_makespan([10, 9, 1, 1], 2) == 11
+		assert list_makespan([1, 1, 9, 10], 2) == 11
+		assert list_makespan([1, 1, 10, 9], 2) == 11
+		assert list_makespan([5, 5], 0) == 10
+
+	def test_fast_feedback_order(self, tmp_path, monkeypatch):
+		monkeypatch.setattr(config, "RESULTS_DB", str(tmp_path / "results.db"))
+		db = ResultsDB()
+		_record_runs(db, "t.py::failed", [('PASSED', 9.0), ('FAILED', 9.0)])
+		_record_runs(db, "t.py::flaky", [('FAILED', 5.0), ('PASSED', 5.0)])
+		_record_runs(db, "t.py::slow", [('PASSED', 7.0), ('PASSED', 7.0)])
+		_record_runs(db, "t.py::fast", [('PASSED', 0.5), ('PASSED', 0.5)])
+		db.close()
+
+		order = fast_feedback_order(["t.py::slow", "t.py::fast", "t.py::flaky", "t.py::failed"])
+
+		assert order == ["t.py::failed", "t.py::flaky", "t.py::fast", "t.py::slow"]
@@ -0,0 +1,46 @@
+import io
+import os
+from types import SimpleNamespace
+
+import allure
+import pytest
+
+from config.config import config
+from utils.screenshot_service import ScreenshotService
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def _png(color: str) -> bytes:
+	buffer = io.BytesIO()
+	Image.new("RGB", (64, 48), color).save(buffer, "PNG")
+	return buffer.getvalue()
+
+
+def _driver(png: bytes):
+	return SimpleNamespace(get_screenshot_as_png=lambda: png)
+
+
+@allure.feature("Screenshots")
+class TestScreenshotService:
+	"""Background screenshot writes into the configured directory"""
+
+	def test_directory_is_read_when_capturing(self, tmp_path, monkeypatch):
+		service = ScreenshotService(image_format="png", max_width=0, dedupe_distance=0)
+		monkeypatch.setattr(config, "SCREENSHOTS_DIR", str(tmp_path / "shots"))
+
+		path = service.capture(_driver(_png("red")), "failed")
+		service.flush()
+
+		assert os.path.dirname(path) == str(tmp_path / "shots")
+		assert os.path.isfile(path)
+
+	def test_identical_screenshots_are_stored_once(self, tmp_path):
+		service = ScreenshotService(directory=str(tmp_path), image_format="png", max_width=0, dedupe_distance=0)
+		png = _png("blue")
+
+		first, second = service.capture(_driver(png), "a"), service.capture(_driver(png), "b")
+		service.flush()
+
+		assert first == second and service.duplicates == 1
+		assert os.listdir(tmp_path) == [os.path.basename(first)]
@@ -1,6 +1,6 @@
 import pytest
 import allure
-from pages.sample_page import HomePage
+from pages.pages import HomePage
 
 
 class TestSearch:
@@ -9,14 +9,14 @@ class TestSearch:
 	@allure.feature("Search")
 	@allure.story("Basic Search")
 	@allure.severity(allure.severity_level.NORMAL)
-	def test_basic_search(self, driver):
+	def test_basic_search(self, logged_in_driver):
 		"""Test basic search functionality"""
-		home_page = HomePage(driver)
+		home_page = HomePage(logged_in_driver)
 
 		search_query = "selenium testing"
 
-		with allure.step("Open home page"):
-			home_page.open()
+		with allure.step("Start from the dashboard the cached session lands on"):
+			assert home_page.is_user_logged_in()
 
 		with allure.step(f"Search for: {search_query}"):
 			home_page.search(search_query)
@@ -28,12 +28,12 @@ class TestSearch:
 	@allure.feature("Search")
 	@allure.story("Empty Search")
 	@allure.severity(allure.severity_level.MINOR)
-	def test_empty_search(self, driver):
+	def test_empty_search(self, logged_in_driver):
 		"""Test search with empty query"""
-		home_page = HomePage(driver)
+		home_page = HomePage(logged_in_driver)
 
-		with allure.step("Open home page"):
-			home_page.open()
+		with allure.step("Start from the dashboard the cached session lands on"):
+			assert home_page.is_user_logged_in()
 
 		with allure.step("Perform empty search"):
 			home_page.search("")
@@ -0,0 +1,102 @@
+import os
+
+import allure
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from base.http_driver import HttpDriver
+from config.config import config
+from pages.pages import HomePage, LoginPage
+from utils.session_cache import SessionCache
+from utils.test_data_manager import TestDataManager
+
+
+def _valid_user() -> dict:
+	return TestDataManager.load_json(os.path.join(config.TEST_DATA_DIR, "login_data.json"))["valid_users"][0]
+
+
+@pytest.fixture
+def http_drivers():
+	"""Fresh HttpDrivers, each with its own cookie jar, quit after the test"""
+	drivers = []
+
+	def new_driver():
+		drivers.append(HttpDriver())
+		return drivers[-1]
+
+	yield new_driver
+	for driver in drivers:
+		driver.quit()
+
+
+@pytest.fixture
+def cache(stand_in_url):
+	user = _valid_user()
+	return SessionCache(user["username"], user["password"])
+
+
+class TestSessionCache:
+	"""Login once, replay the session cookies into other drivers (against the local stand-in server)"""
+
+	@allure.feature("Session Cache")
+	@allure.story("Replay")
+	def test_second_driver_gets_replayed_session(self, cache, http_drivers):
+		"""Only the first driver logs in through the form; the second is handed its cookies"""
+		first, second = http_drivers(), http_drivers()
+
+		with allure.step("Log in through the UI once"):
+			cache.apply(first)
+			assert HomePage(first).is_user_logged_in()
+
+		with allure.step("Replay the session into a fresh driver"):
+			cache.apply(second)
+			assert HomePage(second).is_user_logged_in()
+			assert "dashboard" in second.current_url
+
+		assert (cache.logins, cache.injections) == (1, 1)
+
+	@allure.feature("Session Cache")
+	@allure.story("Stale session")
+	def test_rejected_session_logs_in_again(self, cache, http_drivers, stand_in_server):
+		"""A session the server no longer knows is replaced by one fresh login"""
+		cache.apply(http_drivers())
+		stand_in_server.app.sessions.clear()
+
+		driver = http_drivers()
+		cache.apply(driver)
+
+		assert HomePage(driver).is_user_logged_in()
+		assert (cache.logins, cache.injections) == (2, 0)
+
+	@allure.feature("Session Cache")
+	@allure.story("Failed login")
+	def test_failed_login_disables_cache(self, stand_in_url, http_drivers, monkeypatch):
+		"""Bad credentials fail once, then every later apply fails fast without another login"""
+		monkeypatch.setattr(config, "EXPLICIT_WAIT", 1)  # the dashboard redirect never comes
+		cache = SessionCache(_valid_user()["username"], "wrong-password")
+
+		with pytest.raises(RuntimeError):
+			cache.apply(http_drivers())
+		with pytest.raises(RuntimeError, match="disabled.*Invalid credentials"):
+			cache.apply(http_drivers())
+		assert cache.logins == 1
+
+	@allure.feature("Session Cache")
+	@allure.story("Failed login")
+	def test_transient_login_error_is_retried(self, cache, http_drivers, monkeypatch):
+		"""A one-off page-load timeout does not disable the cache for the rest of the worker"""
+		open_login_page = LoginPage.open_login_page
+
+		def time_out_once(page):
+			monkeypatch.setattr(LoginPage, "open_login_page", open_login_page)
+			raise TimeoutException("Timed out receiving message from renderer")
+
+		monkeypatch.setattr(LoginPage, "open_login_page", time_out_once)
+
+		with pytest.raises(TimeoutException):
+			cache.apply(http_drivers())
+		driver = http_drivers()
+		cache.apply(driver)
+
+		assert HomePage(driver).is_user_logged_in()
+		assert cache.logins == 2
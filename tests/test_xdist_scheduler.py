@@ -0,0 +1,105 @@
+from types import SimpleNamespace
+
+import allure
+import pytest
+
+from reports.duration_model import DurationModel
+from utils.xdist_scheduler import DurationScheduling
+
+DURATIONS = {"t.py::a": 10.0, "t.py::b": 9.0, "t.py::c": 1.0, "t.py::d": 1.0}
+
+
+class MockNode:
+	"""Stands in for an xdist WorkerController: records what it is sent"""
+
+	def __init__(self, name: str):
+		self.gateway = SimpleNamespace(id=name)
+		self.sent = []
+		self.shutting_down = False
+
+	def send_runtest_some(self, indices):
+		self.sent.extend(indices)
+
+	def shutdown(self):
+		self.shutting_down = True
+
+	def __repr__(self):
+		return f"<MockNode {self.gateway.id}>"
+
+
+def _scheduler(workers: int, durations=DURATIONS, **kwargs):
+	config = SimpleNamespace(getvalue=lambda name: [f"{workers}*popen"], getoption=lambda name: None)
+	scheduler = DurationScheduling(config, model=DurationModel(history=dict(durations)), **kwargs)
+	nodes = [MockNode(f"gw{number}") for number in range(workers)]
+	for node in nodes:
+		scheduler.add_node(node)
+		scheduler.add_node_collection(node, list(durations))
+	scheduler.schedule()
+	return scheduler, nodes
+
+
+def _names(scheduler, indices):
+	return [scheduler.collection[index].split("::")[1] for index in indices]
+
+
+@allure.feature("Duration Scheduling")
+class TestDurationScheduling:
+	"""Longest-first dispatch across mock xdist nodes"""
+
+	def test_initial_tests_are_dealt_round_robin(self):
+		scheduler, (first, second) = _scheduler(2)
+
+		assert _names(scheduler, first.sent) == ["a", "c"]
+		assert _names(scheduler, second.sent) == ["b", "d"]
+		assert scheduler.predicted_makespan == 11.0
+
+	def test_remaining_tests_go_to_the_node_that_frees_up(self):
+		durations = dict(DURATIONS, **{"t.py::e": 5.0, "t.py::f": 4.0})
+		scheduler, (first, second) = _scheduler(2, durations)
+		assert _names(scheduler, first.sent) == ["a", "e"]
+		assert _names(scheduler, second.sent) == ["b", "f"]
+
+		scheduler.mark_test_complete(second, second.sent[0])
+
+		assert _names(scheduler, second.sent) == ["b", "f", "c"]
+		assert _names(scheduler, first.sent) == ["a", "e"]
+
+	def test_keep_order_dispatches_collection_order(self):
+		scheduler, (first, second) = _scheduler(2, {"t.py::c": 1.0, "t.py::a": 10.0, "t.py::b": 9.0}, keep_order=True)
+
+		assert _names(scheduler, first.sent) == ["c", "b"]
+		assert _names(scheduler, second.sent) == ["a"]
+
+	def test_crashed_node_tests_are_requeued_longest_first(self):
+		durations = {"t.py::a": 10.0, "t.py::b": 9.0, "t.py::c": 8.0, "t.py::d": 7.0, "t.py::e": 1.0, "t.py::f": 0.5}
+		scheduler, (first, second) = _scheduler(2, durations)
+		assert _names(scheduler, first.sent) == ["a", "c"]
+		# second finished b and started on d when it crashed; f is left in the queue
+		scheduler.mark_test_complete(second, second.sent[0])
+		assert _names(scheduler, second.sent) == ["b", "d", "e"]
+		scheduler.node2pending[first].remove(first.sent[0])
+
+		crashed = scheduler.remove_node(second)
+
+		assert crashed == "t.py::d"
+		# e (1.0s) was re-dispatched ahead of f (0.5s), not appended behind it
+		assert _names(scheduler, first.sent) == ["a", "c", "e"]
+		assert _names(scheduler, scheduler.pending) == ["f"]
+
+	def test_nodes_shut_down_once_everything_is_dispatched(self):
+		"""shutdown() lets a node finish what it holds, so idle and busy nodes alike are told at once"""
+		scheduler, nodes = _scheduler(3, {"t.py::a": 1.0})
+
+		assert [node.sent for node in nodes] == [[0], [], []]
+		assert all(node.shutting_down for node in nodes)
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_every_test_is_dispatched_once(workers):
+	scheduler, nodes = _scheduler(workers)
+	while any(scheduler.node2pending[node] for node in nodes):
+		for node in nodes:
+			if scheduler.node2pending[node]:
+				scheduler.mark_test_complete(node, scheduler.node2pending[node][0])
+
+	assert sorted(index for node in nodes for index in node.sent) == list(range(len(DURATIONS)))
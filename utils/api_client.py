@@ -0,0 +1,116 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List
+from urllib.parse import urljoin, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.config import config
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Statuses that mean the request was not processed and is safe to send again
+_RETRY_STATUSES = (429, 502, 503, 504)
+
+
+class ApiError(Exception):
+	"""Raised for an API response that is still an error after retries"""
+
+	def __init__(self, method: str, url: str, status: int, body: str):
+		super().__init__(f"{method} {url} returned {status}: {body[:200]}")
+		self.status = status
+		self.body = body
+
+
+def default_api_url() -> str:
+	"""API_BASE_URL, or the origin of the application under test"""
+	if config.API_BASE_URL:
+		return config.API_BASE_URL
+	parts = urlsplit(config.PROD_BASE_URL)
+	return f"{parts.scheme}://{parts.netloc}"
+
+
+class ApiClient:
+	"""JSON API client on one keep-alive connection pool, for setting up test state without the UI
+
+	Connection errors are retried for every method. Retry-able statuses and read errors
+	are retried only for idempotent methods, with exponential backoff (honouring
+	Retry-After). A POST that reached the server is therefore never sent twice.
+	"""
+
+	def __init__(self, base_url: str = None, token: str = None, pool_size: int = None, retries: int = None,
+	             backoff: float = None, timeout: float = None):
+		self.base_url = (base_url or default_api_url()).rstrip("/") + "/"
+		self.timeout = timeout or config.API_TIMEOUT
+		self.pool_size = pool_size or config.API_POOL_SIZE
+		retry = Retry(
+			total=config.API_RETRIES if retries is None else retries,
+			backoff_factor=config.API_RETRY_BACKOFF if backoff is None else backoff,
+			status_forcelist=_RETRY_STATUSES,
+			allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+			raise_on_status=False,
+		)
+		# pool_block: concurrent callers beyond pool_size wait for a connection instead of opening throwaway ones
+		adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=retry, pool_block=True)
+		self.session = requests.Session()
+		self.session.mount("http://", adapter)
+		self.session.mount("https://", adapter)
+		self.session.headers["Accept"] = "application/json"
+		token = token if token is not None else config.API_TOKEN
+		if token:
+			self.session.headers["Authorization"] = f"Bearer {token}"
+		self.calls = 0
+		self.seconds = 0.0
+		self._lock = threading.Lock()
+
+	def request(self, method: str, path: str, expected: Iterable[int] = (), **kwargs) -> Any:
+		"""Send one request and return its decoded JSON body (None when empty)
+
+		Statuses listed in expected are returned as None instead of raising, e.g. 404 on cleanup.
+		"""
+		url = urljoin(self.base_url, path.lstrip("/"))
+		started = time.perf_counter()
+		response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+		with self._lock:
+			self.calls += 1
+			self.seconds += time.perf_counter() - started
+		if response.status_code in expected:
+			return None
+		if response.status_code >= 400:
+			raise ApiError(method, url, response.status_code, response.text)
+		if not response.content:
+			return None
+		return response.json()
+
+	def get(self, path: str, **kwargs) -> Any:
+		return self.request("GET", path, **kwargs)
+
+	def post(self, path: str, json: Any = None, **kwargs) -> Any:
+		return self.request("POST", path, json=json, **kwargs)
+
+	def put(self, path: str, json: Any = None, **kwargs) -> Any:
+		return self.request("PUT", path, json=json, **kwargs)
+
+	def delete(self, path: str, **kwargs) -> Any:
+		return self.request("DELETE", path, **kwargs)
+
+	def bulk(self, call: Callable[[Any], Any], items: List[Any], workers: int = None) -> List[Any]:
+		"""call(item) for independent items concurrently; results in item order, first error re-raised"""
+		if not items:
+			return []
+		workers = min(workers or self.pool_size, len(items))
+		if workers == 1:
+			return [call(item) for item in items]
+		with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="api-bulk") as executor:
+			futures = [executor.submit(call, item) for item in items]
+			return [future.result() for future in futures]
+
+	def stats(self) -> Dict[str, float]:
+		return {'calls': self.calls, 'seconds': self.seconds}
+
+	def close(self):
+		self.session.close()
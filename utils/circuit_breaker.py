@@ -0,0 +1,164 @@
+import copy
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+import requests
+
+from config.config import config
+from utils.file_lock import FileLock
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+
+class CircuitOpenError(Exception):
+	"""Raised instead of waiting out a timeout that recent failures say is hopeless"""
+
+
+class CircuitBreaker:
+	"""Consecutive-failure counters per page and per page locator, shared by all xdist workers
+
+	State lives in one JSON file replaced atomically under a file lock. Once a page or
+	locator fails `threshold` times in a row its circuit opens and further waits on it fail
+	immediately. After `probe_interval` seconds the circuit goes half-open: exactly one
+	caller is let through, so the wait that failed is itself the probe. Its success closes
+	the circuit and its failure re-opens it for another interval. When `health_url` is set,
+	that endpoint must also answer with a success status before the trial is let through.
+	"""
+
+	def __init__(self, threshold: int = None, probe_interval: float = None, health_url: str = None):
+		self.threshold = config.CIRCUIT_BREAKER_THRESHOLD if threshold is None else threshold
+		self.probe_interval = config.CIRCUIT_BREAKER_PROBE_INTERVAL if probe_interval is None else probe_interval
+		self.health_url = config.CIRCUIT_BREAKER_HEALTH_URL if health_url is None else health_url
+		self.state_path: Optional[str] = None
+		self._state: Dict = {'circuits': {}}
+		self._signature = None
+		self._lock = threading.Lock()
+
+	@property
+	def enabled(self) -> bool:
+		return bool(self.threshold and self.state_path)
+
+	def bind(self, state_path: str):
+		"""Share state through state_path, normally one file per test run"""
+		self.state_path = state_path
+		self._signature = None
+
+	def check(self, page: str, target: str):
+		"""Raise CircuitOpenError if the page or this locator on it has tripped, unless this call is the trial"""
+		if not self.enabled:
+			return
+		keys = (page, f"{page}:{target}")
+		circuits = self._read()['circuits']
+		tripped = [key for key in keys if circuits.get(key, {}).get('state', CLOSED) != CLOSED]
+		if not tripped or self._admit_trial(tripped):
+			return
+		circuit = circuits[tripped[-1]]
+		raise CircuitOpenError(
+			f"Circuit {circuit['state']} for {tripped[-1]} after {circuit['failures']} consecutive failures "
+			f"(last: {circuit['reason']}); not waiting for {target}"
+		)
+
+	def record_failure(self, page: str, target: str, reason: str):
+		if not self.enabled:
+			return
+		with self._update() as state:
+			circuits = state['circuits']
+			for key in (page, f"{page}:{target}"):
+				circuit = circuits.setdefault(key, {'failures': 0, 'state': CLOSED})
+				circuit['failures'] += 1
+				circuit['reason'] = reason
+				if circuit['state'] == HALF_OPEN:
+					logger.error(f"Trial wait on {key} failed, circuit re-opened for {self.probe_interval}s")
+				elif circuit['state'] == CLOSED and circuit['failures'] >= self.threshold:
+					logger.error(f"Circuit breaker tripped for {key} after {circuit['failures']} consecutive failures")
+				else:
+					continue
+				circuit['state'] = OPEN
+				circuit['retry_after'] = time.time() + self.probe_interval
+
+	def record_success(self, page: str, target: str):
+		if not self.enabled:
+			return
+		keys = (page, f"{page}:{target}")
+		# Only take the lock when there is a failure streak to reset
+		if not any(key in self._read()['circuits'] for key in keys):
+			return
+		with self._update() as state:
+			for key in keys:
+				circuit = state['circuits'].pop(key, None)
+				if circuit and circuit['state'] != CLOSED:
+					logger.info(f"Circuit closed for {key}: the trial wait succeeded")
+
+	def open_circuits(self) -> Dict[str, Dict]:
+		if not self.state_path:
+			return {}
+		return {
+			key: circuit for key, circuit in self._read()['circuits'].items() if circuit.get('state', CLOSED) != CLOSED
+		}
+
+	def _admit_trial(self, keys) -> bool:
+		"""Half-open keys for this caller alone once their interval is up; True if it may go ahead"""
+		circuits = self._read()['circuits']
+		if any(circuits[key]['retry_after'] > time.time() for key in keys):
+			return False
+		with self._update() as state:
+			tripped = [state['circuits'][key] for key in keys if state['circuits'].get(key, {}).get('state', CLOSED) != CLOSED]
+			if any(circuit['retry_after'] > time.time() for circuit in tripped):
+				return False  # another process won the trial
+			for circuit in tripped:
+				# Also the deadline for the trial: if its process dies, another one gets a turn
+				circuit['state'] = HALF_OPEN
+				circuit['retry_after'] = time.time() + self.probe_interval
+		if self.health_url and not self._healthy():
+			with self._update() as state:
+				for key in keys:
+					if key in state['circuits']:
+						state['circuits'][key]['state'] = OPEN
+			return False
+		logger.info(f"Circuit half-open for {', '.join(keys)}: letting one trial wait through")
+		return True
+
+	def _healthy(self) -> bool:
+		try:
+			healthy = requests.get(self.health_url, timeout=5).ok
+		except requests.RequestException:
+			healthy = False
+		logger.info(f"Circuit breaker health check of {self.health_url}: {'healthy' if healthy else 'still failing'}")
+		return healthy
+
+	def _read(self) -> Dict:
+		# Re-parse only when another process has replaced the file
+		with self._lock:
+			try:
+				stat = os.stat(self.state_path)
+			except FileNotFoundError:
+				return {'circuits': {}}
+			# Every write replaces the file, so a new inode means new content
+			signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+			if signature != self._signature:
+				with open(self.state_path, encoding='utf-8') as file:
+					self._state = json.load(file)
+				self._signature = signature
+			return self._state
+
+	@contextmanager
+	def _update(self):
+		"""Read-modify-write the shared state under the file lock"""
+		with FileLock(self.state_path):
+			self._signature = None
+			state = copy.deepcopy(self._read())
+			yield state
+			temporary = f"{self.state_path}.{os.getpid()}.tmp"
+			with open(temporary, 'w', encoding='utf-8') as file:
+				json.dump(state, file)
+			os.replace(temporary, self.state_path)
+
+
+circuit_breaker = CircuitBreaker()
@@ -0,0 +1,99 @@
+import heapq
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List
+
+WAIT = "wait"
+ACTION = "action"
+
+_LOCATOR_COMMANDS = {"findElement", "findElements", "findChildElement", "findChildElements"}
+
+
+class CommandProfiler:
+	"""Record every WebDriver command sent through a driver's command executor"""
+
+	def __init__(self, driver):
+		self.driver = driver
+		# (command, locator, seconds, request_bytes, response_bytes, phase)
+		self.records: List[tuple] = []
+		self.phase = ACTION
+		# (request_bytes, response_bytes) of the HTTP exchange behind each thread's current command
+		self._sizes: Dict[int, tuple] = {}
+		self._lock = threading.Lock()
+
+		executor = driver.command_executor
+		self._execute = executor.execute
+		self._request = executor._request
+		executor.execute = self._timed_execute
+		executor._request = self._sized_request
+
+	@classmethod
+	def install(cls, driver) -> "CommandProfiler":
+		"""Attach a profiler to driver once and return it"""
+		profiler = getattr(driver, "command_profiler", None)
+		if profiler is None:
+			profiler = cls(driver)
+			driver.command_profiler = profiler
+		return profiler
+
+	def reset(self):
+		"""Start a fresh recording, e.g. at the beginning of a test"""
+		with self._lock:
+			self.records = []
+		self.phase = ACTION
+
+	def _sized_request(self, method, url, body=None):
+		response = self._request(method, url, body=body)
+		# _request hands back the decoded JSON body; its compact serialization is the wire size
+		response_bytes = len(json.dumps(response, separators=(",", ":"))) if response else 0
+		with self._lock:
+			self._sizes[threading.get_ident()] = (len(body) if body else 0, response_bytes)
+		return response
+
+	def _timed_execute(self, command, params):
+		locator = None
+		if command in _LOCATOR_COMMANDS and params:
+			locator = (params.get("using"), params.get("value"))
+		started = time.perf_counter()
+		response = self._execute(command, params)
+		elapsed = time.perf_counter() - started
+
+		with self._lock:
+			request_bytes, response_bytes = self._sizes.pop(threading.get_ident(), (0, 0))
+			self.records.append((command, locator, elapsed, request_bytes, response_bytes, self.phase))
+		return response
+
+	def summary(self, slowest: int = 5) -> Dict:
+		"""Aggregate the current recording into counts, wait/action split and slowest commands"""
+		with self._lock:
+			records = list(self.records)
+		wait_seconds = sum(record[2] for record in records if record[5] == WAIT)
+		action_seconds = sum(record[2] for record in records if record[5] != WAIT)
+		return {
+			'count': len(records),
+			'wait_count': sum(1 for record in records if record[5] == WAIT),
+			'wait_seconds': wait_seconds,
+			'action_seconds': action_seconds,
+			'request_bytes': sum(record[3] for record in records),
+			'response_bytes': sum(record[4] for record in records),
+			'slowest': [
+				{'command': record[0], 'locator': record[1], 'seconds': record[2], 'phase': record[5]}
+				for record in heapq.nlargest(slowest, records, key=lambda record: record[2])
+			],
+		}
+
+
+@contextmanager
+def profile_phase(driver, phase: str):
+	"""Attribute commands issued inside the block to phase (WAIT or ACTION)"""
+	profiler = getattr(driver, "command_profiler", None)
+	if profiler is None:
+		yield
+		return
+	previous, profiler.phase = profiler.phase, phase
+	try:
+		yield
+	finally:
+		profiler.phase = previous
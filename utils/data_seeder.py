@@ -0,0 +1,116 @@
+import os
+import threading
+from typing import Any, Dict, List
+
+from config.config import config
+from utils.api_client import ApiClient
+from utils.logger import setup_logger
+from utils.test_data_manager import TestDataManager
+
+logger = setup_logger(__name__)
+
+
+class DataSeeder:
+	"""Create test records through the API from TestDataManager files, and delete them again
+
+	The seed spec (test_data/seed_data.json by default) maps a resource name to its
+	collection endpoint and a data file in TEST_DATA_DIR, for example
+	{"accounts": {"endpoint": "/api/accounts", "source": "seed_accounts.json", "key": "accounts",
+	"unique_by": "username"}}. Records of one resource are created concurrently, so those
+	sharing a unique_by value are sent once; cleanup deletes everything this seeder created,
+	newest resource first, ignoring records that are already gone.
+	"""
+
+	def __init__(self, client: ApiClient, spec: Dict[str, Dict] = None, spec_file: str = None):
+		self.client = client
+		if spec is None:
+			spec = TestDataManager.load_json(spec_file or os.path.join(config.TEST_DATA_DIR, "seed_data.json"))
+		self.spec = spec
+		self.created: List[tuple] = []  # (resource, id), in creation order
+		self._lock = threading.Lock()
+
+	def records(self, resource: str) -> List[Dict[str, Any]]:
+		"""Records the spec says to seed for resource"""
+		entry = self._entry(resource)
+		source = os.path.join(config.TEST_DATA_DIR, entry['source'])
+		extension = os.path.splitext(source)[1].lower()
+		if extension == ".csv":
+			return TestDataManager.load_csv(source)
+		if extension in (".xlsx", ".xlsm"):
+			return TestDataManager.load_excel(source, entry.get('sheet'))
+		data = TestDataManager.load_json(source)
+		records = data[entry['key']] if entry.get('key') else data
+		records = records if isinstance(records, list) else [records]
+		return self._unique(records, entry['unique_by']) if entry.get('unique_by') else records
+
+	@staticmethod
+	def _unique(records: List[Dict[str, Any]], field: str) -> List[Dict[str, Any]]:
+		"""First record for each value of field; concurrent creates of the same key would conflict"""
+		seen = set()
+		unique = []
+		for record in records:
+			if record.get(field) in seen:
+				logger.warning(f"Skipping duplicate seed record with {field}={record.get(field)!r}")
+				continue
+			seen.add(record.get(field))
+			unique.append(record)
+		return unique
+
+	def seed(self, resource: str, records: List[Dict[str, Any]] = None, **overrides) -> List[Dict[str, Any]]:
+		"""Create records (default: those from the spec) and return the API's responses"""
+		entry = self._entry(resource)
+		records = [dict(record, **overrides) for record in (records if records is not None else self.records(resource))]
+		id_field = entry.get('id_field', 'id')
+
+		def create(record):
+			created = self.client.post(entry['endpoint'], json=record) or {}
+			if id_field in created:
+				with self._lock:
+					self.created.append((resource, created[id_field]))
+			return created
+
+		results = self.client.bulk(create, records)
+		logger.info(f"Seeded {len(results)} {resource}")
+		return results
+
+	def cleanup(self):
+		"""Delete every record this seeder created, newest resource first
+
+		Records whose delete fails stay in created, so a later cleanup can retry them.
+		"""
+		with self._lock:
+			created, self.created = self.created, []
+		by_resource: Dict[str, List[Any]] = {}
+		for resource, record_id in created:
+			by_resource.setdefault(resource, []).append(record_id)
+
+		def delete(endpoint: str, record_id: Any) -> Exception:
+			try:
+				self.client.delete(f"{endpoint}/{record_id}", expected=(404,))
+			except Exception as e:
+				return e
+			return None
+
+		failed = set()
+		failure = None
+		for resource in reversed(list(by_resource)):
+			endpoint = self._entry(resource)['endpoint'].rstrip("/")
+			record_ids = by_resource[resource]
+			errors = self.client.bulk(lambda record_id: delete(endpoint, record_id), record_ids)
+			left = [record_id for record_id, error in zip(record_ids, errors) if error]
+			if left:
+				# Keep cleaning up the other resources, then report the first failure
+				logger.error(f"Failed to delete seeded {resource} {left}: {next(e for e in errors if e)}")
+				failed.update((resource, record_id) for record_id in left)
+				failure = failure or next(e for e in errors if e)
+			else:
+				logger.info(f"Deleted {len(record_ids)} seeded {resource}")
+		if failure:
+			with self._lock:
+				self.created = [record for record in created if record in failed] + self.created
+			raise failure
+
+	def _entry(self, resource: str) -> Dict[str, Any]:
+		if resource not in self.spec:
+			raise KeyError(f"No seed spec for '{resource}' (known: {', '.join(self.spec)})")
+		return self.spec[resource]
@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import time
+from typing import Dict, Optional
+
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.driver_cache import DriverCacheManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+from webdriver_manager.firefox import GeckoDriverManager
+from webdriver_manager.microsoft import EdgeChromiumDriverManager
+
+from config.config import config
+from utils.file_lock import FileLock
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_VERSIONS_FILE = "browser_versions.json"
+_INDEX_FILE = "index.json"
+
+
+# browser -> (webdriver_manager browser type, driver manager)
+_BROWSERS = {
+	"chrome": (ChromeType.GOOGLE, ChromeDriverManager),
+	"edge": (ChromeType.MSEDGE, EdgeChromiumDriverManager),
+	"firefox": ("firefox", GeckoDriverManager),
+}
+
+
+class DriverBinaryResolver:
+	"""Driver executable matching the installed browser, downloaded once per machine
+
+	The installed browser version is probed once and remembered in browser_versions.json
+	for DRIVER_VERSION_RECHECK_HOURS. Drivers are stored content-addressed under
+	blobs/<sha256>/ and found through index.json, keyed by browser, version and platform,
+	so only a miss touches the network, under a per-browser file lock that makes parallel
+	workers wait for the first download instead of repeating it.
+	"""
+
+	def __init__(self, browser: str, cache_dir: str = None, recheck_hours: float = None):
+		self.browser = browser.lower()
+		if self.browser not in _BROWSERS:
+			raise ValueError(f"Unsupported browser: {browser}")
+		self.cache_dir = os.path.abspath(os.path.expanduser(cache_dir or config.DRIVER_CACHE_DIR))
+		self.recheck = (config.DRIVER_VERSION_RECHECK_HOURS if recheck_hours is None else recheck_hours) * 3600
+
+	def resolve(self) -> str:
+		"""Path of a cached driver for the installed browser, downloading it on a miss"""
+		path = self._lookup(self.browser_version())
+		if path:
+			return path
+		with FileLock(os.path.join(self.cache_dir, f"resolve-{self.browser}"), timeout=300):
+			# Another worker may have fetched it while we waited for the lock
+			version = self.browser_version()
+			path = self._lookup(version) or self._download(version)
+		return path
+
+	def browser_version(self) -> str:
+		"""Installed browser version, probed at most once per recheck interval"""
+		versions = self._read_json(_VERSIONS_FILE)
+		known = versions.get(self.browser)
+		if known and time.time() - known['checked_at'] < self.recheck:
+			return known['version']
+
+		version = OperationSystemManager().get_browser_version_from_os(_BROWSERS[self.browser][0]) or "unknown"
+		with FileLock(os.path.join(self.cache_dir, _VERSIONS_FILE)):
+			versions = self._read_json(_VERSIONS_FILE)
+			versions[self.browser] = {'version': version, 'checked_at': time.time()}
+			self._write_json(_VERSIONS_FILE, versions)
+		logger.info(f"Detected {self.browser} {version}")
+		return version
+
+	def invalidate(self):
+		"""Forget the probed browser version, e.g. after the browser updated under us"""
+		with FileLock(os.path.join(self.cache_dir, _VERSIONS_FILE)):
+			versions = self._read_json(_VERSIONS_FILE)
+			if versions.pop(self.browser, None) is not None:
+				self._write_json(_VERSIONS_FILE, versions)
+
+	def _key(self, version: str) -> str:
+		return f"{self.browser}/{version}/{OperationSystemManager().get_os_type()}"
+
+	def _lookup(self, version: str) -> Optional[str]:
+		entry = self._read_json(_INDEX_FILE).get(self._key(version))
+		if entry:
+			path = os.path.join(self.cache_dir, entry)
+			if os.access(path, os.X_OK):
+				return path
+		return None
+
+	def _download(self, version: str) -> str:
+		started = time.perf_counter()
+		staging = tempfile.mkdtemp(prefix="driver-", dir=self.cache_dir)
+		try:
+			manager = _BROWSERS[self.browser][1](cache_manager=DriverCacheManager(root_dir=staging))
+			downloaded = manager.install()
+			with open(downloaded, 'rb') as file:
+				digest = hashlib.sha256(file.read()).hexdigest()
+			entry = os.path.join("blobs", digest, os.path.basename(downloaded))
+			path = os.path.join(self.cache_dir, entry)
+			if not os.path.exists(path):
+				os.makedirs(os.path.dirname(path), exist_ok=True)
+				shutil.move(downloaded, path)
+			os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+		finally:
+			shutil.rmtree(staging, ignore_errors=True)
+
+		with FileLock(os.path.join(self.cache_dir, _INDEX_FILE)):
+			index = self._read_json(_INDEX_FILE)
+			index[self._key(version)] = entry
+			self._write_json(_INDEX_FILE, index)
+		logger.info(f"Cached driver for {self.browser} {version} in {time.perf_counter() - started:.1f}s: {path}")
+		return path
+
+	def _read_json(self, name: str) -> Dict:
+		try:
+			with open(os.path.join(self.cache_dir, name), encoding='utf-8') as file:
+				return json.load(file)
+		except (OSError, ValueError):
+			return {}
+
+	def _write_json(self, name: str, data: Dict):
+		"""Atomic replace, so readers outside the lock never see a half-written file"""
+		os.makedirs(self.cache_dir, exist_ok=True)
+		descriptor, temporary = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+		with os.fdopen(descriptor, 'w', encoding='utf-8') as file:
+			json.dump(data, file, indent=2)
+		os.replace(temporary, os.path.join(self.cache_dir, name))
+
+
+if __name__ == '__main__':
+	# Fill the cache ahead of time, e.g. while building a CI image:
+	#   python -m utils.driver_binaries chrome firefox
+	if len(sys.argv) < 2:
+		sys.exit(f"usage: python -m utils.driver_binaries <{'|'.join(_BROWSERS)}>...")
+	for name in sys.argv[1:]:
+		print(f"{name}: {DriverBinaryResolver(name).resolve()}")
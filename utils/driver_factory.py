@@ -2,17 +2,23 @@ from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.edge.service import Service as EdgeService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import SessionNotCreatedException
 
 import logging
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional
 
+from base.app_idle import AppIdleWait, install_idle_tracker
 from config.config import config
+from utils.command_profiler import CommandProfiler
+from utils.driver_binaries import DriverBinaryResolver
+from utils.network_profiles import apply_network_profile, enable_network_log, supports_profiles
+from utils.profile_template import ProfileTemplate
 
 logger = logging.getLogger(__name__)
 
@@ -20,10 +26,19 @@ logger = logging.getLogger(__name__)
 class DriverFactory:
     """Factory class for creating WebDriver instances"""
 
+    # Startup latency of every session handed out by get_driver
+    startup_records: List[Dict] = []
+    _prewarmer: Optional["DriverPrewarmer"] = None
+    _profile_templates: Dict[str, ProfileTemplate] = {}
+    # Driver executable per browser, resolved once per process
+    _driver_paths: Dict[str, str] = {}
+    _driver_paths_lock = threading.Lock()
+
     @staticmethod
     def create_driver(browser: str = "chrome", headless: bool = False) -> webdriver:
         """Create and return WebDriver instance"""
         driver = None
+        started = time.perf_counter()
 
         try:
             if browser.lower() == "chrome":
@@ -35,12 +50,18 @@ class DriverFactory:
             else:
                 raise ValueError(f"Unsupported browser: {browser}")
 
+            if config.COMMAND_PROFILING:
+                CommandProfiler.install(driver)
+            if config.APP_IDLE_WAIT:
+                install_idle_tracker(driver)
+            driver.network_log = config.NETWORK_PROFILE_STATS and supports_profiles(driver)
+            if config.NETWORK_PROFILE != "full":
+                apply_network_profile(driver, config.NETWORK_PROFILE)
             driver.implicitly_wait(config.IMPLICIT_WAIT)
             driver.set_page_load_timeout(config.PAGE_LOAD_TIMEOUT)
-            # print("WebDriver path:", ChromeDriverManager().install())
-
 
-            logger.info(f"Created {browser} driver successfully")
+            driver.startup_seconds = time.perf_counter() - started
+            logger.info(f"Created {browser} driver successfully in {driver.startup_seconds:.2f}s")
             return driver
 
         except Exception as e:
@@ -50,69 +71,235 @@ class DriverFactory:
             raise
 
     @staticmethod
-    def _create_chrome_driver(headless: bool = False):
+    def get_driver(browser: str = "chrome", headless: bool = False) -> webdriver:
+        """Return a pre-warmed driver when one is ready, otherwise create one"""
+        prewarmer = DriverFactory._prewarmer
+        driver = None
+        if prewarmer and prewarmer.matches(browser, headless):
+            driver = prewarmer.take()
+
+        prewarmed = driver is not None
+        if prewarmed:
+            logger.info(f"Handed out pre-warmed {browser} driver (saved {driver.startup_seconds:.2f}s)")
+        else:
+            driver = DriverFactory.create_driver(browser, headless)
+
+        DriverFactory.startup_records.append({
+            'browser': browser.lower(),
+            'seconds': driver.startup_seconds,
+            'prewarmed': prewarmed,
+        })
+        return driver
+
+    @staticmethod
+    def start_prewarming(browser: str = "chrome", headless: bool = False, count: int = 1) -> None:
+        """Keep ``count`` sessions launched in the background ahead of demand"""
+        if DriverFactory._prewarmer is not None or count <= 0:
+            return
+        DriverFactory._prewarmer = DriverPrewarmer(browser, headless, count)
+        DriverFactory._prewarmer.start()
+
+    @staticmethod
+    def stop_prewarming() -> None:
+        """Stop the background spawner and quit any unused sessions"""
+        prewarmer, DriverFactory._prewarmer = DriverFactory._prewarmer, None
+        if prewarmer:
+            prewarmer.stop()
+
+    @staticmethod
+    def startup_summary() -> Dict:
+        """Summarise recorded startup latencies and time moved off the critical path"""
+        records = DriverFactory.startup_records
+        warm = [r['seconds'] for r in records if r['prewarmed']]
+        cold = [r['seconds'] for r in records if not r['prewarmed']]
+        return {
+            'sessions': len(records),
+            'avg_startup_seconds': (sum(warm) + sum(cold)) / len(records) if records else 0.0,
+            'cold_starts': len(cold),
+            'cold_seconds': sum(cold),
+            'prewarmed': len(warm),
+            'saved_seconds': sum(warm),
+        }
+
+    @staticmethod
+    def quit_driver(driver) -> None:
+        """Quit WebDriver instance, logging instead of raising on failure"""
+        try:
+            driver.quit()
+            logger.info("WebDriver closed successfully")
+        except Exception as e:
+            logger.warning(f"Failed to quit WebDriver cleanly: {str(e)}")
+        profile_dir = getattr(driver, "profile_dir", None)
+        if profile_dir:
+            ProfileTemplate.remove_clone(profile_dir)
+
+    @staticmethod
+    def _driver_path(browser: str) -> str:
+        """Driver executable for browser: DRIVER_PATH, or the machine-wide cache looked up once per process"""
+        if config.DRIVER_PATH:
+            return config.DRIVER_PATH
+        with DriverFactory._driver_paths_lock:
+            if browser not in DriverFactory._driver_paths:
+                DriverFactory._driver_paths[browser] = DriverBinaryResolver(browser).resolve()
+            return DriverFactory._driver_paths[browser]
+
+    @staticmethod
+    def _start_session(browser: str, start: Callable[[str], webdriver.Remote]) -> webdriver.Remote:
+        """Call start(driver_path), re-resolving the driver once if the browser updated since it was cached"""
+        try:
+            return start(DriverFactory._driver_path(browser))
+        except SessionNotCreatedException as e:
+            if config.DRIVER_PATH:
+                raise
+            logger.warning(f"Cached {browser} driver was rejected, checking the browser version again: {str(e)}")
+            with DriverFactory._driver_paths_lock:
+                DriverFactory._driver_paths.pop(browser, None)
+            DriverBinaryResolver(browser).invalidate()
+            return start(DriverFactory._driver_path(browser))
+
+    @staticmethod
+    def _profile_clone(browser: str, headless: bool) -> Optional[str]:
+        """Private clone of the warmed profile template, or None when templates are off"""
+        if not config.PROFILE_TEMPLATE:
+            return None
+        template = DriverFactory._profile_templates.get(browser)
+        if template is None:
+            template = DriverFactory._profile_templates[browser] = ProfileTemplate(browser)
+        template.ensure(lambda profile_dir, urls: DriverFactory._warm_profile(browser, headless, profile_dir, urls))
+        return template.clone()
+
+    @staticmethod
+    def _warm_profile(browser: str, headless: bool, profile_dir: str, urls: List[str]) -> None:
+        """Fill profile_dir's HTTP, code and service-worker caches by loading every url once"""
+        create = DriverFactory._create_chrome_driver if browser == "chrome" else DriverFactory._create_edge_driver
+        driver = create(headless, user_data_dir=profile_dir)
+        try:
+            driver.set_page_load_timeout(config.PAGE_LOAD_TIMEOUT)
+            install_idle_tracker(driver)
+            for url in urls:
+                driver.get(url)
+                AppIdleWait(driver, config.APP_IDLE_TIMEOUT).until_idle(config.APP_IDLE_QUIET_MS)
+        finally:
+            # A clean quit flushes the caches to disk
+            driver.quit()
+
+    @staticmethod
+    def _create_chrome_driver(headless: bool = False, user_data_dir: str = None):
         options = ChromeOptions()
+        profile_dir = None if user_data_dir else DriverFactory._profile_clone("chrome", headless)
+        if user_data_dir or profile_dir:
+            options.add_argument(f"--user-data-dir={user_data_dir or profile_dir}")
         if headless:
             options.add_argument("--headless=new")  # For recent Chrome versions
             options.add_argument("--disable-gpu")
             options.add_argument("--window-size=1920,1080")
-        service = ChromeService("/Users/abatansamuel/Desktop/My_AUTO_WORK/PythonProject2/drivers/chromedriver")
-        return webdriver.Chrome(service=service, options=options)
+        if config.NETWORK_PROFILE_STATS:
+            enable_network_log(options)
+        try:
+            driver = DriverFactory._start_session(
+                "chrome", lambda path: webdriver.Chrome(service=ChromeService(path), options=options)
+            )
+        except Exception:
+            if profile_dir:
+                ProfileTemplate.remove_clone(profile_dir)
+            raise
+        driver.profile_dir = profile_dir
+        return driver
 
     @staticmethod
     def _create_firefox_driver(headless: bool = False):
         options = FirefoxOptions()
         if headless:
             options.add_argument("--headless")
-        service = FirefoxService("/Users/abatansamuel/Desktop/My_AUTO_WORK/PythonProject2/drivers/")
-        return webdriver.Firefox(service=service, options=options)
+        return DriverFactory._start_session(
+            "firefox", lambda path: webdriver.Firefox(service=FirefoxService(path), options=options)
+        )
 
     @staticmethod
-    def _create_edge_driver(headless: bool = False):
+    def _create_edge_driver(headless: bool = False, user_data_dir: str = None):
         options = EdgeOptions()
+        profile_dir = None if user_data_dir else DriverFactory._profile_clone("edge", headless)
+        if user_data_dir or profile_dir:
+            options.add_argument(f"--user-data-dir={user_data_dir or profile_dir}")
         if headless:
             options.add_argument("--headless=new")
             options.add_argument("--disable-gpu")
             options.add_argument("--window-size=1920,1080")
-        service = EdgeService("/Users/abatansamuel/Desktop/My_AUTO_WORK/PythonProject2/drivers/")
-        return webdriver.Edge(service=service, options=options)
-
-
-	# @staticmethod
-	# def _create_chrome_driver(headless: bool) -> webdriver.Chrome:
-	# 	"""Create Chrome WebDriver"""
-	# 	options = ChromeOptions()
-	# 	if headless:
-	# 		options.add_argument("--headless")
-	# 	options.add_argument("--no-sandbox")
-	# 	options.add_argument("--disable-dev-shm-usage")
-	# 	options.add_argument("--disable-gpu")
-	# 	options.add_argument("--window-size=1920,1080")
-
-	# 	service = ChromeService(ChromeDriverManager().install())
-	# 	return webdriver.Chrome(service=service, options=options)
-
-	# @staticmethod
-	# def _create_firefox_driver(headless: bool) -> webdriver.Firefox:
-	# 	"""Create Firefox WebDriver"""
-	# 	options = FirefoxOptions()
-	# 	if headless:
-	# 		options.add_argument("--headless")
-	# 	options.add_argument("--width=1920")
-	# 	options.add_argument("--height=1080")
-
-	# 	service = FirefoxService(GeckoDriverManager().install())
-	# 	return webdriver.Firefox(service=service, options=options)
-
-	# @staticmethod
-	# def _create_edge_driver(headless: bool) -> webdriver.Edge:
-	# 	"""Create Edge WebDriver"""
-	# 	options = EdgeOptions()
-	# 	if headless:
-	# 		options.add_argument("--headless")
-	# 	options.add_argument("--no-sandbox")
-	# 	options.add_argument("--disable-dev-shm-usage")
-	# 	options.add_argument("--window-size=1920,1080")
-
-	# 	service = EdgeService(EdgeChromiumDriverManager().install())
-	# 	return webdriver.Edge(service=service, options=options)
\ No newline at end of file
+        if config.NETWORK_PROFILE_STATS:
+            enable_network_log(options, "ms:loggingPrefs")
+        try:
+            driver = DriverFactory._start_session(
+                "edge", lambda path: webdriver.Edge(service=EdgeService(path), options=options)
+            )
+        except Exception:
+            if profile_dir:
+                ProfileTemplate.remove_clone(profile_dir)
+            raise
+        driver.profile_dir = profile_dir
+        return driver
+
+
+class DriverPrewarmer:
+    """Background spawner that keeps ready-to-use sessions launched ahead of demand"""
+
+    def __init__(self, browser: str, headless: bool, size: int):
+        self.browser = browser.lower()
+        self.headless = headless
+        self.size = size
+        self._ready: "queue.Queue" = queue.Queue()
+        self._wanted = threading.Condition()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="driver-prewarmer", daemon=True)
+
+    def matches(self, browser: str, headless: bool) -> bool:
+        """Check whether sessions from this spawner fit the requested configuration"""
+        return self.browser == browser.lower() and self.headless == headless
+
+    def start(self):
+        self._thread.start()
+        logger.info(f"Pre-warming {self.size} {self.browser} driver(s) in the background")
+
+    def take(self):
+        """Return a ready driver without blocking, or None if none is ready yet"""
+        try:
+            driver = self._ready.get_nowait()
+        except queue.Empty:
+            return None
+        with self._wanted:
+            self._wanted.notify()
+        return driver
+
+    def stop(self, timeout: float = 30):
+        """Stop spawning and quit sessions nobody took"""
+        self._stopped.set()
+        with self._wanted:
+            self._wanted.notify()
+        self._thread.join(timeout)
+        # A launch still running after the join sees _stopped under this lock and quits its own driver
+        with self._wanted:
+            unused = []
+            while not self._ready.empty():
+                unused.append(self._ready.get_nowait())
+        for driver in unused:
+            DriverFactory.quit_driver(driver)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            with self._wanted:
+                while self._ready.qsize() >= self.size and not self._stopped.is_set():
+                    self._wanted.wait()
+            if self._stopped.is_set():
+                return
+
+            try:
+                driver = DriverFactory.create_driver(self.browser, self.headless)
+            except Exception as e:
+                logger.error(f"Pre-warming stopped after failed launch: {str(e)}")
+                return
+
+            with self._wanted:
+                if not self._stopped.is_set():
+                    self._ready.put(driver)
+                    continue
+            DriverFactory.quit_driver(driver)
+            return
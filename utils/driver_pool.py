@@ -0,0 +1,103 @@
+import threading
+from typing import Dict, List
+
+from selenium.common.exceptions import WebDriverException
+
+from config.config import config
+from utils.driver_factory import DriverFactory
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class DriverPool:
+	"""Pool of reusable WebDriver sessions owned by a single test process (xdist worker)"""
+
+	def __init__(self, browser: str = None, headless: bool = None, reuse: bool = None, max_uses: int = None,
+	             reaper=None):
+		self.browser = browser or config.BROWSER
+		self.headless = config.HEADLESS if headless is None else headless
+		self.reuse = config.DRIVER_REUSE if reuse is None else reuse
+		self.max_uses = config.DRIVER_MAX_REUSE if max_uses is None else max_uses
+		self.reaper = reaper
+		self._idle: List = []
+		# Every driver handed out and not yet discarded, idle or checked out
+		self._drivers: Dict[int, object] = {}
+		self._uses: Dict[int, int] = {}
+		self._lock = threading.Lock()
+
+	def acquire(self):
+		"""Return an idle driver, creating a new one if none is available"""
+		with self._lock:
+			driver = self._idle.pop() if self._idle else None
+
+		if driver is None:
+			driver = DriverFactory.get_driver(self.browser, self.headless)
+			with self._lock:
+				self._drivers[id(driver)] = driver
+				self._uses[id(driver)] = 0
+		return driver
+
+	def release(self, driver):
+		"""Reset driver state and return it to the pool, or retire it"""
+		with self._lock:
+			if id(driver) not in self._drivers:
+				return  # already quit by close()
+			uses = self._uses.get(id(driver), 0) + 1
+			self._uses[id(driver)] = uses
+
+		if not self.reuse or (self.max_uses and uses >= self.max_uses):
+			logger.info(f"Recycling WebDriver after {uses} test(s)")
+			self.discard(driver)
+			return
+
+		try:
+			self.reset(driver)
+		except Exception as e:
+			# A dead driver raises urllib3 errors, a test that closed every window an IndexError
+			logger.warning(f"WebDriver failed state reset, assuming crash: {type(e).__name__}: {str(e)}")
+			self.discard(driver)
+			return
+
+		with self._lock:
+			self._idle.append(driver)
+
+	def discard(self, driver):
+		"""Quit driver and forget about it"""
+		with self._lock:
+			self._drivers.pop(id(driver), None)
+			self._uses.pop(id(driver), None)
+		if self.reaper:
+			self.reaper.submit(driver)
+		else:
+			DriverFactory.quit_driver(driver)
+
+	@staticmethod
+	def reset(driver):
+		"""Clear cookies, web storage and extra windows, then park driver on about:blank"""
+		handles = driver.window_handles
+		for handle in handles[1:]:
+			driver.switch_to.window(handle)
+			driver.close()
+		driver.switch_to.window(handles[0])
+
+		# Storage is per-origin, so it has to be cleared before navigating away
+		try:
+			driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+		except WebDriverException:
+			pass  # about:blank and data: URLs have no storage
+
+		if hasattr(driver, "execute_cdp_cmd"):
+			driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+		else:
+			driver.delete_all_cookies()
+
+		driver.get("about:blank")
+
+	def close(self):
+		"""Quit every driver this pool handed out, including ones still checked out"""
+		with self._lock:
+			drivers = list(self._drivers.values())
+			self._idle = []
+		for driver in drivers:
+			self.discard(driver)
@@ -0,0 +1,88 @@
+import queue
+import threading
+import time
+
+from config.config import config
+from utils.driver_factory import DriverFactory
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_STOP = object()
+
+
+class DriverReaper:
+	"""Background reaper that quits finished WebDriver sessions off the test thread"""
+
+	def __init__(self, max_pending: int = None, quit_timeout: float = None):
+		self.max_pending = max_pending or config.DRIVER_REAPER_QUEUE_SIZE
+		self.quit_timeout = quit_timeout or config.DRIVER_QUIT_TIMEOUT
+		self._queue: "queue.Queue" = queue.Queue(maxsize=self.max_pending)
+		self._thread = None
+		self._lock = threading.Lock()
+
+	def submit(self, driver):
+		"""Hand a driver over for shutdown; quits inline when the queue is full"""
+		self._ensure_started()
+		try:
+			self._queue.put_nowait(driver)
+		except queue.Full:
+			logger.warning(f"Reaper queue full ({self.max_pending}), quitting WebDriver synchronously")
+			self._reap(driver)
+
+	def drain(self, timeout: float = None):
+		"""Wait for queued sessions to be quit, then stop the reaper thread"""
+		if self._thread is None:
+			return
+		timeout = timeout if timeout is not None else self.quit_timeout * (self.max_pending + 1)
+		deadline = time.monotonic() + timeout
+		try:
+			self._queue.put(_STOP, timeout=timeout)
+		except queue.Full:
+			pass  # reaper is wedged with a full queue, force-kill what is left below
+		self._thread.join(max(0.0, deadline - time.monotonic()))
+		if self._thread.is_alive():
+			logger.error("Reaper did not drain in time, force-killing remaining sessions")
+			while True:
+				try:
+					driver = self._queue.get_nowait()
+				except queue.Empty:
+					break
+				if driver is not _STOP:
+					self._kill(driver)
+		self._thread = None
+
+	def _ensure_started(self):
+		with self._lock:
+			if self._thread is None:
+				self._thread = threading.Thread(target=self._run, name="driver-reaper", daemon=True)
+				self._thread.start()
+
+	def _run(self):
+		while True:
+			driver = self._queue.get()
+			if driver is _STOP:
+				return
+			self._reap(driver)
+
+	def _reap(self, driver):
+		"""Quit driver, force-killing its service process if quit overruns the deadline"""
+		quitter = threading.Thread(target=DriverFactory.quit_driver, args=(driver,), daemon=True)
+		quitter.start()
+		quitter.join(self.quit_timeout)
+		if quitter.is_alive():
+			logger.warning(f"WebDriver quit exceeded {self.quit_timeout}s, force-killing")
+			self._kill(driver)
+
+	@staticmethod
+	def _kill(driver):
+		"""Kill the driver service process; the browser exits once its driver pipe closes"""
+		service = getattr(driver, "service", None)
+		process = getattr(service, "process", None)
+		if process is None:
+			return
+		try:
+			process.kill()
+			process.wait(5)
+		except Exception as e:
+			logger.error(f"Failed to kill WebDriver service process: {str(e)}")
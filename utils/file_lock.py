@@ -0,0 +1,72 @@
+import os
+import time
+
+try:
+	import fcntl
+except ImportError:  # Windows
+	fcntl = None
+	import msvcrt
+
+
+class FileLockTimeout(Exception):
+	"""Raised when another process holds the lock for longer than the timeout"""
+
+
+class FileLock:
+	"""Exclusive lock on `<path>.lock`, shared by every process (and thread) on this machine
+
+	shared=True takes a reader lock instead: any number of readers, but never alongside the
+	exclusive holder. Windows has no shared locks, so readers there are exclusive too.
+	"""
+
+	def __init__(self, path: str, timeout: float = None, poll_interval: float = 0.05, shared: bool = False):
+		self.path = f"{path}.lock"
+		self.timeout = timeout
+		self.shared = shared
+		self.poll_interval = poll_interval
+		self._file = None
+
+	def acquire(self):
+		directory = os.path.dirname(self.path)
+		if directory:
+			os.makedirs(directory, exist_ok=True)
+		self._file = open(self.path, 'a+')
+		deadline = None if self.timeout is None else time.monotonic() + self.timeout
+		while True:
+			try:
+				self._lock(blocking=deadline is None)
+				return self
+			except OSError:
+				# Non-blocking attempt failed (or msvcrt gave up after its own retries)
+				if deadline is not None and time.monotonic() >= deadline:
+					self._file.close()
+					self._file = None
+					raise FileLockTimeout(f"Could not lock {self.path} within {self.timeout}s")
+				time.sleep(self.poll_interval)
+
+	def release(self):
+		if self._file is None:
+			return
+		try:
+			if fcntl:
+				fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+			else:
+				self._file.seek(0)
+				msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+		finally:
+			self._file.close()
+			self._file = None
+
+	def _lock(self, blocking: bool):
+		if fcntl:
+			mode = fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+			fcntl.flock(self._file.fileno(), mode if blocking else mode | fcntl.LOCK_NB)
+		else:
+			self._file.seek(0)
+			msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+
+	def __enter__(self):
+		return self.acquire()
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		self.release()
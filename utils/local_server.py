@@ -0,0 +1,287 @@
+import json
+import os
+import random
+import secrets
+import sys
+import threading
+import time
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from config.config import config
+from utils.logger import setup_logger
+from utils.test_data_manager import TestDataManager
+
+logger = setup_logger(__name__)
+
+_SESSION_COOKIE = "stand_in_session"
+
+# Same placeholders, submit button, error element and links the LoginPage and HomePage locators target
+_LOGIN_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Login | Woven Business</title>
+<link rel="stylesheet" href="/static/app.css">
+<script src="/static/app.js" defer></script>
+</head>
+<body>
+<main class="login">
+<img src="/static/logo.svg" alt="Woven" width="120" height="32">
+<h1>Welcome back</h1>
+<form action="/login" method="post" novalidate>
+<input type="email" name="email" placeholder="Email Address" value="{email}" autocomplete="username">
+<input type="password" name="password" placeholder="Password" autocomplete="current-password">
+{error}
+<button type="submit">Log In</button>
+</form>
+<a href="/password-reset">Forgot Password?</a>
+</main>
+</body>
+</html>
+"""
+
+_APP_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title} | Woven Business</title>
+<link rel="stylesheet" href="/static/app.css">
+<script src="/static/app.js" defer></script>
+</head>
+<body>
+<header>
+<img src="/static/logo.svg" alt="Woven" width="120" height="32">
+<nav class="nav-menu"><a href="/dashboard">Dashboard</a> <a href="/search">Transactions</a></nav>
+<div id="user-menu">{user} <a href="/logout">Logout</a></div>
+</header>
+<form action="/search" method="get">
+<input type="search" name="search" value="{query}">
+<button type="submit">Search</button>
+</form>
+<main>{content}</main>
+</body>
+</html>
+"""
+
+_RESET_PAGE = """<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>Reset Password | Woven Business</title></head>
+<body><form action="/password-reset" method="post"><input type="email" name="email" placeholder="Email Address">
+<button type="submit">Send Reset Link</button></form><a href="/login">Back to login</a></body></html>
+"""
+
+# Settles after one fetch, so APP_IDLE_WAIT has in-flight work to see as it would on the real app
+_APP_JS = "fetch('/api/session', {credentials: 'same-origin'}).then(function (response) { return response.json(); });\n"
+_APP_CSS = "body { font-family: sans-serif; margin: 2rem; } .error-message { color: #c0392b; }\n"
+_LOGO_SVG = '<svg xmlns="http://www.w3.org/2000/svg" width="120" height="32"><text x="0" y="24">Woven</text>'
+
+
+class StandInApp:
+	"""Routes, accounts and timing of the stand-in server, shared by all its handler threads"""
+
+	def __init__(self, latency_ms: float = None, jitter_ms: float = None, asset_kb: int = None, seed: int = 0):
+		self.latency_ms = config.LOCAL_SERVER_LATENCY_MS if latency_ms is None else latency_ms
+		self.jitter_ms = config.LOCAL_SERVER_JITTER_MS if jitter_ms is None else jitter_ms
+		asset_kb = config.LOCAL_SERVER_ASSET_KB if asset_kb is None else asset_kb
+		self.accounts = self._load_accounts()
+		self.sessions: Dict[str, str] = {}
+		# Seeded, so a run sees the same sequence of delays every time
+		self._random = random.Random(seed)
+		self._lock = threading.Lock()
+		# asset_kb split across the page's three static files, padded with comments
+		self.assets = {
+			"/static/app.js": ("application/javascript", self._pad(_APP_JS, asset_kb * 512, "/*", "*/")),
+			"/static/app.css": ("text/css", self._pad(_APP_CSS, asset_kb * 256, "/*", "*/")),
+			"/static/logo.svg": ("image/svg+xml", self._pad(_LOGO_SVG, asset_kb * 256, "<!--", "-->") + b"</svg>"),
+		}
+
+	@staticmethod
+	def _load_accounts() -> Dict[Tuple[str, str], Dict]:
+		data = TestDataManager.load_json(os.path.join(config.TEST_DATA_DIR, "login_data.json"))
+		accounts = {(user['username'], user['password']): {'status': 'ok'} for user in data.get('valid_users', [])}
+		for user in data.get('invalid_users', []):
+			if user.get('expected_error') == "Account locked":
+				accounts[(user['username'], user['password'])] = {'status': 'locked'}
+		return accounts
+
+	@staticmethod
+	def _pad(content: str, size: int, open_comment: str, close_comment: str) -> bytes:
+		body = content.encode()
+		padding = size - len(body) - len(open_comment) - len(close_comment)
+		if padding <= 0:
+			return body
+		return body + open_comment.encode() + b"x" * padding + close_comment.encode()
+
+	def delay(self) -> float:
+		"""Seconds to hold the next response: latency plus uniform jitter"""
+		with self._lock:
+			jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+		return max(0.0, self.latency_ms + jitter) / 1000
+
+	def authenticate(self, email: str, password: str) -> Tuple[Optional[str], Optional[str]]:
+		"""(session id, None) for a valid account, else (None, the message the real app shows)"""
+		if not email and not password:
+			return None, "Username and password are required"
+		if not password:
+			return None, "Password is required"
+		if not email:
+			return None, "Username is required"
+		account = self.accounts.get((email, password))
+		if account is None:
+			return None, "Invalid credentials"
+		if account['status'] == "locked":
+			return None, "Account locked"
+		session = secrets.token_hex(16)
+		with self._lock:
+			self.sessions[session] = email
+		return session, None
+
+	def user_for(self, cookie_header: str) -> Optional[str]:
+		for part in (cookie_header or "").split(";"):
+			name, _, value = part.strip().partition("=")
+			if name == _SESSION_COOKIE:
+				with self._lock:
+					return self.sessions.get(value)
+		return None
+
+	def logout(self, cookie_header: str):
+		for part in (cookie_header or "").split(";"):
+			name, _, value = part.strip().partition("=")
+			if name == _SESSION_COOKIE:
+				with self._lock:
+					self.sessions.pop(value, None)
+
+
+class _Handler(BaseHTTPRequestHandler):
+	protocol_version = "HTTP/1.1"
+	server_version = "StandIn/1.0"
+	# Headers and body go out in separate writes; with Nagle on, keep-alive clients stall on delayed ACKs
+	disable_nagle_algorithm = True
+
+	def log_message(self, format, *args):
+		logger.debug(f"{self.address_string()} {format % args}")
+
+	@property
+	def app(self) -> StandInApp:
+		return self.server.app
+
+	def do_GET(self):
+		time.sleep(self.app.delay())
+		url = urlsplit(self.path)
+		user = self.app.user_for(self.headers.get("Cookie"))
+		if url.path in self.app.assets:
+			content_type, body = self.app.assets[url.path]
+			return self._send(200, body, content_type, {"Cache-Control": "public, max-age=3600"})
+		if url.path == "/":
+			return self._redirect("/dashboard" if user else "/login")
+		if url.path == "/login":
+			return self._html(200, self._login_page())
+		if url.path == "/password-reset":
+			return self._html(200, _RESET_PAGE)
+		if url.path == "/api/session":
+			return self._send(200, json.dumps({'user': user}).encode(), "application/json")
+		if url.path == "/logout":
+			self.app.logout(self.headers.get("Cookie"))
+			return self._redirect("/login", {"Set-Cookie": f"{_SESSION_COOKIE}=; Path=/; Max-Age=0"})
+		if url.path in ("/dashboard", "/search"):
+			if not user:
+				return self._redirect("/login")
+			query = parse_qs(url.query).get("search", [""])[0]
+			content = f"<h1>Results for “{escape(query)}”</h1><ul class=\"results\"></ul>" if url.path == "/search" else "<h1>Dashboard</h1>"
+			title = "Search" if url.path == "/search" else "Dashboard"
+			return self._html(200, _APP_PAGE.format(title=title, user=escape(user), query=escape(query), content=content))
+		self._html(404, "<!DOCTYPE html><title>Not Found</title><h1>Not Found</h1>")
+
+	def do_POST(self):
+		time.sleep(self.app.delay())
+		length = int(self.headers.get("Content-Length", 0))
+		form = parse_qs(self.rfile.read(length).decode(), keep_blank_values=True)
+		path = urlsplit(self.path).path
+		if path == "/login":
+			email = form.get("email", [""])[0].strip()
+			session, error = self.app.authenticate(email, form.get("password", [""])[0])
+			if session:
+				return self._redirect("/dashboard", {"Set-Cookie": f"{_SESSION_COOKIE}={session}; Path=/; HttpOnly"})
+			return self._html(200, self._login_page(email, error))
+		if path == "/password-reset":
+			return self._redirect("/login")
+		self._html(404, "<!DOCTYPE html><title>Not Found</title><h1>Not Found</h1>")
+
+	@staticmethod
+	def _login_page(email: str = "", error: str = None) -> str:
+		error_html = f'<p class="error-message" role="alert">{escape(error)}</p>' if error else ""
+		return _LOGIN_PAGE.format(email=escape(email, quote=True), error=error_html)
+
+	def _redirect(self, location: str, headers: Dict[str, str] = None):
+		self._send(302, b"", "text/html", dict(headers or {}, Location=location))
+
+	def _html(self, status: int, html: str):
+		self._send(status, html.encode(), "text/html; charset=utf-8", {"Cache-Control": "no-store"})
+
+	def _send(self, status: int, body: bytes, content_type: str, headers: Dict[str, str] = None):
+		self.send_response(status)
+		self.send_header("Content-Type", content_type)
+		self.send_header("Content-Length", str(len(body)))
+		for name, value in (headers or {}).items():
+			self.send_header(name, value)
+		self.end_headers()
+		self.wfile.write(body)
+
+
+class LocalServer:
+	"""Hermetic stand-in for the application under test, served from a background thread
+
+	Serves faithful copies of the login, dashboard and search pages with the accounts
+	from login_data.json, so the suite runs offline and reproducibly. Every response is
+	held for LOCAL_SERVER_LATENCY_MS +/- LOCAL_SERVER_JITTER_MS, and the page assets add
+	up to LOCAL_SERVER_ASSET_KB.
+	"""
+
+	def __init__(self, host: str = "127.0.0.1", port: int = None, app: StandInApp = None):
+		self.host = host
+		self.port = config.LOCAL_SERVER_PORT if port is None else port
+		self.app = app or StandInApp()
+		self._server: Optional[ThreadingHTTPServer] = None
+		self._thread: Optional[threading.Thread] = None
+
+	@property
+	def url(self) -> str:
+		return f"http://{self.host}:{self._server.server_port}"
+
+	def start(self) -> "LocalServer":
+		try:
+			self._server = ThreadingHTTPServer((self.host, self.port), _Handler)
+		except OSError as e:
+			if not self.port:
+				raise
+			# Another run holds the port; any free one works, only the URL changes
+			logger.warning(f"Port {self.port} unavailable ({str(e)}), using a free port")
+			self._server = ThreadingHTTPServer((self.host, 0), _Handler)
+		self._server.daemon_threads = True
+		self._server.app = self.app
+		self._thread = threading.Thread(target=self._server.serve_forever, name="local-server", daemon=True)
+		self._thread.start()
+		logger.info(
+			f"Local stand-in server on {self.url} (latency {self.app.latency_ms}ms +/- {self.app.jitter_ms}ms)"
+		)
+		return self
+
+	def stop(self):
+		if self._server:
+			self._server.shutdown()
+			self._server.server_close()
+			self._server = None
+
+
+if __name__ == '__main__':
+	# Serve the stand-in on its own, e.g. to explore it in a browser:
+	#   LOCAL_SERVER_LATENCY_MS=200 python -m utils.local_server
+	server = LocalServer().start()
+	print(f"Serving {server.url}/login, Ctrl+C to stop")
+	try:
+		threading.Event().wait()
+	except KeyboardInterrupt:
+		server.stop()
+		sys.exit(0)
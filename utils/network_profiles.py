@@ -0,0 +1,128 @@
+import json
+import threading
+from typing import Dict
+
+from selenium.common.exceptions import WebDriverException
+
+from config.config import config
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_MEDIA_EXTENSIONS = (
+	"png", "jpg", "jpeg", "gif", "webp", "avif", "ico", "bmp",
+	"mp4", "webm", "mp3", "ogg", "woff", "woff2", "ttf", "otf",
+)
+# Patterns match the whole URL, so cache-busted assets (logo.png?v=3) need their own
+_MEDIA = [pattern for extension in _MEDIA_EXTENSIONS for pattern in (f"*.{extension}", f"*.{extension}?*")]
+_THIRD_PARTY = [
+	"*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*facebook.net*",
+	"*connect.facebook.com*", "*hotjar.com*", "*segment.io*", "*segment.com*", "*mixpanel.com*",
+	"*intercom.io*", "*fullstory.com*", "*clarity.ms*", "*fonts.googleapis.com*", "*fonts.gstatic.com*",
+]
+
+# Network.setBlockedURLs patterns (* wildcards) and optional Network.emulateNetworkConditions
+PROFILES: Dict[str, Dict] = {
+	"full": {"blocked": []},
+	"no-media": {"blocked": _MEDIA},
+	"minimal": {"blocked": _MEDIA + _THIRD_PARTY},
+	"slow-3g": {
+		"blocked": [],
+		"throttle": {"latency": 400, "downloadThroughput": 50 * 1024, "uploadThroughput": 50 * 1024},
+	},
+}
+
+_NO_THROTTLE = {"offline": False, "latency": 0, "downloadThroughput": -1, "uploadThroughput": -1}
+
+# Typical transfer sizes used until this process has seen real ones of the same type
+_DEFAULT_SIZES = {"Image": 40_000, "Media": 500_000, "Font": 50_000, "Script": 60_000, "Stylesheet": 20_000}
+_FALLBACK_SIZE = 10_000
+
+
+class _SizeEstimator:
+	"""Average transfer size per resource type, learned from requests that were not blocked"""
+
+	def __init__(self):
+		self._totals: Dict[str, list] = {}
+		self._lock = threading.Lock()
+
+	def observe(self, resource_type: str, size: float):
+		with self._lock:
+			totals = self._totals.setdefault(resource_type, [0.0, 0])
+			totals[0] += size
+			totals[1] += 1
+
+	def estimate(self, resource_type: str) -> float:
+		with self._lock:
+			totals = self._totals.get(resource_type)
+		if totals and totals[1]:
+			return totals[0] / totals[1]
+		return _DEFAULT_SIZES.get(resource_type, _FALLBACK_SIZE)
+
+
+_sizes = _SizeEstimator()
+
+
+def supports_profiles(driver) -> bool:
+	return hasattr(driver, "execute_cdp_cmd")
+
+
+def apply_network_profile(driver, name: str = None):
+	"""Switch driver to a blocking/throttling profile; a no-op when it already uses it"""
+	name = name or config.NETWORK_PROFILE
+	if name not in PROFILES:
+		raise ValueError(f"Unknown network profile: {name} (choose from {', '.join(PROFILES)})")
+	if getattr(driver, "network_profile", "full") == name:
+		return
+	if not supports_profiles(driver):
+		logger.debug(f"Network profile '{name}' needs a Chromium-based browser, ignoring it")
+		return
+
+	profile = PROFILES[name]
+	driver.execute_cdp_cmd("Network.enable", {})
+	driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": profile["blocked"]})
+	driver.execute_cdp_cmd("Network.emulateNetworkConditions", dict(_NO_THROTTLE, **profile.get("throttle", {})))
+	driver.network_profile = name
+	logger.info(f"Applied network profile '{name}'")
+
+
+def drain_network_log(driver) -> Dict[str, float]:
+	"""Read the performance log collected since the last call: requests blocked by the profile and cache hits"""
+	stats = {'blocked': 0, 'blocked_bytes': 0.0, 'responses': 0, 'cached': 0}
+	if not getattr(driver, "network_log", False):
+		return stats
+	try:
+		entries = driver.get_log("performance")
+	except WebDriverException as e:
+		logger.debug(f"Performance log unavailable: {str(e)}")
+		return stats
+
+	types: Dict[str, str] = {}
+	cached = set()
+	for entry in entries:
+		message = json.loads(entry["message"])["message"]
+		method, params = message.get("method"), message.get("params", {})
+		if method == "Network.requestWillBeSent":
+			types[params["requestId"]] = params.get("type", "Other")
+		elif method == "Network.responseReceived":
+			response = params.get("response", {})
+			stats['responses'] += 1
+			if response.get("fromDiskCache") or response.get("fromServiceWorker") or response.get("fromPrefetchCache"):
+				cached.add(params["requestId"])
+		elif method == "Network.requestServedFromCache":
+			cached.add(params["requestId"])  # memory cache
+		elif method == "Network.loadingFinished":
+			resource_type = types.get(params["requestId"])
+			if resource_type:
+				_sizes.observe(resource_type, params.get("encodedDataLength", 0))
+		elif method == "Network.loadingFailed" and params.get("blockedReason") == "inspector":
+			stats['blocked'] += 1
+			stats['blocked_bytes'] += _sizes.estimate(params.get("type") or types.get(params["requestId"], "Other"))
+	stats['cached'] = len(cached)
+	return stats
+
+
+def enable_network_log(options, capability: str = "goog:loggingPrefs"):
+	"""Ask a Chromium driver for network events so blocked requests and cache hits can be counted"""
+	options.set_capability(capability, {"performance": "ALL"})
+	options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
@@ -0,0 +1,102 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Optional
+
+from config.config import config
+from utils.file_lock import FileLock
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_UNSAFE_TO_CLONE = ("SingletonLock", "SingletonSocket", "SingletonCookie", "lockfile")
+_READY_FILE = "template.json"
+# Bumped when the on-disk layout changes; templates from version 1 hold read-only cache entries
+_FORMAT = 2
+
+
+class ProfileTemplate:
+	"""One warmed Chromium user-data-dir per browser, cloned cheaply for every session
+
+	The template is built once per machine (under a file lock, so parallel workers wait
+	for the first one) by visiting the configured URLs, and rebuilt when older than
+	PROFILE_TEMPLATE_MAX_AGE hours. Sessions get a private clone: a copy-on-write reflink
+	where the filesystem supports it, otherwise a plain copy, so no session can change what
+	the next one starts from. Clones hold a shared lock, so a rebuild never pulls the
+	template out from under a copy in progress.
+	"""
+
+	def __init__(self, browser: str, root: str = None, urls: list = None, max_age_hours: float = None):
+		self.browser = browser.lower()
+		self.directory = os.path.abspath(os.path.join(root or config.PROFILE_TEMPLATE_DIR, self.browser))
+		self.profile_dir = os.path.join(self.directory, "profile")
+		self.urls = urls or [url.strip() for url in config.PROFILE_TEMPLATE_URLS.split(",") if url.strip()]
+		self.max_age = (config.PROFILE_TEMPLATE_MAX_AGE_HOURS if max_age_hours is None else max_age_hours) * 3600
+		self._ready = False
+		self._clone_method: Optional[str] = None
+
+	def _is_fresh(self) -> bool:
+		try:
+			with open(os.path.join(self.directory, _READY_FILE), encoding='utf-8') as file:
+				info = json.load(file)
+		except (OSError, ValueError):
+			return False
+		return (
+			info.get('format') == _FORMAT and info.get('urls') == self.urls
+			and time.time() - info.get('built_at', 0) < self.max_age
+		)
+
+	def ensure(self, warm: Callable[[str, list], None]):
+		"""Build the template with warm(profile_dir, urls) unless a fresh one exists"""
+		if self._ready:
+			return
+		with self._lock():
+			if not self._is_fresh():
+				started = time.perf_counter()
+				shutil.rmtree(self.directory, ignore_errors=True)
+				os.makedirs(self.profile_dir)
+				warm(self.profile_dir, self.urls)
+				with open(os.path.join(self.directory, _READY_FILE), 'w', encoding='utf-8') as file:
+					json.dump({'format': _FORMAT, 'urls': self.urls, 'built_at': time.time()}, file)
+				logger.info(f"Built {self.browser} profile template in {time.perf_counter() - started:.1f}s")
+		self._ready = True
+
+	def clone(self) -> str:
+		"""Private copy of the template for one session"""
+		destination = os.path.join(tempfile.mkdtemp(prefix=f"{self.browser}-profile-"), "profile")
+		started = time.perf_counter()
+		with self._lock(shared=True):
+			if self._clone_method in (None, "reflink") and self._reflink(destination):
+				self._clone_method = "reflink"
+			else:
+				self._clone_method = "copy"
+				shutil.rmtree(destination, ignore_errors=True)
+				shutil.copytree(self.profile_dir, destination, ignore=shutil.ignore_patterns(*_UNSAFE_TO_CLONE))
+		for name in _UNSAFE_TO_CLONE:
+			path = os.path.join(destination, name)
+			if os.path.lexists(path):
+				os.remove(path)
+		logger.debug(f"Cloned profile template by {self._clone_method} in {time.perf_counter() - started:.2f}s")
+		return destination
+
+	@staticmethod
+	def remove_clone(profile_dir: str):
+		shutil.rmtree(os.path.dirname(profile_dir), ignore_errors=True)
+
+	def _reflink(self, destination: str) -> bool:
+		"""Copy-on-write clone (APFS clonefile, or reflink on btrfs/XFS); False where unsupported"""
+		if sys.platform == "darwin":
+			command = ["cp", "-c", "-R", self.profile_dir, destination]
+		elif sys.platform.startswith("linux"):
+			command = ["cp", "-R", "--reflink=always", self.profile_dir, destination]
+		else:
+			return False
+		return subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0
+
+	def _lock(self, shared: bool = False) -> FileLock:
+		"""Exclusive for (re)building the template, shared for cloning it"""
+		return FileLock(self.directory, timeout=config.PAGE_LOAD_TIMEOUT * (len(self.urls) + 2), shared=shared)
@@ -0,0 +1,140 @@
+import hashlib
+import io
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from config.config import config
+from utils.logger import setup_logger
+
+try:
+	from PIL import Image
+except ImportError:  # Pillow is optional: without it screenshots are stored as captured
+	Image = None
+
+logger = setup_logger(__name__)
+
+
+class ScreenshotService:
+	"""Capture screenshots on the test thread, encode and write them on a background worker"""
+
+	def __init__(self, directory: str = None, image_format: str = None, max_width: int = None,
+	             dedupe_distance: int = None):
+		self._directory = directory
+		self.image_format = (image_format or config.SCREENSHOT_FORMAT).lower()
+		self.max_width = config.SCREENSHOT_MAX_WIDTH if max_width is None else max_width
+		self.dedupe_distance = config.SCREENSHOT_DEDUPE_DISTANCE if dedupe_distance is None else dedupe_distance
+		if Image is None and (self.image_format != "png" or self.max_width):
+			logger.warning("Pillow not installed, storing screenshots as full-size PNG")
+			self.image_format, self.max_width = "png", 0
+
+		self._paths_by_digest: Dict[str, str] = {}
+		self._fingerprints: List[Tuple[int, List[int], str]] = []
+		self._pending = []
+		self._lock = threading.Lock()
+		self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshot-writer")
+		self.duplicates = 0
+
+	@property
+	def directory(self) -> str:
+		"""Explicit directory, else SCREENSHOTS_DIR as configured at capture time (not at import)"""
+		return self._directory or config.SCREENSHOTS_DIR
+
+	def capture(self, driver, name: str = "screenshot") -> str:
+		"""Grab PNG bytes from driver and return the path the image will be written to"""
+		png = driver.get_screenshot_as_png()
+		digest = hashlib.sha1(png).hexdigest()
+
+		with self._lock:
+			existing = self._paths_by_digest.get(digest)
+			if existing:
+				self.duplicates += 1
+				logger.info(f"Screenshot identical to {existing}, reusing it")
+				return existing
+
+			timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+			path = os.path.join(self.directory, f"{name}_{timestamp}_{digest[:8]}.{self.image_format}")
+			self._paths_by_digest[digest] = path
+			self._pending.append(self._executor.submit(self._write, png, path))
+		return path
+
+	def flush(self, timeout: float = None):
+		"""Block until every queued screenshot is on disk"""
+		with self._lock:
+			pending, self._pending = self._pending, []
+		wait(pending, timeout=timeout)
+
+	def _write(self, png: bytes, path: str):
+		try:
+			os.makedirs(os.path.dirname(path), exist_ok=True)
+			if Image is None:
+				with open(path, "wb") as file:
+					file.write(png)
+				logger.info(f"Screenshot saved: {path}")
+				return
+
+			image = Image.open(io.BytesIO(png))
+			similar = self._find_similar(image, path)
+			if similar:
+				self._link(similar, path)
+				return
+
+			resized = bool(self.max_width) and image.width > self.max_width
+			if resized:
+				height = round(image.height * self.max_width / image.width)
+				image = image.resize((self.max_width, height), Image.LANCZOS)
+			if self.image_format == "webp":
+				image.save(path, "WEBP", quality=80, method=4)
+			elif resized:
+				image.save(path, "PNG", optimize=True)
+			else:
+				with open(path, "wb") as file:
+					file.write(png)
+			logger.info(f"Screenshot saved: {path}")
+		except Exception as e:
+			logger.error(f"Failed to write screenshot {path}: {str(e)}")
+
+	def _find_similar(self, image, path: str) -> Optional[str]:
+		"""Return an earlier screenshot with near-identical structure and brightness"""
+		if not self.dedupe_distance:
+			return None
+		fingerprint, thumbnail = self._difference_hash(image), self._thumbnail(image)
+		for other, other_thumbnail, other_path in self._fingerprints:
+			if bin(fingerprint ^ other).count("1") > self.dedupe_distance:
+				continue
+			# dHash only sees gradients, so also compare coarse brightness
+			if max(abs(a - b) for a, b in zip(thumbnail, other_thumbnail)) <= 16:
+				return other_path
+		self._fingerprints.append((fingerprint, thumbnail, path))
+		return None
+
+	def _link(self, source: str, path: str):
+		"""Point path at an earlier near-identical image without storing it twice"""
+		self.duplicates += 1
+		try:
+			os.link(source, path)
+		except OSError:
+			shutil.copyfile(source, path)
+		logger.info(f"Screenshot {path} nearly identical to {source}, linked")
+
+	@staticmethod
+	def _difference_hash(image, size: int = 16) -> int:
+		"""size*size-bit perceptual hash: brightness gradients of a tiny grayscale thumbnail"""
+		pixels = list(image.convert("L").resize((size + 1, size), Image.BILINEAR).getdata())
+		bits = 0
+		for row in range(size):
+			for column in range(size):
+				left = pixels[row * (size + 1) + column]
+				right = pixels[row * (size + 1) + column + 1]
+				bits = (bits << 1) | (left > right)
+		return bits
+
+	@staticmethod
+	def _thumbnail(image, size: int = 8) -> List[int]:
+		return list(image.convert("L").resize((size, size), Image.BILINEAR).getdata())
+
+
+screenshot_service = ScreenshotService()
@@ -0,0 +1,168 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from config.config import config
+from pages.pages import HomePage, LoginPage
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_READ_STORAGE_JS = """
+function dump(storage) {
+	var data = {};
+	for (var i = 0; i < storage.length; i++) {
+		var key = storage.key(i);
+		data[key] = storage.getItem(key);
+	}
+	return data;
+}
+return [dump(window.localStorage), dump(window.sessionStorage)];
+"""
+
+# Any same-origin page works for writing cookies and storage; favicon.ico would be blocked as media
+# under the no-media and minimal network profiles, leaving Chrome on its error page
+LANDING_PATH = "/robots.txt"
+
+_WRITE_STORAGE_JS = """
+var local = arguments[0], session = arguments[1];
+Object.keys(local).forEach(function (key) { window.localStorage.setItem(key, local[key]); });
+Object.keys(session).forEach(function (key) { window.sessionStorage.setItem(key, session[key]); });
+"""
+
+
+@dataclass
+class SessionSnapshot:
+	"""Cookies and web storage captured right after a successful login"""
+	url: str
+	cookies: List[Dict]
+	local_storage: Dict[str, str]
+	session_storage: Dict[str, str]
+	expires_at: float
+	created_at: float = field(default_factory=time.time)
+
+	@property
+	def origin(self) -> str:
+		parts = urlsplit(self.url)
+		return f"{parts.scheme}://{parts.netloc}"
+
+	def is_expired(self) -> bool:
+		return time.time() >= self.expires_at
+
+
+class SessionCache:
+	"""Log in through the UI once per worker and replay the session into other drivers"""
+
+	def __init__(self, username: str, password: str, ttl: int = None,
+	             validator: Callable = None):
+		self.username = username
+		self.password = password
+		self.ttl = ttl or config.SESSION_CACHE_TTL
+		self.validator = validator or self._default_validator
+		self._snapshot: Optional[SessionSnapshot] = None
+		self._failure: Optional[str] = None
+		self._lock = threading.Lock()
+		self.logins = 0
+		self.injections = 0
+
+	def apply(self, driver):
+		"""Leave driver logged in, replaying the cached session when possible"""
+		with self._lock:
+			if self._failure:
+				raise RuntimeError(f"Session cache disabled after failed login: {self._failure}")
+
+			snapshot = self._snapshot
+			if snapshot is None or snapshot.is_expired():
+				self._login(driver)
+				return
+
+			self._inject(driver, snapshot)
+			if self.validator(driver):
+				self.injections += 1
+				return
+
+			# Stale server-side session: one fresh login replaces the snapshot for everyone
+			logger.warning("Cached session was rejected, logging in again")
+			self._snapshot = None
+			self._login(driver)
+
+	def invalidate(self):
+		"""Drop the cached snapshot so the next apply performs a real login"""
+		with self._lock:
+			self._snapshot = None
+
+	def _login(self, driver):
+		"""Real UI login
+
+		Rejected credentials disable the cache instead of failing again in every test; anything
+		else (a slow page, an open circuit) propagates and the next test retries the login.
+		"""
+		login_page = LoginPage(driver)
+		self.logins += 1
+		login_page.open_login_page()
+		login_page.login(self.username, self.password)
+		try:
+			WebDriverWait(driver, config.EXPLICIT_WAIT).until(lambda d: login_page.is_login_successful())
+		except TimeoutException:
+			error = login_page.get_error_message()
+			if not error:
+				raise RuntimeError(f"Session cache login got no dashboard redirect for '{self.username}'")
+			self._failure = f"'{self.username}' was rejected: {error}"
+			raise RuntimeError(f"Session cache login failed: {self._failure}")
+
+		self._snapshot = self._capture(driver)
+		logger.info(f"Cached authenticated session for '{self.username}'")
+
+	def _capture(self, driver) -> SessionSnapshot:
+		cookies = driver.get_cookies()
+		if getattr(driver, "http_only", False):
+			local_storage, session_storage = {}, {}  # no script engine, so no web storage either
+		else:
+			local_storage, session_storage = driver.execute_script(_READ_STORAGE_JS)
+		expiries = [cookie['expiry'] for cookie in cookies if cookie.get('expiry')]
+		expires_at = min([time.time() + self.ttl] + expiries)
+		return SessionSnapshot(driver.current_url, cookies, local_storage, session_storage, expires_at)
+
+	@staticmethod
+	def _inject(driver, snapshot: SessionSnapshot):
+		"""Restore cookies and storage, then open the page the login ended on"""
+		# Cookies and storage can only be written while on the application's origin
+		driver.get(f"{snapshot.origin}{LANDING_PATH}")
+		if hasattr(driver, "execute_cdp_cmd"):
+			driver.execute_cdp_cmd("Network.setCookies", {
+				'cookies': [SessionCache._to_cdp_cookie(cookie, snapshot.url) for cookie in snapshot.cookies]
+			})
+		else:
+			for cookie in snapshot.cookies:
+				driver.add_cookie(cookie)
+		if snapshot.local_storage or snapshot.session_storage:
+			driver.execute_script(_WRITE_STORAGE_JS, snapshot.local_storage, snapshot.session_storage)
+		driver.get(snapshot.url)
+
+	@staticmethod
+	def _to_cdp_cookie(cookie: Dict, url: str) -> Dict:
+		cdp_cookie = {
+			'name': cookie['name'],
+			'value': cookie['value'],
+			'path': cookie.get('path', '/'),
+			'secure': cookie.get('secure', False),
+			'httpOnly': cookie.get('httpOnly', False),
+		}
+		if cookie.get('domain'):
+			cdp_cookie['domain'] = cookie['domain']
+		else:
+			cdp_cookie['url'] = url
+		if cookie.get('expiry'):
+			cdp_cookie['expires'] = cookie['expiry']
+		if cookie.get('sameSite'):
+			cdp_cookie['sameSite'] = cookie['sameSite']
+		return cdp_cookie
+
+	@staticmethod
+	def _default_validator(driver) -> bool:
+		return HomePage(driver).is_user_logged_in()
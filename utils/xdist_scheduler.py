@@ -0,0 +1,119 @@
+import time
+from typing import Dict, Optional
+
+from xdist.scheduler import LoadScheduling
+
+from reports.duration_model import DurationModel, list_makespan
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class DurationScheduling(LoadScheduling):
+	"""Hand out tests longest-first, each to whichever worker frees up next
+
+	Every worker holds `prefetch` tests: the one it is running and the next one, which
+	xdist needs to know before it can tear the current test down. With keep_order the
+	collection order (e.g. --fast-feedback) is dispatched as is instead of longest-first.
+	"""
+
+	def __init__(self, config, log=None, model: DurationModel = None, prefetch: int = 2, keep_order: bool = False):
+		super().__init__(config, log)
+		self.model = model
+		self.keep_order = keep_order
+		self.prefetch = max(prefetch, 2)
+		self.estimates: Dict[int, float] = {}
+		self.predicted_makespan: Optional[float] = None
+		self.collection_order_makespan: Optional[float] = None
+		self._started_at: Optional[float] = None
+		self._finished_at: Optional[float] = None
+
+	def _priority(self, index: int):
+		if self.keep_order:
+			return index
+		# Stable on ties, so unknown tests keep pytest's fixture-friendly collection order
+		return -self.estimates[index], index
+
+	def schedule(self):
+		assert self.collection_is_completed
+
+		if self.collection is not None:
+			for node in self.nodes:
+				self.check_schedule(node)
+			return
+
+		if not self._check_nodes_have_same_collection():
+			self.log("**Different tests collected, aborting run**")
+			return
+
+		self.collection = list(self.node2collection.values())[0]
+		if not self.collection:
+			return
+		model = self.model or DurationModel()
+		self.estimates = {index: model.predict(nodeid) for index, nodeid in enumerate(self.collection)}
+		self.pending[:] = sorted(self.estimates, key=self._priority)
+
+		workers = len(self.nodes)
+		self.predicted_makespan = list_makespan((self.estimates[index] for index in self.pending), workers)
+		self.collection_order_makespan = list_makespan(self.estimates.values(), workers)
+		unknown = sum(1 for nodeid in self.collection if not model.is_known(nodeid))
+		logger.info(
+			f"Duration scheduling {len(self.collection)} tests ({unknown} without history) on {workers} workers, "
+			f"predicted makespan {self.predicted_makespan:.1f}s vs {self.collection_order_makespan:.1f}s in collection order"
+		)
+
+		self._started_at = time.monotonic()
+		self._send_initial_tests()
+		if not self.pending:
+			for node in self.nodes:
+				node.shutdown()
+
+	def _send_initial_tests(self):
+		"""Deal the queue out one test per node per pass, so the longest tests start on different nodes"""
+		assigned = {node: [] for node in self.nodes}
+		for _ in range(self.prefetch):
+			for node in self.nodes:
+				if self.pending:
+					assigned[node].append(self.pending.pop(0))
+		for node, indices in assigned.items():
+			if indices:
+				self.node2pending[node].extend(indices)
+				node.send_runtest_some(indices)
+
+	def check_schedule(self, node, duration=0):
+		if node.shutting_down:
+			return
+		if self.pending:
+			missing = self.prefetch - len(self.node2pending[node])
+			if missing > 0:
+				self._send_tests(node, missing)
+		else:
+			node.shutdown()
+
+	def mark_test_complete(self, node, item_index, duration=0):
+		self._finished_at = time.monotonic()
+		super().mark_test_complete(node, item_index, duration)
+
+	def remove_node(self, node):
+		"""As LoadScheduling.remove_node, but the requeued tests are sorted in before anything is re-dispatched"""
+		pending = self.node2pending.pop(node)
+		if not pending:
+			return None
+		crashitem = self.collection[pending.pop(0)]
+		self.pending.extend(pending)
+		self.pending.sort(key=self._priority)
+		for other in self.node2pending:
+			self.check_schedule(other)
+		return crashitem
+
+	def makespan_summary(self) -> Optional[Dict[str, float]]:
+		"""Predicted against measured wall time from first dispatch to last completed test"""
+		if self.predicted_makespan is None or self._finished_at is None:
+			return None
+		return {
+			'tests': len(self.collection),
+			'workers': len(self.node2collection),
+			'predicted': self.predicted_makespan,
+			'collection_order': self.collection_order_makespan,
+			'actual': self._finished_at - self._started_at,
+		}